@@ -31,7 +31,7 @@ setup(
     license='Apache License 2.0',
     packages=find_packages(),
     install_requires=[
-        'spaceone-core',
+        'spaceone-core==1.10.0',
         'spaceone-api',
         'mongoengine',
         'langcodes',
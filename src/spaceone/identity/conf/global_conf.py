@@ -24,7 +24,56 @@ IDENTITY = {
         'token_timeout': 1800,
         'refresh_timeout': 3600,
         'refresh_ttl': 12,
-        'refresh_once': True
+        'refresh_once': True,
+        'refresh_store': 'mongo',       # mongo | cache (redis only)
+        'refresh_reuse_grace': 10,
+        'verified_cache_size': 10000
+    },
+    'managed_policy': {
+        'ttl': 300,
+        'refresh_interval': 60,
+        'timeout': 5,
+        'allowed_schemes': ['https'],
+        'allowed_hosts': [],        # e.g. ['policy.example.com', 'policy.example.com:8443']
+        'policy_dirs': [],          # e.g. ['/etc/spaceone/policies'], local files are only read from these
+        'negative_ttl': 30,
+        'load_wait': 1,
+        'max_policies': 1000,
+        'fetchers': {}
+    },
+    'login_throttle': {
+        'window': 300,
+        'bucket': 60,
+        'max_user_failures': 10,        # per user and source
+        'max_global_user_failures': 0,  # per user across all sources, 0 = disabled
+        'max_source_failures': 100,
+        'local_max_counters': 10000,    # counters kept in the process when there is no redis cache
+        'trusted_proxies': []       # e.g. ['10.0.0.0/8'], X-Forwarded-For is only read from these peers
+    },
+    'password_hash': {
+        'algorithm': 'bcrypt',      # bcrypt | scrypt
+        'bcrypt_rounds': 12,
+        'scrypt_n': 16384,
+        'scrypt_r': 8,
+        'scrypt_p': 1
+    },
+    'password_worker': {
+        'workers': 2,
+        'max_queue': 32,
+        'queue_timeout': 1,
+        'timeout': 10
+    },
+    'project_tree': {
+        'ttl': 300,
+        'local_ttl': 30,            # used instead of ttl when no redis cache shares tree versions
+        'max_depth': 20
+    },
+    'secret_fan_out': {
+        'workers': 8,
+        'timeout': 10
+    },
+    'service_account_import': {
+        'chunk_size': 500
     }
 }
 
@@ -52,12 +101,19 @@ CONNECTORS = {
     'PluginServiceConnector': {
         'endpoint': {
             'v1': 'grpc://plugin:50051'
+        },
+        # 'system_token': '',       # refreshes stale endpoints in the background, otherwise in the request
+        'endpoint_cache': {
+            'ttl': 300,
+            'stale_ttl': 3600,
+            'negative_ttl': 30
         }
     },
     'SecretConnector': {
         'endpoint': {
             'v1': 'grpc://secret:50051'
-        }
+        },
+        'page_size': 100
     },
 }
 
@@ -15,14 +15,18 @@ class AuthPluginConnector(BaseConnector):
     def __init__(self, transaction, config):
         super().__init__(transaction, config)
         self.client = None
+        self.endpoint = None
 
     def initialize(self, endpoint):
         _LOGGER.info(f'[initialize] endpoint: {endpoint}')
 
+        self.endpoint = endpoint
         endpoint = endpoint.replace('"', '')
         e = parse_endpoint(endpoint)
         protocol = e['scheme']
         if protocol == 'grpc':
+            # pygrpc keeps one client per endpoint in the process, so the
+            # channel and the reflected stubs are shared by all requests.
             self.client = pygrpc.client(endpoint="%s:%s" % (e['hostname'], e['port']), version='plugin')
         elif protocol == 'http':
             # TODO:
@@ -32,7 +36,8 @@ class AuthPluginConnector(BaseConnector):
             raise ERROR_GRPC_CONFIGURATION
 
     def call_login(self, endpoint, credentials):
-        self.initialize(endpoint)
+        if self.client is None or self.endpoint != endpoint:
+            self.initialize(endpoint)
 
         # TODO: secret_data
         params = {
@@ -82,9 +87,9 @@ class AuthPluginConnector(BaseConnector):
         except Exception as e:
             raise ERROR_AUTHENTICATION_FAILURE_PLUGIN(messsage=str(e))
 
-    def call_find(self, keyword, user_id, domain):
+    def call_find(self, keyword, user_id, options):
         params = {
-            'options': domain.plugin_info.options,
+            'options': options,
             'secret_data': {},
             'keyword': keyword,
             'user_id': user_id
@@ -1,12 +1,25 @@
 import logging
-from spaceone.core import pygrpc
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+from spaceone.core import cache, pygrpc
 from spaceone.core.connector import BaseConnector
-from spaceone.core.error import ERROR_WRONG_CONFIGURATION
+from spaceone.core.error import *
 from spaceone.core.utils import parse_endpoint
 
+from spaceone.identity.error.custom import ERROR_PLUGIN_ENDPOINT_NOT_FOUND
+
 _LOGGER = logging.getLogger(__name__)
 
+_REVALIDATING = set()
+_REVALIDATING_LOCK = threading.Lock()
+_REVALIDATE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='plugin-endpoint-revalidate')
+
+# pygrpc raises every remote error as ERROR_INTERNAL_API, so a missing plugin
+# is only recognized by the error code parsed from the details of the error.
+_NOT_FOUND_ERROR_CODES = ['ERROR_NOT_FOUND']
+
 
 class PluginServiceConnector(BaseConnector):
 
@@ -23,7 +36,9 @@ class PluginServiceConnector(BaseConnector):
             self.protocol = e['scheme']
             if self.protocol == 'grpc':
                 # create grpc client
-                self.client = pygrpc.client(endpoint="%s:%s" % (e['hostname'], e['port']), version=k)
+                self.client_endpoint = "%s:%s" % (e['hostname'], e['port'])
+                self.client_version = k
+                self.client = pygrpc.client(endpoint=self.client_endpoint, version=k)
             elif self.protocol == 'http':
                 # TODO:
                 pass
@@ -36,20 +51,140 @@ class PluginServiceConnector(BaseConnector):
             raise ERROR_WRONG_CONFIGURATION(key='too many endpoint')
 
     def get_plugin_endpoint(self, plugin_id, version, domain_id):
-        params = {
+        """ Resolve a plugin endpoint through the endpoint cache
+
+        A fresh entry (younger than `ttl`) is returned as is. A stale entry is
+        still returned while it is refreshed in the background, so neither the
+        login latency nor a plugin service outage is seen by the caller until
+        the entry is older than `stale_ttl`. Unknown plugins are remembered
+        for `negative_ttl` seconds.
+
+        Background refresh runs without a request and needs `system_token`.
+        Without it a stale entry is refreshed synchronously with the token of
+        the request, and kept only if the plugin service cannot be reached.
+        """
+
+        if not cache.is_set():
+            return self._get_plugin_endpoint(plugin_id, version, domain_id)
+
+        cache_conf = self._get_cache_conf()
+        cache_key = f'plugin-endpoint:{domain_id}:{plugin_id}:{version}'
+        cached = cache.get(cache_key)
+
+        if cached:
+            if 'error' in cached:
+                raise ERROR_PLUGIN_ENDPOINT_NOT_FOUND(plugin_id=plugin_id, version=version, reason=cached['error'])
+
+            if time.time() - cached['updated_at'] >= cache_conf['ttl']:
+                if self.config.get('system_token'):
+                    self._revalidate_plugin_endpoint(cache_key, plugin_id, version, domain_id)
+                else:
+                    return self._refresh_plugin_endpoint(cache_key, plugin_id, version, domain_id,
+                                                         cached['endpoint'])
+
+            return cached['endpoint']
+
+        return self._resolve_plugin_endpoint(cache_key, plugin_id, version, domain_id)
+
+    def _resolve_plugin_endpoint(self, cache_key, plugin_id, version, domain_id):
+        params = self._make_request_params(plugin_id, version, domain_id)
+        meta: list = self.transaction.get_connection_meta()
+
+        return _resolve_plugin_endpoint(self.client, cache_key, params, meta, self._get_cache_conf())
+
+    def _refresh_plugin_endpoint(self, cache_key, plugin_id, version, domain_id, stale_endpoint):
+        try:
+            return self._resolve_plugin_endpoint(cache_key, plugin_id, version, domain_id)
+        except ERROR_PLUGIN_ENDPOINT_NOT_FOUND:
+            raise
+        except Exception as e:
+            _LOGGER.warning(f'[_refresh_plugin_endpoint] Failed to refresh plugin endpoint. '
+                            f'Use the stale endpoint. (plugin_id={plugin_id}, version={version}, reason={e})')
+            return stale_endpoint
+
+    def _revalidate_plugin_endpoint(self, cache_key, plugin_id, version, domain_id):
+        """ Refresh a stale entry on a shared worker pool with the system token
+
+        The task does not use the connector or the transaction of the request,
+        which may already be finished when it runs.
+        """
+
+        with _REVALIDATING_LOCK:
+            if cache_key in _REVALIDATING:
+                return
+
+            _REVALIDATING.add(cache_key)
+
+        params = self._make_request_params(plugin_id, version, domain_id)
+        meta = [('token', self.config.get('system_token')), ('domain_id', domain_id)]
+
+        try:
+            _REVALIDATE_EXECUTOR.submit(_revalidate_plugin_endpoint, self.client_endpoint, self.client_version,
+                                        cache_key, params, meta, self._get_cache_conf())
+        except RuntimeError:
+            with _REVALIDATING_LOCK:
+                _REVALIDATING.discard(cache_key)
+
+    def _get_plugin_endpoint(self, plugin_id, version, domain_id):
+        params = self._make_request_params(plugin_id, version, domain_id)
+        meta: list = self.transaction.get_connection_meta()
+
+        return _get_plugin_endpoint(self.client, params, meta)
+
+    @staticmethod
+    def _make_request_params(plugin_id, version, domain_id):
+        return {
             'plugin_id': plugin_id,
             'version': version,
             'labels': {},
             'domain_id': domain_id
         }
 
-        meta: list = self.transaction.get_connection_meta()
-        _LOGGER.debug(f'[get_plugin_endpoint] params: {params}, meta: {meta}')
+    def _get_cache_conf(self):
+        cache_conf = self.config.get('endpoint_cache', {})
+        return {
+            'ttl': cache_conf.get('ttl', 300),
+            'stale_ttl': cache_conf.get('stale_ttl', 3600),
+            'negative_ttl': cache_conf.get('negative_ttl', 30)
+        }
+
+
+def _get_plugin_endpoint(client, params, meta):
+    _LOGGER.debug(f'[get_plugin_endpoint] params: {params}, meta: {meta}')
+
+    endpoint = client.Plugin.get_plugin_endpoint(
+        params,
+        metadata=meta
+    )
+    _LOGGER.debug(f'[get_plugin_endpoint] endpoint: {endpoint}')
+
+    return endpoint.endpoint
+
+
+def _resolve_plugin_endpoint(client, cache_key, params, meta, cache_conf):
+    try:
+        endpoint = _get_plugin_endpoint(client, params, meta)
+    except ERROR_BASE as e:
+        if e.error_code in _NOT_FOUND_ERROR_CODES:
+            cache.set(cache_key, {'error': e.message, 'updated_at': time.time()},
+                      expire=cache_conf['negative_ttl'])
+            raise ERROR_PLUGIN_ENDPOINT_NOT_FOUND(plugin_id=params['plugin_id'], version=params['version'],
+                                                  reason=e.message)
+
+        raise
+
+    cache.set(cache_key, {'endpoint': endpoint, 'updated_at': time.time()}, expire=cache_conf['stale_ttl'])
+    return endpoint
 
-        endpoint = self.client.Plugin.get_plugin_endpoint(
-            params,
-            metadata=meta
-        )
-        _LOGGER.debug(f'[get_plugin_endpoint] endpoint: {endpoint}')
 
-        return endpoint.endpoint
+def _revalidate_plugin_endpoint(client_endpoint, client_version, cache_key, params, meta, cache_conf):
+    try:
+        client = pygrpc.client(endpoint=client_endpoint, version=client_version)
+        _resolve_plugin_endpoint(client, cache_key, params, meta, cache_conf)
+    except Exception as e:
+        _LOGGER.warning(f'[_revalidate_plugin_endpoint] Failed to refresh plugin endpoint. '
+                        f'Keep the stale endpoint. (plugin_id={params["plugin_id"]}, '
+                        f'version={params["version"]}, reason={e})')
+    finally:
+        with _REVALIDATING_LOCK:
+            _REVALIDATING.discard(cache_key)
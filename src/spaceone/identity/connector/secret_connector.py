@@ -31,29 +31,29 @@ class SecretConnector(BaseConnector):
         if len(self.config['endpoint']) > 1:
             raise ERROR_CONNECTOR_CONFIGURATION(backend=self.__class__.__name__)
 
-    def release_secret_project(self, secret_id, domain_id):
+    def release_secret_project(self, secret_id, domain_id, timeout=None, metadata=None):
         response = self.client.Secret.update({
             'secret_id': secret_id,
             'release_project': True,
             'domain_id': domain_id
-        }, metadata=self.transaction.get_connection_meta())
+        }, metadata=self._get_metadata(metadata), timeout=timeout)
 
         return self._change_message(response)
 
-    def update_secret_project(self, secret_id, project_id, domain_id):
+    def update_secret_project(self, secret_id, project_id, domain_id, timeout=None, metadata=None):
         response = self.client.Secret.update({
             'secret_id': secret_id,
             'project_id': project_id,
             'domain_id': domain_id
-        }, metadata=self.transaction.get_connection_meta())
+        }, metadata=self._get_metadata(metadata), timeout=timeout)
 
         return self._change_message(response)
 
-    def delete_secret(self, secret_id, domain_id):
+    def delete_secret(self, secret_id, domain_id, timeout=None, metadata=None):
         self.client.Secret.delete({
             'secret_id': secret_id,
             'domain_id': domain_id
-        }, metadata=self.transaction.get_connection_meta())
+        }, metadata=self._get_metadata(metadata), timeout=timeout)
 
     def list_secrets(self, query, domain_id):
         response = self.client.Secret.list({
@@ -63,6 +63,44 @@ class SecretConnector(BaseConnector):
 
         return self._change_message(response)
 
+    def list_secrets_by_page(self, query, domain_id, page_size=None):
+        """ Yield matching secrets one page at a time
+
+        Pages are read with a keyset on secret_id instead of page.start, so
+        secrets which are updated or deleted while the caller works through
+        the pages are neither skipped nor returned twice. Each secret is
+        converted on its own, so only one page is held in memory.
+        """
+
+        page_size = page_size or self.config.get('page_size', 100)
+        only = query.get('only')
+        last_secret_id = None
+
+        while True:
+            page_query = dict(query)
+            page_query['filter'] = list(query.get('filter', []))
+            page_query['sort'] = {'key': 'secret_id'}
+            page_query['page'] = {'limit': page_size}
+
+            if only and 'secret_id' not in only:
+                page_query['only'] = only + ['secret_id']
+
+            if last_secret_id:
+                page_query['filter'].append({'k': 'secret_id', 'v': last_secret_id, 'o': 'gt'})
+
+            response = self.client.Secret.list({
+                'query': page_query,
+                'domain_id': domain_id
+            }, metadata=self.transaction.get_connection_meta())
+
+            for secret in response.results:
+                yield self._change_message(secret)
+
+            if len(response.results) < page_size:
+                break
+
+            last_secret_id = response.results[-1].secret_id
+
     def get_secret_data(self, secret_id, domain_id):
         response = self.client.Secret.get_data({
             'secret_id': secret_id,
@@ -71,6 +109,13 @@ class SecretConnector(BaseConnector):
 
         return self._change_message(response)
 
+    def _get_metadata(self, metadata=None):
+        # Calls made off the request thread pass the meta read on the request thread.
+        if metadata is None:
+            return self.transaction.get_connection_meta()
+
+        return metadata
+
     @staticmethod
     def _change_message(message):
         return MessageToDict(message, preserving_proto_field_name=True)
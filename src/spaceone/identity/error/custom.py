@@ -9,3 +9,13 @@ class ERROR_GENERATE_KEY_FAILURE(ERROR_BASE):
 
 class ERROR_UNSUPPORTED_API(ERROR_BASE):
     _message = 'Unsupported api. (reason={reason})'
+
+
+class ERROR_PLUGIN_ENDPOINT_NOT_FOUND(ERROR_INVALID_ARGUMENT):
+    _status_code = 'NOT_FOUND'
+    _message = 'Plugin endpoint not found. (plugin_id = {plugin_id}, version = {version}, reason = {reason})'
+
+
+class ERROR_SECRET_FAN_OUT_FAILURE(ERROR_UNKNOWN):
+    _message = 'Failed to {action} secrets of service account. ' \
+               '(service_account_id = {service_account_id}, failed_secrets = {failed_secrets}, reason = {reason})'
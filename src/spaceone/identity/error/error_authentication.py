@@ -33,3 +33,12 @@ class ERROR_REFRESH_COUNT(ERROR_AUTHENTICATE_FAILURE):
 
 class ERROR_NOT_FOUND_PRIVATE_KEY(ERROR_AUTHENTICATE_FAILURE):
     _message = 'Private key not found.'
+
+
+class ERROR_TOO_MANY_LOGIN_FAILURES(ERROR_AUTHENTICATE_FAILURE):
+    _message = 'Too many failed login attempts. Try again later.'
+
+
+class ERROR_PASSWORD_WORKER_BUSY(ERROR_BASE):
+    _status_code = 'UNAVAILABLE'
+    _message = 'Too many password authentication requests. Try again later.'
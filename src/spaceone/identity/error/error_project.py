@@ -7,6 +7,14 @@ class ERROR_EXIST_CHILD_PROJECT_GROUP(ERROR_BASE):
     _message = 'Child project group is exist. project_group_id = {project_group_id}'
 
 
+class ERROR_PROJECT_GROUP_CYCLE(ERROR_INVALID_ARGUMENT):
+    _message = 'Parent project group({parent_project_group_id}) is a descendant of project group({project_group_id}).'
+
+
+class ERROR_PROJECT_GROUP_MAX_DEPTH(ERROR_INVALID_ARGUMENT):
+    _message = 'Project group hierarchy can not be deeper than {max_depth}. (project_group_id = {project_group_id})'
+
+
 class ERROR_ALREADY_EXIST_USER_IN_PROJECT_GROUP(ERROR_BASE):
     _message = 'A user "{user_id}" is already exist in project group({project_group_id}).'
 
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+from spaceone.core import cache
+
+__all__ = ['get_redis_connection']
+
+
+def get_redis_connection(backend='default'):
+    """ Return the redis client behind a cache backend
+
+    spaceone.core.cache only offers get and set, so atomic operations (INCR,
+    WATCH/MULTI) go to the redis client of the backend directly. Values are
+    written as JSON like RedisCache does, so cache.get still reads them.
+
+    Returns None when no cache is configured or the backend is not redis.
+    """
+
+    if not cache.is_set(backend):
+        return None
+
+    return _get_connection(backend=backend)
+
+
+@cache.connection
+def _get_connection(cache_cls):
+    return getattr(cache_cls, 'conn', None)
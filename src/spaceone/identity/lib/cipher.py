@@ -1,15 +1,199 @@
 # -*- coding: utf-8 -*-
+import base64
+import concurrent.futures
+import concurrent.futures.process
+import hashlib
+import hmac
+import logging
+import multiprocessing
+import os
+import threading
 
 import bcrypt
 
+from spaceone.core import config
+from spaceone.identity.error.error_authentication import ERROR_PASSWORD_WORKER_BUSY
+
+_LOGGER = logging.getLogger(__name__)
+
+_WORKER_POOL = None
+_WORKER_POOL_LOCK = threading.Lock()
+
+_SCRYPT_PREFIX = b'$scrypt$'
+_DEFAULT_HASH_OPTIONS = {
+    'algorithm': 'bcrypt',
+    'bcrypt_rounds': 12,
+    'scrypt_n': 16384,
+    'scrypt_r': 8,
+    'scrypt_p': 1
+}
+
+
+def _hashpw(password: bytes, options: dict) -> bytes:
+    if options['algorithm'] == 'scrypt':
+        n, r, p = options['scrypt_n'], options['scrypt_r'], options['scrypt_p']
+        salt = os.urandom(16)
+        hashed = _scrypt(password, salt, n, r, p)
+        return _SCRYPT_PREFIX + b'n=%d,r=%d,p=%d$' % (n, r, p) + base64.b64encode(salt) + b'$' + \
+            base64.b64encode(hashed)
+    else:
+        return bcrypt.hashpw(password, bcrypt.gensalt(rounds=options['bcrypt_rounds']))
+
+
+def _checkpw(password: bytes, hashed: bytes) -> bool:
+    if hashed.startswith(_SCRYPT_PREFIX):
+        n, r, p, salt, stored = _parse_scrypt_hash(hashed)
+        return hmac.compare_digest(_scrypt(password, salt, n, r, p), stored)
+    else:
+        return bcrypt.checkpw(password, hashed)
+
+
+def _scrypt(password: bytes, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(password, salt=salt, n=n, r=r, p=p, maxmem=256 * n * r + 1024 * 1024, dklen=64)
+
+
+def _parse_scrypt_hash(hashed: bytes):
+    params, salt, stored = hashed[len(_SCRYPT_PREFIX):].split(b'$')
+    params = dict(param.split(b'=') for param in params.split(b','))
+    return int(params[b'n']), int(params[b'r']), int(params[b'p']), base64.b64decode(salt), \
+        base64.b64decode(stored)
+
+
+def get_password_hash_options():
+    identity_conf = config.get_global('IDENTITY') or {}
+    return dict(_DEFAULT_HASH_OPTIONS, **identity_conf.get('password_hash', {}))
+
+
+class PasswordWorkerPool:
+    """ Process pool which runs bcrypt outside of the gRPC handler threads
+
+    At most `workers` hashes run at the same time and at most `max_queue`
+    requests wait for a worker. A request which can not get a slot within
+    `queue_timeout` seconds is rejected with ERROR_PASSWORD_WORKER_BUSY
+    instead of holding a server thread. A slot is held until its task has
+    finished, even when the caller stopped waiting after `timeout` seconds.
+    The executor is recreated when a worker process dies.
+    """
+
+    def __init__(self, workers=2, max_queue=32, queue_timeout=1, timeout=10):
+        self.workers = workers
+        self.queue_timeout = queue_timeout
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._executor_lock = threading.Lock()
+        self._executor = self._create_executor()
+
+    def run(self, func, *args):
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            _LOGGER.warning(f'[run] Password worker pool is full. (workers={self.workers})')
+            raise ERROR_PASSWORD_WORKER_BUSY()
+
+        try:
+            executor, future = self._submit(func, *args)
+        except Exception:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(self._release_slot)
+
+        try:
+            return future.result(timeout=self.timeout)
+        except concurrent.futures.TimeoutError:
+            _LOGGER.warning(f'[run] Password worker timeout. (timeout={self.timeout})')
+            raise ERROR_PASSWORD_WORKER_BUSY()
+        except concurrent.futures.process.BrokenProcessPool:
+            _LOGGER.error('[run] Password worker process died. Recreate the worker pool.')
+            self._reset_executor(executor)
+            raise ERROR_PASSWORD_WORKER_BUSY()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+    def _submit(self, func, *args):
+        executor = self._executor
+
+        try:
+            future = executor.submit(func, *args)
+        except concurrent.futures.process.BrokenProcessPool:
+            _LOGGER.error('[_submit] Password worker pool is broken. Recreate the worker pool.')
+            executor = self._reset_executor(executor)
+            future = executor.submit(func, *args)
+
+        return executor, future
+
+    def _reset_executor(self, broken_executor):
+        with self._executor_lock:
+            if self._executor is broken_executor:
+                broken_executor.shutdown(wait=False)
+                self._executor = self._create_executor()
+
+            return self._executor
+
+    def _release_slot(self, future):
+        self._slots.release()
+
+    def _create_executor(self):
+        return concurrent.futures.ProcessPoolExecutor(max_workers=self.workers,
+                                                      mp_context=multiprocessing.get_context('spawn'))
+
+
+def get_password_worker_pool():
+    global _WORKER_POOL
+
+    if _WORKER_POOL is None:
+        with _WORKER_POOL_LOCK:
+            if _WORKER_POOL is None:
+                identity_conf = config.get_global('IDENTITY') or {}
+                conf = identity_conf.get('password_worker', {})
+
+                if conf.get('workers', 0) > 0:
+                    _WORKER_POOL = PasswordWorkerPool(workers=conf['workers'],
+                                                      max_queue=conf.get('max_queue', 32),
+                                                      queue_timeout=conf.get('queue_timeout', 1),
+                                                      timeout=conf.get('timeout', 10))
+                else:
+                    _WORKER_POOL = False
+
+    return _WORKER_POOL
+
 
 class PasswordCipher:
+    """ Hash and check passwords with the algorithm of IDENTITY.password_hash
+
+    checkpw() accepts every supported format, so hashes created with previous
+    settings keep working and can be upgraded with needs_rehash().
+    """
+
     @staticmethod
     def __encoder(password: str) -> str:
         return str(password).encode('utf-8')
 
     def hashpw(self, password: str) -> bytes:
-        return bcrypt.hashpw(self.__encoder(password), bcrypt.gensalt())
+        return self._run(_hashpw, self.__encoder(password), get_password_hash_options())
 
     def checkpw(self, password, hashed) -> bool:
-        return bcrypt.checkpw(self.__encoder(password), hashed)
+        return self._run(_checkpw, self.__encoder(password), hashed)
+
+    @staticmethod
+    def needs_rehash(hashed: bytes) -> bool:
+        options = get_password_hash_options()
+
+        try:
+            if hashed.startswith(_SCRYPT_PREFIX):
+                n, r, p, _, _ = _parse_scrypt_hash(hashed)
+                return options['algorithm'] != 'scrypt' or \
+                    (n, r, p) != (options['scrypt_n'], options['scrypt_r'], options['scrypt_p'])
+            else:
+                rounds = int(hashed.split(b'$')[2])
+                return options['algorithm'] != 'bcrypt' or rounds != options['bcrypt_rounds']
+        except Exception:
+            return True
+
+    @staticmethod
+    def _run(func, *args):
+        worker_pool = get_password_worker_pool()
+
+        if worker_pool:
+            return worker_pool.run(func, *args)
+        else:
+            return func(*args)
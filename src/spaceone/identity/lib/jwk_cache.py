@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from jose import jwk
+
+from spaceone.core.auth.jwt import JWTAuthenticator
+
+__all__ = ['get_signing_key', 'get_authenticator', 'get_key_version']
+
+_MAX_KEYS = 1024
+_ALGORITHM = 'RS256'
+
+_KEYS = OrderedDict()
+_KEYS_LOCK = threading.Lock()
+
+
+def get_signing_key(domain_id, private_jwk, algorithm=_ALGORITHM):
+    """ Return a ready-to-sign key object of a domain
+
+    Importing an RSA JWK is expensive, so the constructed key is kept per
+    process and keyed by domain_id and key version. The version is the kid of
+    the JWK or a digest of its content, so a regenerated domain secret gets a
+    new entry instead of a stale key.
+    """
+
+    version = get_key_version(private_jwk)
+    return _get_or_create(('private', domain_id, version, algorithm), lambda: _construct(private_jwk, algorithm))
+
+
+def get_authenticator(domain_id, public_jwk, algorithm=_ALGORITHM):
+    """ Return a JWTAuthenticator of a domain built on a constructed public key """
+
+    version = get_key_version(public_jwk)
+
+    # jws.verify only takes a JWK or a key set besides a string, so the key is passed as a key set.
+    return _get_or_create(('public', domain_id, version, algorithm),
+                          lambda: JWTAuthenticator({'keys': [_construct(public_jwk, algorithm)]}))
+
+
+def _get_or_create(cache_key, factory):
+    with _KEYS_LOCK:
+        value = _KEYS.get(cache_key)
+        if value is not None:
+            _KEYS.move_to_end(cache_key)
+            return value
+
+    value = factory()
+
+    with _KEYS_LOCK:
+        _KEYS[cache_key] = value
+        if len(_KEYS) > _MAX_KEYS:
+            _KEYS.popitem(last=False)
+
+    return value
+
+
+def _construct(key_data, algorithm):
+    # python-jose builds a new key from whatever it gets, but takes a key of its
+    # crypto backend as is, so the backend key is kept instead of the jose wrapper.
+    key = jwk.construct(key_data, algorithm)
+
+    if hasattr(key, 'prepared_key'):
+        return key.prepared_key
+    else:
+        return key._prepared_key
+
+
+def get_key_version(key_data):
+    """ Return the kid of a JWK or a digest of its content """
+
+    if 'kid' in key_data:
+        return key_data['kid']
+
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode('utf-8')).hexdigest()
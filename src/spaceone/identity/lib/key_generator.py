@@ -6,6 +6,7 @@ from typing import Tuple, Any
 from spaceone.core import utils
 from spaceone.core.auth.jwt.jwt_util import JWTUtil
 from spaceone.identity.error import ERROR_GENERATE_KEY_FAILURE
+from spaceone.identity.lib.jwk_cache import get_signing_key
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,7 +39,7 @@ class KeyGenerator:
             'ver': '2020-03-04'
         }
 
-        encoded = JWTUtil.encode(payload, self.prv_jwk)
+        encoded = JWTUtil.encode(payload, get_signing_key(self.domain_id, self.prv_jwk))
 
         _LOGGER.debug(f'[KeyGenerator] Generated payload. ( '
                       f'cat: {payload.get("cat")}, '
@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+import importlib
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+
+from spaceone.core import config
+from spaceone.identity.lib.permission_matcher import PermissionMatcher
+
+__all__ = ['ManagedPolicyLoader', 'FileFetcher', 'HTTPFetcher', 'get_managed_policy_loader']
+
+_LOGGER = logging.getLogger(__name__)
+
+_LOADER = None
+_LOADER_LOCK = threading.Lock()
+
+
+class _NoRedirectHandler(urllib.request.HTTPRedirectHandler):
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class FileFetcher:
+    """ Fetch a managed policy from a local file (file:///path or /path)
+
+    Only files inside the operator's `policy_dirs` are read. The path is
+    resolved with its symlinks before the check, so neither `..` nor a link
+    can reach a file outside of them.
+    """
+
+    def __init__(self, policy_dirs=None):
+        self.policy_dirs = [os.path.realpath(policy_dir) for policy_dir in policy_dirs or []]
+
+    def fetch(self, url, etag=None, timeout=None):
+        path = self._resolve_path(url)
+        stat = os.stat(path)
+        new_etag = f'{stat.st_mtime_ns}-{stat.st_size}'
+
+        if etag == new_etag:
+            return None, etag
+
+        with open(path, 'r') as f:
+            return f.read(), new_etag
+
+    def _resolve_path(self, url):
+        if url.startswith('file:'):
+            parsed_url = urllib.parse.urlparse(url)
+            if parsed_url.netloc not in ['', 'localhost']:
+                raise ValueError(f'Managed policy file must be local. (url={url})')
+
+            path = urllib.parse.unquote(parsed_url.path)
+        else:
+            path = url
+
+        if not os.path.isabs(path) or '..' in path.split('/'):
+            raise ValueError(f'Managed policy file path must be absolute without "..". (url={url})')
+
+        real_path = os.path.realpath(path)
+        for policy_dir in self.policy_dirs:
+            if os.path.commonpath([real_path, policy_dir]) == policy_dir:
+                return real_path
+
+        raise ValueError(f'Managed policy file is not in policy_dirs. (url={url})')
+
+
+class HTTPFetcher:
+    """ Fetch a managed policy over http(s) with If-None-Match
+
+    Redirects are not followed, so a policy server cannot point the request
+    at a host outside of the allowlist.
+    """
+
+    def __init__(self):
+        self._opener = urllib.request.build_opener(_NoRedirectHandler)
+
+    def fetch(self, url, etag=None, timeout=None):
+        request = urllib.request.Request(url)
+        if etag:
+            request.add_header('If-None-Match', etag)
+
+        try:
+            with self._opener.open(request, timeout=timeout) as response:
+                return response.read().decode('utf-8'), response.headers.get('ETag')
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None, etag
+
+            raise
+
+
+class ManagedPolicyLoader:
+    """ In-process cache of compiled managed policies
+
+    Only urls whose scheme and host are in the operator allowlist are
+    fetched, and local files only from `policy_dirs`. get_matcher() never
+    goes to the network for a policy that was loaded before: expired policies
+    are served as they are and reloaded by a background thread, which sends
+    the last ETag so unchanged documents are not parsed again. A missing
+    policy is loaded on a worker thread and the caller waits at most
+    `load_wait` seconds for it. Failed loads are kept for `negative_ttl`
+    seconds, and at most `max_policies` urls are kept.
+
+    get_matcher() raises ValueError for a policy that failed to load and
+    concurrent.futures.TimeoutError when a missing policy is not loaded
+    within `load_wait` seconds.
+    """
+
+    def __init__(self, ttl=300, refresh_interval=60, timeout=5, allowed_schemes=None, allowed_hosts=None,
+                 policy_dirs=None, negative_ttl=30, load_wait=1, max_policies=1000, fetchers=None):
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval
+        self.timeout = timeout
+        self.allowed_schemes = set(allowed_schemes or ['https'])
+        self.allowed_hosts = set(host.lower() for host in allowed_hosts or [])
+        self.negative_ttl = negative_ttl
+        self.load_wait = load_wait
+        self.max_policies = max_policies
+        self.policy_dirs = policy_dirs or []
+        self._fetchers = {
+            'file': FileFetcher(self.policy_dirs),
+            'http': HTTPFetcher(),
+            'https': HTTPFetcher()
+        }
+        self._fetchers.update(fetchers or {})
+        self._policies = OrderedDict()
+        self._loading = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='managed-policy-load')
+        self._refresh_thread = None
+
+    def register_fetcher(self, scheme, fetcher):
+        self._fetchers[scheme] = fetcher
+
+    def get_matcher(self, url):
+        policy = self._get_policy(url)
+
+        if policy is None:
+            self._start_refresh_thread()
+            policy = self._get_loading_future(url).result(timeout=self.load_wait)
+
+        if policy.get('failed'):
+            raise ValueError(f'Managed policy is not available. (url={url})')
+
+        return policy['matcher']
+
+    def load(self, url):
+        fetcher = self._get_fetcher(url)
+
+        with self._lock:
+            old_policy = self._policies.get(url)
+            etag = old_policy.get('etag') if old_policy else None
+
+        document, etag = fetcher.fetch(url, etag=etag, timeout=self.timeout)
+
+        if document is None and old_policy and not old_policy.get('failed'):
+            policy = dict(old_policy, expired_at=time.time() + self.ttl)
+        else:
+            policy = {
+                'matcher': PermissionMatcher(self._parse_permissions(document)),
+                'etag': etag,
+                'expired_at': time.time() + self.ttl
+            }
+
+        self._set_policy(url, policy)
+        return policy
+
+    def refresh(self):
+        now = time.time()
+        with self._lock:
+            expired_urls = [url for url, policy in self._policies.items() if policy['expired_at'] <= now]
+
+        for url in expired_urls:
+            try:
+                self.load(url)
+            except Exception as e:
+                _LOGGER.error(f'[refresh] Failed to refresh managed policy. Keep the previous one. '
+                              f'(url={url}, reason={e})')
+
+    def clear(self):
+        with self._lock:
+            self._policies = OrderedDict()
+
+    def _get_policy(self, url):
+        with self._lock:
+            policy = self._policies.get(url)
+            if policy is None:
+                return None
+
+            if policy.get('failed') and policy['expired_at'] <= time.time():
+                del self._policies[url]
+                return None
+
+            self._policies.move_to_end(url)
+            return policy
+
+    def _set_policy(self, url, policy):
+        with self._lock:
+            self._policies[url] = policy
+            self._policies.move_to_end(url)
+
+            while len(self._policies) > self.max_policies:
+                self._policies.popitem(last=False)
+
+    def _get_loading_future(self, url):
+        with self._lock:
+            future = self._loading.get(url)
+            if future is None:
+                future = self._executor.submit(self._load_or_fail, url)
+                self._loading[url] = future
+
+        return future
+
+    def _load_or_fail(self, url):
+        try:
+            return self.load(url)
+        except Exception as e:
+            _LOGGER.error(f'[_load_or_fail] Failed to load managed policy. (url={url}, reason={e})')
+            policy = {
+                'failed': True,
+                'expired_at': time.time() + self.negative_ttl
+            }
+            self._set_policy(url, policy)
+            return policy
+        finally:
+            with self._lock:
+                self._loading.pop(url, None)
+
+    def _get_fetcher(self, url):
+        parsed_url = urllib.parse.urlparse(url)
+        scheme = parsed_url.scheme.lower() or 'file'
+        host = (parsed_url.hostname or '').lower()
+
+        if scheme == 'file':
+            # FileFetcher checks the path against policy_dirs.
+            if not self.policy_dirs:
+                raise ValueError(f'Managed policy files are not allowed. (url={url})')
+
+            return self._fetchers['file']
+
+        if scheme not in self.allowed_schemes or scheme not in self._fetchers:
+            raise ValueError(f'Managed policy url scheme is not allowed. (url={url})')
+
+        if host not in self.allowed_hosts and f'{host}:{parsed_url.port}' not in self.allowed_hosts:
+            raise ValueError(f'Managed policy url host is not allowed. (url={url})')
+
+        return self._fetchers[scheme]
+
+    @staticmethod
+    def _parse_permissions(document):
+        data = yaml.safe_load(document) or {}
+        permissions = data.get('permissions', []) if isinstance(data, dict) else []
+
+        if not isinstance(permissions, list):
+            raise ValueError('permissions of managed policy must be a list.')
+
+        return [str(permission) for permission in permissions]
+
+    def _start_refresh_thread(self):
+        if self._refresh_thread is None and self.refresh_interval > 0:
+            with self._lock:
+                if self._refresh_thread is None:
+                    self._refresh_thread = threading.Thread(target=self._run_refresh, daemon=True,
+                                                            name='managed-policy-refresh')
+                    self._refresh_thread.start()
+
+    def _run_refresh(self):
+        while True:
+            time.sleep(self.refresh_interval)
+            self.refresh()
+
+
+def get_managed_policy_loader():
+    global _LOADER
+
+    if _LOADER is None:
+        with _LOADER_LOCK:
+            if _LOADER is None:
+                identity_conf = config.get_global('IDENTITY') or {}
+                conf = identity_conf.get('managed_policy', {})
+                fetchers = {scheme: _load_fetcher(class_path)
+                            for scheme, class_path in conf.get('fetchers', {}).items()}
+
+                _LOADER = ManagedPolicyLoader(ttl=conf.get('ttl', 300),
+                                              refresh_interval=conf.get('refresh_interval', 60),
+                                              timeout=conf.get('timeout', 5),
+                                              allowed_schemes=conf.get('allowed_schemes'),
+                                              allowed_hosts=conf.get('allowed_hosts'),
+                                              policy_dirs=conf.get('policy_dirs'),
+                                              negative_ttl=conf.get('negative_ttl', 30),
+                                              load_wait=conf.get('load_wait', 1),
+                                              max_policies=conf.get('max_policies', 1000),
+                                              fetchers=fetchers)
+
+    return _LOADER
+
+
+def _load_fetcher(class_path):
+    module_name, class_name = class_path.rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), class_name)()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+import fnmatch
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+__all__ = ['PermissionMatcher', 'get_permission_matcher', 'get_permissions_digest']
+
+_GLOB_CHARS = ('*', '?', '[')
+_TERMINAL = None
+
+_MAX_MATCHERS = 1024
+
+_MATCHERS = OrderedDict()
+_MATCHERS_LOCK = threading.Lock()
+
+
+class PermissionMatcher:
+    """ Compiled permission index
+
+    Permissions are split once into three groups so that a lookup does not
+    need to translate every glob to a regex again:
+
+        - exact permissions ('identity.User.get') are kept in a hash set.
+        - prefix permissions ('identity.*', 'identity.User.*') are kept in a trie.
+        - every other glob is combined into a single regex.
+    """
+
+    def __init__(self, permissions=None):
+        self.permissions = tuple(permissions or [])
+        self._exact = set()
+        self._prefix_trie = {}
+        self._patterns = []
+        self._regex = None
+
+        for permission in self.permissions:
+            self._add(permission)
+
+        if self._patterns:
+            self._regex = re.compile('|'.join(f'(?:{fnmatch.translate(p)})' for p in self._patterns))
+
+    def __bool__(self):
+        return len(self.permissions) > 0
+
+    def __len__(self):
+        return len(self.permissions)
+
+    def match(self, service, api_class, method):
+        return self.match_api(f'{service}.{api_class}.{method}')
+
+    def match_api(self, api):
+        if api in self._exact:
+            return True
+
+        if self._match_prefix(api):
+            return True
+
+        if self._regex and self._regex.match(api):
+            return True
+
+        return False
+
+    def _add(self, permission):
+        body = permission.rstrip('*')
+
+        if not any(c in permission for c in _GLOB_CHARS):
+            self._exact.add(permission)
+        elif body != permission and not any(c in body for c in _GLOB_CHARS):
+            self._add_prefix(body)
+        else:
+            self._patterns.append(permission)
+
+    def _add_prefix(self, prefix):
+        node = self._prefix_trie
+        for c in prefix:
+            node = node.setdefault(c, {})
+
+        node[_TERMINAL] = True
+
+    def _match_prefix(self, api):
+        node = self._prefix_trie
+        if _TERMINAL in node:
+            return True
+
+        for c in api:
+            node = node.get(c)
+            if node is None:
+                return False
+
+            if _TERMINAL in node:
+                return True
+
+        return False
+
+
+def get_permission_matcher(permissions, digest=None):
+    """ Return a shared PermissionMatcher for a list of permissions
+
+    Cache backends only keep JSON values, so the permissions are cached and
+    the compiled matcher is kept per process. Matchers are keyed by the
+    digest of the permissions; callers that store the digest next to the
+    permissions pass it in, so a lookup does not hash the whole list again.
+    """
+
+    if digest is None:
+        digest = get_permissions_digest(permissions)
+
+    with _MATCHERS_LOCK:
+        matcher = _MATCHERS.get(digest)
+        if matcher is not None:
+            _MATCHERS.move_to_end(digest)
+            return matcher
+
+    matcher = PermissionMatcher(permissions)
+
+    with _MATCHERS_LOCK:
+        _MATCHERS[digest] = matcher
+        if len(_MATCHERS) > _MAX_MATCHERS:
+            _MATCHERS.popitem(last=False)
+
+    return matcher
+
+
+def get_permissions_digest(permissions):
+    return hashlib.sha256('\n'.join(permissions).encode('utf-8')).hexdigest()
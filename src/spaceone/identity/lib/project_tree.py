@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+import time
+from array import array
+
+__all__ = ['ProjectTree', 'get_project_tree', 'patch_project_tree', 'invalidate_project_tree']
+
+_LOGGER = logging.getLogger(__name__)
+
+_NO_PARENT = -1
+_REMOVED = -2
+
+_PAGE_BITS = 9
+_PAGE_MASK = (1 << _PAGE_BITS) - 1
+
+_PROJECT_TREES = {}
+_PROJECT_TREES_LOCK = threading.Lock()
+
+
+class _PagedArray:
+    """ Sequence stored in fixed-size pages which are shared between copies
+
+    copy() only copies the list of pages and leaves the source as it is. A
+    page is copied on the first write of the copy, so a change costs one page
+    instead of the whole array. The source is not written after it was
+    copied, since it still owns the pages it shares with its copies.
+    Pages are array(typecode) when a typecode is given, lists otherwise.
+    """
+
+    def __init__(self, typecode=None):
+        self._typecode = typecode
+        self._pages = []
+        self._owned_pages = set()
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        return self._pages[index >> _PAGE_BITS][index & _PAGE_MASK]
+
+    def __setitem__(self, index, value):
+        self._get_own_page(index >> _PAGE_BITS)[index & _PAGE_MASK] = value
+
+    def append(self, value):
+        page_index = self._length >> _PAGE_BITS
+        if page_index == len(self._pages):
+            self._pages.append(array(self._typecode) if self._typecode else [])
+            self._owned_pages.add(page_index)
+
+        self._get_own_page(page_index).append(value)
+        self._length += 1
+
+    def copy(self):
+        paged_array = _PagedArray(self._typecode)
+        paged_array._pages = list(self._pages)
+        paged_array._length = self._length
+        return paged_array
+
+    def _get_own_page(self, page_index):
+        if page_index not in self._owned_pages:
+            page = self._pages[page_index]
+            self._pages[page_index] = array(self._typecode, page) if self._typecode else list(page)
+            self._owned_pages.add(page_index)
+
+        return self._pages[page_index]
+
+
+class ProjectTree:
+    """ Project group hierarchy of a domain kept in compact arrays
+
+    Project groups and projects are numbered by insertion order. Parent links
+    and the project -> project group mapping are stored in integer arrays;
+    removed nodes are tombstoned instead of being compacted so that indexes
+    held by other entries stay valid. Every traversal is iterative, visits a
+    node once and is bounded by max_depth, so a cycle in the stored data can
+    not hang a caller.
+
+    A cached tree is read without a lock, so it is never changed in place:
+    patch_project_tree() applies a change to a copy and swaps the copy in.
+    A tree is not changed after it was copied, changes go to its copies. A
+    copy shares its arrays page by page and copies only what the change
+    writes: the touched pages and the child or project sets of the touched
+    nodes, which are replaced instead of being updated. The id -> index maps
+    are shared until the first node is added to the copy.
+    """
+
+    def __init__(self, domain_id, project_groups=None, projects=None, max_depth=None):
+        self.domain_id = domain_id
+        self.max_depth = max_depth
+        self._group_ids = _PagedArray()
+        self._group_index = {}
+        self._parents = _PagedArray('i')
+        self._children = _PagedArray()
+        self._project_ids = _PagedArray()
+        self._project_index = {}
+        self._project_groups = _PagedArray('i')
+        self._group_projects = _PagedArray()
+        self._shared_indexes = False
+
+        # Sets are changed in place only while the tree is not shared yet.
+        self._building = True
+
+        project_groups = list(project_groups or [])
+        for project_group_id, _ in project_groups:
+            self._get_or_add_group(project_group_id)
+
+        for project_group_id, parent_project_group_id in project_groups:
+            self._set_parent(self._group_index[project_group_id], parent_project_group_id)
+
+        for project_id, project_group_id in projects or []:
+            self.add_project(project_id, project_group_id)
+
+        self._building = False
+
+    def __contains__(self, project_group_id):
+        index = self._find_group(project_group_id)
+        return index is not None and self._parents[index] != _REMOVED
+
+    def copy(self):
+        tree = ProjectTree(self.domain_id, max_depth=self.max_depth)
+        tree._group_ids = self._group_ids.copy()
+        tree._group_index = self._group_index
+        tree._parents = self._parents.copy()
+        tree._children = self._children.copy()
+        tree._project_ids = self._project_ids.copy()
+        tree._project_index = self._project_index
+        tree._project_groups = self._project_groups.copy()
+        tree._group_projects = self._group_projects.copy()
+        tree._shared_indexes = True
+        return tree
+
+    def add_project_group(self, project_group_id, parent_project_group_id=None):
+        index = self._get_or_add_group(project_group_id)
+        self._set_parent(index, parent_project_group_id)
+
+    def move_project_group(self, project_group_id, parent_project_group_id=None):
+        self.add_project_group(project_group_id, parent_project_group_id)
+
+    def remove_project_group(self, project_group_id):
+        index = self._find_group(project_group_id)
+        if index is None:
+            return
+
+        self._set_parent(index, None)
+        for project_index in list(self._group_projects[index]):
+            self._project_groups[project_index] = _NO_PARENT
+
+        self._group_projects[index] = set()
+        self._parents[index] = _REMOVED
+
+    def add_project(self, project_id, project_group_id=None):
+        index = self._find_project(project_id)
+        if index is None:
+            index = len(self._project_ids)
+            self._own_indexes()
+            self._project_index[project_id] = index
+            self._project_ids.append(project_id)
+            self._project_groups.append(_NO_PARENT)
+        else:
+            self._unlink_project(index)
+
+        if project_group_id is not None:
+            group_index = self._get_or_add_group(project_group_id)
+            self._project_groups[index] = group_index
+            self._add_to_set(self._group_projects, group_index, index)
+
+    def move_project(self, project_id, project_group_id=None):
+        self.add_project(project_id, project_group_id)
+
+    def remove_project(self, project_id):
+        index = self._find_project(project_id)
+        if index is not None:
+            self._unlink_project(index)
+            self._project_groups[index] = _REMOVED
+
+    def get_parent(self, project_group_id):
+        index = self._find_group(project_group_id)
+        if index is None or self._parents[index] < 0:
+            return None
+
+        return self._group_ids[self._parents[index]]
+
+    def get_ancestors(self, project_group_id, include_self=False):
+        """ Return ancestors from the nearest parent to the root """
+
+        ancestors = [project_group_id] if include_self else []
+
+        index = self._find_group(project_group_id)
+        if index is None:
+            return ancestors
+
+        visited = {index}
+        index = self._parents[index]
+
+        while index >= 0 and index not in visited:
+            visited.add(index)
+            ancestors.append(self._group_ids[index])
+            index = self._parents[index]
+
+        return ancestors
+
+    def get_descendants(self, project_group_id, include_self=False, max_depth=None):
+        indexes = self._walk_descendants([project_group_id], max_depth)
+
+        if not include_self:
+            indexes.discard(self._find_group(project_group_id))
+
+        return [self._group_ids[index] for index in indexes]
+
+    def get_depth(self, project_group_id):
+        """ Return the number of levels from the root to the project group (root = 1) """
+
+        if project_group_id not in self:
+            return 0
+
+        return len(self.get_ancestors(project_group_id)) + 1
+
+    def get_height(self, project_group_id):
+        """ Return the number of levels of the subtree under the project group (leaf = 1) """
+
+        if project_group_id not in self:
+            return 0
+
+        height = 0
+        visited = set()
+        level = [self._find_group(project_group_id)]
+
+        while level:
+            height += 1
+            visited.update(level)
+            level = [child for index in level for child in self._children[index] if child not in visited]
+
+        return height
+
+    def get_projects(self, project_group_ids, recursive=True, max_depth=None):
+        if recursive:
+            group_indexes = self._walk_descendants(project_group_ids, max_depth)
+        else:
+            group_indexes = {self._find_group(pg_id) for pg_id in project_group_ids if pg_id in self}
+
+        project_ids = set()
+        for group_index in group_indexes:
+            project_ids.update(self._project_ids[index] for index in self._group_projects[group_index])
+
+        return project_ids
+
+    def get_project_group(self, project_id):
+        index = self._find_project(project_id)
+        if index is None or self._project_groups[index] < 0:
+            return None
+
+        return self._group_ids[self._project_groups[index]]
+
+    def _walk_descendants(self, project_group_ids, max_depth=None):
+        """ Breadth-first walk which visits a node once and stops after max_depth levels """
+
+        max_depth = max_depth or self.max_depth
+        visited = set()
+        depth = 0
+        level = {self._find_group(pg_id) for pg_id in project_group_ids if pg_id in self}
+
+        while level:
+            if max_depth is not None and depth >= max_depth:
+                _LOGGER.warning(f'[_walk_descendants] Project group depth exceeds {max_depth}. '
+                                f'(domain_id={self.domain_id})')
+                break
+
+            depth += 1
+            visited |= level
+            level = {child for index in level for child in self._children[index]} - visited
+
+        return visited
+
+    def _find_group(self, project_group_id):
+        return self._group_index.get(project_group_id)
+
+    def _find_project(self, project_id):
+        return self._project_index.get(project_id)
+
+    def _own_indexes(self):
+        if self._shared_indexes:
+            self._group_index = dict(self._group_index)
+            self._project_index = dict(self._project_index)
+            self._shared_indexes = False
+
+    def _get_or_add_group(self, project_group_id):
+        index = self._find_group(project_group_id)
+        if index is None:
+            index = len(self._group_ids)
+            self._own_indexes()
+            self._group_index[project_group_id] = index
+            self._group_ids.append(project_group_id)
+            self._parents.append(_NO_PARENT)
+            self._children.append(set())
+            self._group_projects.append(set())
+        elif self._parents[index] == _REMOVED:
+            self._parents[index] = _NO_PARENT
+
+        return index
+
+    def _set_parent(self, index, parent_project_group_id):
+        old_parent = self._parents[index]
+        if old_parent >= 0:
+            self._discard_from_set(self._children, old_parent, index)
+
+        if parent_project_group_id is None:
+            self._parents[index] = _NO_PARENT
+        else:
+            parent_index = self._get_or_add_group(parent_project_group_id)
+            self._parents[index] = parent_index
+            self._add_to_set(self._children, parent_index, index)
+
+    def _unlink_project(self, index):
+        group_index = self._project_groups[index]
+        if group_index >= 0:
+            self._discard_from_set(self._group_projects, group_index, index)
+
+        self._project_groups[index] = _NO_PARENT
+
+    def _add_to_set(self, paged_sets, index, value):
+        if self._building:
+            paged_sets[index].add(value)
+        elif value not in paged_sets[index]:
+            paged_sets[index] = paged_sets[index] | {value}
+
+    def _discard_from_set(self, paged_sets, index, value):
+        if self._building:
+            paged_sets[index].discard(value)
+        elif value in paged_sets[index]:
+            paged_sets[index] = paged_sets[index] - {value}
+
+
+def get_project_tree(domain_id, loader, ttl=300, version=None, max_depth=None):
+    """ Return the cached ProjectTree of a domain, building it with loader() if needed
+
+    A tree is rebuilt when it is older than ttl or when version differs from the
+    version it was built or last patched with, so that changes made by other
+    processes are picked up. Without a version shared between processes, ttl
+    is how long another process can serve a tree missing a change.
+    """
+
+    with _PROJECT_TREES_LOCK:
+        cached = _PROJECT_TREES.get(domain_id)
+
+    if cached and cached['expired_at'] > time.time() and cached['version'] == version:
+        return cached['tree']
+
+    _LOGGER.debug(f'[get_project_tree] Build project tree. (domain_id={domain_id})')
+    project_groups, projects = loader()
+    tree = ProjectTree(domain_id, project_groups, projects, max_depth=max_depth)
+
+    with _PROJECT_TREES_LOCK:
+        _PROJECT_TREES[domain_id] = {
+            'tree': tree,
+            'version': version,
+            'expired_at': time.time() + ttl
+        }
+
+    return tree
+
+
+def patch_project_tree(domain_id, func, *args, expected_version=None, version=None):
+    """ Apply an incremental change to the cached tree of a domain, if it is loaded
+
+    The change is applied to a copy-on-write copy of the tree which then
+    replaces the cached one, so callers still reading the old tree are not
+    affected. The tree is
+    dropped instead when it was not built from expected_version, it has missed
+    a change of another process and will be rebuilt on next use.
+    """
+
+    with _PROJECT_TREES_LOCK:
+        cached = _PROJECT_TREES.get(domain_id)
+        if cached and cached['version'] != expected_version:
+            del _PROJECT_TREES[domain_id]
+        elif cached:
+            try:
+                tree = cached['tree'].copy()
+                getattr(tree, func)(*args)
+                _PROJECT_TREES[domain_id] = dict(cached, tree=tree, version=version)
+            except Exception as e:
+                _LOGGER.error(f'[patch_project_tree] Failed to patch project tree. Drop it. '
+                              f'(domain_id={domain_id}, reason={e})')
+                del _PROJECT_TREES[domain_id]
+
+
+def invalidate_project_tree(domain_id):
+    with _PROJECT_TREES_LOCK:
+        _PROJECT_TREES.pop(domain_id, None)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import threading
+from collections import OrderedDict
+
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+__all__ = ['get_schema_validator', 'validate_data', 'invalidate_schema_validators']
+
+_MAX_VALIDATORS = 256
+
+_VALIDATORS = OrderedDict()
+_VALIDATORS_LOCK = threading.Lock()
+
+
+def get_schema_validator(provider, version, schema):
+    """ Return a compiled JSON schema validator of a provider
+
+    Checking a schema and building its validator costs far more than
+    validating one document, so one validator is kept per provider with the
+    version of the schema it was built from. A schema with another version
+    replaces it, which is how updates made by other workers are picked up.
+    """
+
+    with _VALIDATORS_LOCK:
+        cached_validator = _VALIDATORS.get(provider)
+        if cached_validator and cached_validator['version'] == version:
+            _VALIDATORS.move_to_end(provider)
+            return cached_validator['validator']
+
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+
+    with _VALIDATORS_LOCK:
+        _VALIDATORS[provider] = {
+            'version': version,
+            'validator': validator
+        }
+        _VALIDATORS.move_to_end(provider)
+
+        if len(_VALIDATORS) > _MAX_VALIDATORS:
+            _VALIDATORS.popitem(last=False)
+
+    return validator
+
+
+def validate_data(provider, version, schema, data):
+    """ Return the most relevant validation error message or None """
+
+    error = best_match(get_schema_validator(provider, version, schema).iter_errors(data))
+    return error.message if error else None
+
+
+def invalidate_schema_validators(provider):
+    with _VALIDATORS_LOCK:
+        _VALIDATORS.pop(provider, None)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from spaceone.core import config
+
+__all__ = ['VerifiedTokenCache', 'get_verified_token_cache']
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+class VerifiedTokenCache:
+    """ LRU of token claims which already passed signature verification
+
+    Entries are keyed by a digest of the token, never the token itself, and
+    of the version of the domain key which verified it, so a token is verified
+    again once the domain key changes. Entries are dropped when the token
+    expires.
+    """
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self._claims = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token, key_version):
+        token_digest = self._get_digest(token, key_version)
+
+        with self._lock:
+            claims = self._claims.get(token_digest)
+            if claims is None:
+                return None
+
+            if claims.get('exp', 0) <= time.time():
+                del self._claims[token_digest]
+                return None
+
+            self._claims.move_to_end(token_digest)
+            return claims
+
+    def set(self, token, key_version, claims):
+        if self.max_size <= 0 or 'exp' not in claims:
+            return
+
+        with self._lock:
+            self._claims[self._get_digest(token, key_version)] = claims
+            if len(self._claims) > self.max_size:
+                self._claims.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._claims = OrderedDict()
+
+    @staticmethod
+    def _get_digest(token, key_version):
+        if isinstance(token, str):
+            token = token.encode('utf-8')
+
+        return hashlib.sha256(f'{key_version}:'.encode('utf-8') + token).hexdigest()
+
+
+def get_verified_token_cache():
+    global _CACHE
+
+    if _CACHE is None:
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                identity_conf = config.get_global('IDENTITY') or {}
+                token_conf = identity_conf.get('token', {})
+                _CACHE = VerifiedTokenCache(max_size=token_conf.get('verified_cache_size', 10000))
+
+    return _CACHE
@@ -2,7 +2,9 @@ from spaceone.identity.manager.api_key_manager import APIKeyManager
 from spaceone.identity.manager.authorization_manager import AuthorizationManager
 from spaceone.identity.manager.domain_manager import DomainManager
 from spaceone.identity.manager.domain_secret_manager import DomainSecretManager
+from spaceone.identity.manager.login_throttle_manager import LoginThrottleManager
 from spaceone.identity.manager.provider_manager import ProviderManager
+from spaceone.identity.manager.refresh_token_manager import RefreshTokenManager
 from spaceone.identity.manager.service_account_manager import ServiceAccountManager
 from spaceone.identity.manager.policy_manager import PolicyManager
 from spaceone.identity.manager.project_group_manager import ProjectGroupManager
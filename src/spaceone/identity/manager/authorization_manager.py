@@ -1,9 +1,13 @@
-import fnmatch
-import functools
 import logging
 
+from spaceone.core import cache, utils
 from spaceone.core.manager import BaseManager
 from spaceone.core.error import *
+from spaceone.identity.model.policy_model import Policy
+from spaceone.identity.model.project_group_model import ProjectGroup, ProjectGroupMemberMap
+from spaceone.identity.model.project_model import Project, ProjectMemberMap
+from spaceone.identity.model.role_model import Role
+from spaceone.identity.model.user_model import User
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -13,9 +17,14 @@ class AuthorizationManager(BaseManager):
 
     def __init__(self, transaction):
         super().__init__(transaction)
+        self.user_model: User = self.locator.get_model('User')
+        self.role_model: Role = self.locator.get_model('Role')
+        self.project_model: Project = self.locator.get_model('Project')
+        self.project_group_model: ProjectGroup = self.locator.get_model('ProjectGroup')
+        self.project_map_model: ProjectMemberMap = self.locator.get_model('ProjectMemberMap')
+        self.project_group_map_model: ProjectGroupMemberMap = self.locator.get_model('ProjectGroupMemberMap')
 
     def change_parameter(self, role_type, parameter, user_id, domain_id, projects):
-        # if role_type == 'DOMAIN':
         if role_type in ['DOMAIN', 'PROJECT']:
             domain_id_param = parameter.get('domain_id')
             if domain_id_param is None:
@@ -23,20 +32,19 @@ class AuthorizationManager(BaseManager):
             else:
                 self._check_domain_id(domain_id_param, user_id, domain_id)
 
-        # elif role_type == 'PROJECT':
-        #     project_id_param = parameter.get('project_id')
-        #     if project_id_param is None:
-        #         parameter['project_id'] = projects
-        #     else:
-        #         self._check_project_id(project_id_param, user_id, projects)
+        if role_type == 'PROJECT':
+            project_id_param = parameter.get('project_id')
+            if project_id_param is None:
+                parameter['project_id'] = sorted(projects)
+            else:
+                self._check_project_id(project_id_param, user_id, projects)
 
         return parameter
 
-    def check_permissions(self, permissions, service, api_class, method, user_id):
-        try:
-            next(filter(functools.partial(
-                self._match_permission, service, api_class, method), permissions))
-        except:
+    def check_permissions(self, permission_matchers, service, api_class, method, user_id):
+        api = f'{service}.{api_class}.{method}'
+
+        if not any(matcher.match_api(api) for matcher in permission_matchers):
             _LOGGER.debug(f'[verify] Not matched permissions. '
                           f'(user_id={user_id}, api={service}.{api_class}.{method})')
             raise ERROR_PERMISSION_DENIED()
@@ -50,14 +58,163 @@ class AuthorizationManager(BaseManager):
 
     @staticmethod
     def _check_project_id(project_id_param, user_id, projects):
-        if project_id_param not in projects:
+        project_ids = project_id_param if isinstance(project_id_param, list) else [project_id_param]
+
+        if not all(project_id in projects for project_id in project_ids):
             _LOGGER.debug(f'[_check_project_id] project_id is not allowed.'
                           f' (user_id={user_id}, project_id={project_id_param})')
             raise ERROR_PERMISSION_DENIED()
 
+    def get_user_projects(self, user_id, domain_id):
+        cache_key = f'user-projects:{domain_id}:{user_id}'
+
+        if cache.is_set():
+            projects = cache.get(cache_key)
+            if projects is not None:
+                return set(projects)
+
+        user_vo = self.user_model.get(user_id=user_id, domain_id=domain_id)
+
+        project_refs = self.project_map_model.filter(user=user_vo).no_dereference().scalar('project')
+        project_group_refs = self.project_group_map_model.filter(user=user_vo).no_dereference().scalar('project_group')
+
+        projects = self._list_project_ids(list(map(_get_pk, project_refs)))
+        projects |= self._list_project_ids_in_project_groups(list(map(_get_pk, project_group_refs)), domain_id)
+
+        if cache.is_set():
+            cache.set(cache_key, sorted(projects), expire=86400)
+
+        return projects
+
+    def add_user_project_cache(self, user_id, domain_id, project_vo=None, project_group_vo=None):
+        def _rollback(key):
+            _LOGGER.info(f'[add_user_project_cache._rollback] Delete cache : {key}')
+            cache.delete(key)
+
+        if not cache.is_set():
+            return
+
+        cache_key = f'user-projects:{domain_id}:{user_id}'
+        projects = cache.get(cache_key)
+
+        if projects is not None:
+            projects = set(projects)
+
+            if project_vo:
+                projects.add(project_vo.project_id)
+
+            if project_group_vo:
+                projects |= self._get_project_tree(domain_id).get_projects([project_group_vo.project_group_id])
+
+            cache.set(cache_key, sorted(projects), expire=86400)
+            self.transaction.add_rollback(_rollback, cache_key)
+
+    def delete_user_project_cache(self, user_id, domain_id):
+        self._delete_cache(f'user-projects:{domain_id}:{user_id}')
+
+    def delete_project_group_member_cache(self, project_group_vo: ProjectGroup):
+        """ Delete user-projects cache of all users who can see the projects of a project group
+
+        Members of the project group itself and of every ancestor project group
+        inherit the projects, so all of them are invalidated.
+        """
+
+        project_tree = self._get_project_tree(project_group_vo.domain_id)
+        project_group_ids = project_tree.get_ancestors(project_group_vo.project_group_id, include_self=True)
+
+        project_group_pks = list(self.project_group_model.filter(project_group_id=project_group_ids,
+                                                                 domain_id=project_group_vo.domain_id).scalar('pk'))
+
+        user_refs = self.project_group_map_model.filter(project_group=project_group_pks).no_dereference().scalar('user')
+        self._delete_user_project_cache_by_user_pks(list(map(_get_pk, user_refs)))
+
+    def delete_project_member_cache(self, project_vo: Project):
+        user_refs = self.project_map_model.filter(project=project_vo).no_dereference().scalar('user')
+        self._delete_user_project_cache_by_user_pks(list(map(_get_pk, user_refs)))
+
+        if project_vo.project_group:
+            self.delete_project_group_member_cache(project_vo.project_group)
+
+    def _delete_user_project_cache_by_user_pks(self, user_pks):
+        if user_pks:
+            user_vos = self.user_model.filter(pk=user_pks).only('user_id', 'domain_id')
+            self._delete_cache(*[f'user-projects:{user_vo.domain_id}:{user_vo.user_id}' for user_vo in user_vos])
+
+    def _list_project_ids(self, project_pks):
+        if not project_pks:
+            return set()
+
+        return set(self.project_model.filter(pk=project_pks).scalar('project_id'))
+
+    def _list_project_ids_in_project_groups(self, project_group_pks, domain_id):
+        if not project_group_pks:
+            return set()
+
+        project_group_ids = self.project_group_model.filter(pk=project_group_pks).scalar('project_group_id')
+        return self._get_project_tree(domain_id).get_projects(list(project_group_ids))
+
+    def _get_project_tree(self, domain_id):
+        return self.locator.get_manager('ProjectGroupManager').get_project_tree(domain_id)
+
+    def get_permission_generation(self, domain_id):
+        """ Return the generation of the effective permissions of a domain
+
+        Effective permissions are cached under the generation of their domain,
+        so a role or policy change invalidates all of them by starting a new
+        generation instead of deleting the cache of every user. A missing
+        generation also starts a new one, so entries of an evicted generation
+        are never read again.
+        """
+
+        if not cache.is_set():
+            return None
+
+        generation = cache.get(f'permission-generation:{domain_id}')
+        if generation is None:
+            generation = self._set_permission_generation(domain_id)
+
+        return generation
+
+    def delete_user_cache(self, user_id, domain_id):
+        generation = self.get_permission_generation(domain_id)
+        self._delete_cache(f'effective-permission:{domain_id}:{generation}:{user_id}',
+                           f'user-projects:{domain_id}:{user_id}')
+
+    def delete_role_cache(self, role_vo: Role):
+        self._delete_cache(f'role-permission:{role_vo.domain_id}:{role_vo.role_id}')
+        self._start_permission_generation(role_vo.domain_id)
+
+    def delete_policy_cache(self, policy_vo: Policy):
+        role_ids = self.role_model.filter(policies__policy=policy_vo, domain_id=policy_vo.domain_id).scalar('role_id')
+        self._delete_cache(*[f'role-permission:{policy_vo.domain_id}:{role_id}' for role_id in role_ids])
+        self._start_permission_generation(policy_vo.domain_id)
+
+    def _start_permission_generation(self, domain_id):
+        def _rollback(rollback_domain_id):
+            _LOGGER.info(f'[_start_permission_generation._rollback] Start permission generation : '
+                         f'{rollback_domain_id}')
+            self._set_permission_generation(rollback_domain_id)
+
+        if cache.is_set():
+            self._set_permission_generation(domain_id)
+            self.transaction.add_rollback(_rollback, domain_id)
+
     @staticmethod
-    def _match_permission(service, api_class, method, permission):
-        if fnmatch.fnmatch(f'{service}.{api_class}.{method}', permission):
-            return True
-        else:
-            return False
\ No newline at end of file
+    def _set_permission_generation(domain_id):
+        generation = utils.generate_id('generation')
+        cache.set(f'permission-generation:{domain_id}', generation)
+        return generation
+
+    def _delete_cache(self, *cache_keys):
+        def _rollback(keys):
+            _LOGGER.info(f'[_delete_cache._rollback] Delete cache : {keys}')
+            cache.delete(*keys)
+
+        if cache.is_set() and cache_keys:
+            _LOGGER.debug(f'[_delete_cache] Delete cache : {cache_keys}')
+            cache.delete(*cache_keys)
+            self.transaction.add_rollback(_rollback, cache_keys)
+
+
+def _get_pk(reference):
+    return getattr(reference, 'id', reference)
@@ -1,5 +1,6 @@
 import logging
 
+from spaceone.core import cache
 from spaceone.core.manager import BaseManager
 
 from spaceone.identity.connector import PluginServiceConnector, AuthPluginConnector
@@ -38,6 +39,7 @@ class DomainManager(BaseManager):
         def _rollback(old_data):
             _LOGGER.info(f'[update_domain._rollback] Revert Data : {old_data["name"]} ({old_data["domain_id"]})')
             domain_vo.update(old_data)
+            self.delete_domain_descriptor_cache(domain_vo.domain_id)
 
         domain_vo: Domain = self.get_domain(params['domain_id'])
 
@@ -67,22 +69,28 @@ class DomainManager(BaseManager):
                 plugin_info['metadata'] = result['metadata']
                 params['plugin_info'] = plugin_info
 
-        return domain_vo.update(params)
+        domain_vo = domain_vo.update(params)
+        self.delete_domain_descriptor_cache(domain_id)
+
+        return domain_vo
 
     def delete_domain(self, domain_id):
         domain_vo: Domain = self.get_domain(domain_id)
         domain_vo.delete()
+        self.delete_domain_descriptor_cache(domain_id)
 
     def enable_domain(self, domain_id):
         def _rollback(old_data):
             _LOGGER.info(f'[enable_domain._rollback] Revert Data : {old_data["name"]} ({old_data["domain_id"]})')
             domain_vo.update(old_data)
+            self.delete_domain_descriptor_cache(domain_vo.domain_id)
 
         domain_vo: Domain = self.get_domain(domain_id)
 
         if domain_vo.state != 'ENABLED':
             self.transaction.add_rollback(_rollback, domain_vo.to_dict())
-            domain_vo.update({'state': 'ENABLED'})
+            domain_vo = domain_vo.update({'state': 'ENABLED'})
+            self.delete_domain_descriptor_cache(domain_id)
 
         return domain_vo
 
@@ -90,18 +98,37 @@ class DomainManager(BaseManager):
         def _rollback(old_data):
             _LOGGER.info(f'[disable_domain._rollback] Revert Data : {old_data["name"]} ({old_data["domain_id"]})')
             domain_vo.update(old_data)
+            self.delete_domain_descriptor_cache(domain_vo.domain_id)
 
         domain_vo: Domain = self.get_domain(domain_id)
 
         if domain_vo.state != 'DISABLED':
             self.transaction.add_rollback(_rollback, domain_vo.to_dict())
-            domain_vo.update({'state': 'DISABLED'})
+            domain_vo = domain_vo.update({'state': 'DISABLED'})
+            self.delete_domain_descriptor_cache(domain_id)
 
         return domain_vo
 
     def get_domain(self, domain_id, only=None):
         return self.domain_model.get(domain_id=domain_id, only=only)
 
+    @cache.cacheable(key='domain-descriptor:{domain_id}', expire=300)
+    def get_domain_descriptor(self, domain_id):
+        """ Return a compact, cacheable view of a domain
+
+        Token issuance only needs the state and the authentication plugin of a
+        domain, so these are served from the cache instead of reading the
+        whole domain document on every login and refresh.
+        """
+
+        domain_vo: Domain = self.get_domain(domain_id, only=['domain_id', 'state', 'plugin_info'])
+        return self._make_domain_descriptor(domain_vo)
+
+    @staticmethod
+    def delete_domain_descriptor_cache(domain_id):
+        if cache.is_set():
+            cache.delete(f'domain-descriptor:{domain_id}')
+
     def list_domains(self, query):
         return self.domain_model.query(**query)
 
@@ -123,3 +150,22 @@ class DomainManager(BaseManager):
         #result = auth.verify(params.get("options"), params.get("credentials"))
         result = auth.init(params.get("options"))
         return result
+
+    @staticmethod
+    def _make_domain_descriptor(domain_vo):
+        plugin_info = None
+
+        if domain_vo.plugin_info:
+            plugin_info = {
+                'plugin_id': domain_vo.plugin_info.plugin_id,
+                'version': domain_vo.plugin_info.version,
+                'options': dict(domain_vo.plugin_info.options or {}),
+                'secret_id': domain_vo.plugin_info.secret_id
+            }
+
+        return {
+            'domain_id': domain_vo.domain_id,
+            'state': domain_vo.state,
+            'auth_type': 'EXTERNAL' if plugin_info else 'LOCAL',
+            'plugin_info': plugin_info
+        }
@@ -0,0 +1,211 @@
+import ipaddress
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+from spaceone.identity.error.error_authentication import *
+from spaceone.identity.lib.cache_connection import get_redis_connection
+
+_LOGGER = logging.getLogger(__name__)
+
+_LOCAL_COUNTERS = None
+_LOCAL_COUNTERS_LOCK = threading.Lock()
+
+
+class _LocalCounters:
+    """ Failure counters of this process, used when there is no redis cache
+
+    A counter expires `expire` seconds after its last increase, like the
+    redis ones. The number of counters is bounded by max_size and the least
+    recently increased are dropped first, so a flood of distinct users or
+    sources can drop a counter: the local throttle is best-effort and is
+    only shared by the workers of one process.
+    """
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self._counters = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            count, expired_at = self._counters.get(key, (0, 0))
+
+        return count if expired_at > time.time() else 0
+
+    def incr(self, key, expire):
+        now = time.time()
+
+        with self._lock:
+            count, expired_at = self._counters.pop(key, (0, 0))
+            self._counters[key] = ((count if expired_at > now else 0) + 1, now + expire)
+            while len(self._counters) > self.max_size:
+                self._counters.popitem(last=False)
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._counters.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._counters = OrderedDict()
+
+
+def _get_local_counters(max_size):
+    global _LOCAL_COUNTERS
+
+    if _LOCAL_COUNTERS is None:
+        with _LOCAL_COUNTERS_LOCK:
+            if _LOCAL_COUNTERS is None:
+                _LOCAL_COUNTERS = _LocalCounters(max_size=max_size)
+
+    return _LOCAL_COUNTERS
+
+
+class LoginThrottleManager(BaseManager):
+    """ Sliding window counter of failed logins per user and per source
+
+    Failures are counted in fixed buckets of `bucket` seconds and a login is
+    rejected when the buckets of the last `window` seconds add up to the
+    limit. Only counters are read, so rejected requests never reach the
+    password check or the database.
+
+    The user counter is kept per user and source, so failures from one
+    address do not lock the account out for everyone else. A limit across
+    all sources can be set with max_global_user_failures (0 = disabled).
+
+    On redis, a counter is increased and its expiry renewed by INCR and
+    EXPIRE in one MULTI/EXEC, so concurrent failures are all counted.
+    Without redis, counters are kept in the process (see _LocalCounters).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        identity_conf = config.get_global('IDENTITY') or {}
+        throttle_conf = identity_conf.get('login_throttle', {})
+
+        self.window = throttle_conf.get('window', 300)
+        self.bucket = throttle_conf.get('bucket', 60)
+        self.limits = {
+            'user': throttle_conf.get('max_user_failures', 10),
+            'global_user': throttle_conf.get('max_global_user_failures', 0),
+            'source': throttle_conf.get('max_source_failures', 100)
+        }
+        self.trusted_proxies = [ipaddress.ip_network(proxy, strict=False)
+                                for proxy in throttle_conf.get('trusted_proxies', [])]
+        self.redis = get_redis_connection()
+        self.local_counters = _get_local_counters(throttle_conf.get('local_max_counters', 10000))
+
+    def get_login_source(self, peer, forwarded_for=None):
+        """ Return the client address of a login
+
+        The transport peer is used unless it is a trusted proxy. In that case
+        X-Forwarded-For is read from the right and the first address which is
+        not a trusted proxy is the client, since hops on the left can be set
+        by the client itself.
+        """
+
+        source = self._parse_peer(peer)
+
+        if forwarded_for and self._is_trusted_proxy(source):
+            for address in reversed([address.strip() for address in forwarded_for.split(',')]):
+                if address:
+                    source = address
+                    if not self._is_trusted_proxy(address):
+                        break
+
+        return source
+
+    def check_login(self, domain_id, user_id, source=None):
+        for counter_type, counter_id in self._get_counters(domain_id, user_id, source):
+            if self._get_failure_count(counter_type, counter_id) >= self.limits[counter_type]:
+                _LOGGER.warning(f'[check_login] Too many login failures. '
+                                f'({counter_type}={counter_id}, window={self.window})')
+                raise ERROR_TOO_MANY_LOGIN_FAILURES()
+
+    def add_failure(self, domain_id, user_id, source=None):
+        current_bucket = int(time.time() // self.bucket)
+        for counter_type, counter_id in self._get_counters(domain_id, user_id, source):
+            self._increase_counter(f'login-failure:{counter_type}:{counter_id}:{current_bucket}')
+
+    def reset_user_failures(self, domain_id, user_id, source=None):
+        """ Reset the failures of a user from a source after a successful login
+
+        The counter across all sources is left to expire, so a success does
+        not clear the failures made from other sources.
+        """
+
+        if user_id:
+            current_bucket = int(time.time() // self.bucket)
+            cache_keys = [f'login-failure:user:{self._get_user_counter_id(domain_id, user_id, source)}:{bucket}'
+                          for bucket in self._get_window_buckets(current_bucket)]
+
+            if self.redis is not None:
+                self.redis.delete(*cache_keys)
+            else:
+                self.local_counters.delete(*cache_keys)
+
+    def _get_failure_count(self, counter_type, counter_id):
+        current_bucket = int(time.time() // self.bucket)
+        return sum(self._get_counter(f'login-failure:{counter_type}:{counter_id}:{bucket}')
+                   for bucket in self._get_window_buckets(current_bucket))
+
+    def _get_counter(self, cache_key):
+        if self.redis is not None:
+            return int(self.redis.get(cache_key) or 0)
+        else:
+            return self.local_counters.get(cache_key)
+
+    def _increase_counter(self, cache_key):
+        if self.redis is not None:
+            with self.redis.pipeline() as pipe:
+                pipe.incr(cache_key)
+                pipe.expire(cache_key, self.window + self.bucket)
+                pipe.execute()
+        else:
+            self.local_counters.incr(cache_key, self.window + self.bucket)
+
+    def _is_trusted_proxy(self, address):
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+
+        return any(ip in proxy for proxy in self.trusted_proxies)
+
+    @staticmethod
+    def _parse_peer(peer):
+        # ipv4:10.0.0.1:50051 -> 10.0.0.1, ipv6:[::1]:50051 -> ::1
+        if not peer:
+            return None
+
+        scheme, _, address = peer.partition(':')
+        if scheme in ['ipv4', 'ipv6']:
+            return address.rsplit(':', 1)[0].strip('[]')
+
+        return peer
+
+    def _get_window_buckets(self, current_bucket):
+        return range(current_bucket - self.window // self.bucket + 1, current_bucket + 1)
+
+    def _get_counters(self, domain_id, user_id, source):
+        counters = []
+
+        if user_id:
+            counters.append(('user', self._get_user_counter_id(domain_id, user_id, source)))
+            counters.append(('global_user', f'{domain_id}:{user_id}'))
+
+        if source:
+            counters.append(('source', source))
+
+        return [(counter_type, counter_id) for counter_type, counter_id in counters
+                if self.limits[counter_type] > 0]
+
+    @staticmethod
+    def _get_user_counter_id(domain_id, user_id, source):
+        return f'{domain_id}:{user_id}:{source or ""}'
+
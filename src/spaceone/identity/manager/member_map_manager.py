@@ -0,0 +1,92 @@
+import logging
+from spaceone.core.manager import BaseManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MemberMapManager(BaseManager):
+    """ Bulk member changes shared by ProjectManager and ProjectGroupManager
+
+    Subclasses set member_target to the reference field of the member map
+    ('project' or 'project_group') and member_map_model to the map model.
+    """
+
+    member_target = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.member_map_model = None
+
+    def add_members(self, target_vo, members):
+        """ Add members who are not in the target yet with one bulk insert
+
+        Args:
+            members (list): [{'user': user_vo, 'roles': role_vos, 'labels': list}, ...]
+
+        Returns:
+            user_ids of members which already exist in the target
+        """
+
+        def _rollback(member_pks):
+            _LOGGER.info(f'[add_members._rollback] Delete {self.member_target} members : '
+                         f'{self._get_target_id(target_vo)} ({len(member_pks)} members)')
+            self.member_map_model.filter(pk=member_pks).delete()
+
+        if not members:
+            return set()
+
+        user_refs = self.member_map_model.filter(**{self.member_target: target_vo},
+                                                 user=[member['user'].pk for member in members])\
+            .no_dereference().scalar('user')
+        exist_user_pks = set(getattr(user_ref, 'id', user_ref) for user_ref in user_refs)
+
+        new_members = [member for member in members if member['user'].pk not in exist_user_pks]
+
+        if new_members:
+            member_vos = self.member_map_model.objects.insert(
+                [self.member_map_model(**{self.member_target: target_vo}, **member) for member in new_members])
+            self.transaction.add_rollback(_rollback, [vo.pk for vo in member_vos])
+
+            auth_mgr = self._get_authorization_manager()
+            for member in new_members:
+                auth_mgr.add_user_project_cache(member['user'].user_id, target_vo.domain_id,
+                                                **{f'{self.member_target}_vo': target_vo})
+
+        return set(member['user'].user_id for member in members if member['user'].pk in exist_user_pks)
+
+    def remove_members(self, target_vo, user_vos):
+        """ Remove members of users with one bulk delete
+
+        Returns:
+            user_ids of removed members
+        """
+
+        def _rollback(member_docs):
+            _LOGGER.info(f'[remove_members._rollback] Restore {self.member_target} members : '
+                         f'{self._get_target_id(target_vo)} ({len(member_docs)} members)')
+            self.member_map_model._get_collection().insert_many(member_docs)
+
+        member_vos = list(self.member_map_model.filter(**{self.member_target: target_vo},
+                                                       user=[user_vo.pk for user_vo in user_vos])
+                          .no_dereference())
+
+        if not member_vos:
+            return set()
+
+        self.member_map_model.filter(pk=[vo.pk for vo in member_vos]).delete()
+        self.transaction.add_rollback(_rollback, [vo.to_mongo() for vo in member_vos])
+
+        removed_user_pks = set(getattr(vo.user, 'id', vo.user) for vo in member_vos)
+        removed_user_ids = set(user_vo.user_id for user_vo in user_vos if user_vo.pk in removed_user_pks)
+
+        auth_mgr = self._get_authorization_manager()
+        for user_id in removed_user_ids:
+            auth_mgr.delete_user_project_cache(user_id, target_vo.domain_id)
+
+        return removed_user_ids
+
+    def _get_target_id(self, target_vo):
+        return getattr(target_vo, f'{self.member_target}_id')
+
+    def _get_authorization_manager(self):
+        return self.locator.get_manager('AuthorizationManager')
@@ -31,10 +31,13 @@ class PolicyManager(BaseManager):
         self.transaction.add_rollback(_rollback, policy_vo.to_dict())
 
         policy_vo = policy_vo.update(params)
+        self._delete_authorization_cache(policy_vo)
+
         return policy_vo
 
     def delete_policy(self, policy_id, domain_id):
         policy_vo: Policy = self.get_policy(policy_id, domain_id)
+        self._delete_authorization_cache(policy_vo)
         policy_vo.delete()
 
     def get_policy(self, policy_id, domain_id, only=None):
@@ -45,3 +48,7 @@ class PolicyManager(BaseManager):
 
     def stat_policies(self, query):
         return self.policy_model.stat(**query)
+
+    def _delete_authorization_cache(self, policy_vo):
+        auth_mgr = self.locator.get_manager('AuthorizationManager')
+        auth_mgr.delete_policy_cache(policy_vo)
@@ -1,16 +1,34 @@
 import logging
-from spaceone.core.manager import BaseManager
-from spaceone.identity.model.project_group_model import ProjectGroup, ProjectGroupMemberMap
+from datetime import datetime
+from pymongo import UpdateOne
+from spaceone.core import cache, config, utils
+from spaceone.identity.error.error_project import *
+from spaceone.identity.manager.member_map_manager import MemberMapManager
+from spaceone.identity.lib.cache_connection import get_redis_connection
+from spaceone.identity.lib.project_tree import ProjectTree, get_project_tree, patch_project_tree, \
+    invalidate_project_tree
+from spaceone.identity.model.project_group_model import ProjectGroup, ProjectGroupMemberMap, \
+    ProjectGroupPathVersion
 
 _LOGGER = logging.getLogger(__name__)
 
+# Version of the project_group_path layout, recorded per domain in ProjectGroupPathVersion
+_PROJECT_GROUP_PATH_VERSION = 1
 
-class ProjectGroupManager(BaseManager):
+# Domains whose project group paths were checked by this process
+_INITIALIZED_PATH_DOMAINS = set()
+
+
+class ProjectGroupManager(MemberMapManager):
+
+    member_target = 'project_group'
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.project_group_model: ProjectGroup = self.locator.get_model('ProjectGroup')
         self.project_group_map_model: ProjectGroupMemberMap = self.locator.get_model('ProjectGroupMemberMap')
+        self.member_map_model = self.project_group_map_model
+        self.path_version_model: ProjectGroupPathVersion = self.locator.get_model('ProjectGroupPathVersion')
 
     def create_project_group(self, params):
         def _rollback(project_group_vo):
@@ -18,9 +36,19 @@ class ProjectGroupManager(BaseManager):
                 f'[create_project_group._rollback] Delete project group : {project_group_vo.name} ({project_group_vo.project_group_id})')
             project_group_vo.delete()
 
+        self.init_project_group_paths(params['domain_id'])
+
+        params['project_group_id'] = utils.generate_id('pg')
+        params['project_group_path'] = self._make_project_group_path(params['project_group_id'],
+                                                                     params.get('parent_project_group'))
+
         project_group_vo: ProjectGroup = self.project_group_model.create(params)
         self.transaction.add_rollback(_rollback, project_group_vo)
 
+        parent_project_group_vo = params.get('parent_project_group')
+        self.patch_project_tree(project_group_vo.domain_id, 'add_project_group', project_group_vo.project_group_id,
+                                parent_project_group_vo.project_group_id if parent_project_group_vo else None)
+
         return project_group_vo
 
     def update_project_group(self, params):
@@ -34,7 +62,32 @@ class ProjectGroupManager(BaseManager):
 
         self.transaction.add_rollback(_rollback, project_group_vo.to_dict())
 
-        return project_group_vo.update(params)
+        if 'parent_project_group' in params:
+            auth_mgr = self._get_authorization_manager()
+            auth_mgr.delete_project_group_member_cache(project_group_vo)
+
+            self.init_project_group_paths(project_group_vo.domain_id)
+
+            if not project_group_vo.project_group_path:
+                project_group_vo.reload()
+
+            old_path = list(project_group_vo.project_group_path)
+            params['project_group_path'] = self._make_project_group_path(project_group_vo.project_group_id,
+                                                                         params['parent_project_group'])
+
+            project_group_vo = project_group_vo.update(params)
+            self._move_child_project_group_paths(project_group_vo, old_path)
+
+            parent_project_group_vo = params['parent_project_group']
+            self.patch_project_tree(project_group_vo.domain_id, 'move_project_group',
+                                    project_group_vo.project_group_id,
+                                    parent_project_group_vo.project_group_id if parent_project_group_vo else None)
+
+            auth_mgr.delete_project_group_member_cache(project_group_vo)
+
+            return project_group_vo
+        else:
+            return project_group_vo.update(params)
 
     def delete_project_group(self, project_group_id, domain_id):
         project_group_vo = self.get_project_group(project_group_id, domain_id)
@@ -46,24 +99,247 @@ class ProjectGroupManager(BaseManager):
     def list_project_groups(self, query):
         return self.project_group_model.query(**query)
 
+    def list_child_project_groups(self, project_group_vo, include_self=False):
+        """ Return all descendants of a project group with a single query on project_group_path """
+
+        self.init_project_group_paths(project_group_vo.domain_id)
+
+        project_group_vos = self.project_group_model.filter(project_group_path=project_group_vo.project_group_id,
+                                                            domain_id=project_group_vo.domain_id)
+
+        if not include_self:
+            project_group_vos = project_group_vos.filter(project_group_id__ne=project_group_vo.project_group_id)
+
+        return project_group_vos
+
+    def get_project_tree(self, domain_id) -> ProjectTree:
+        """ Return the in-memory project group hierarchy of a domain
+
+        Changes of other processes are seen through the tree version kept in
+        the shared (redis) cache. Without it they are only seen when the tree
+        expires, so the shorter `local_ttl` bounds how stale a tree can be.
+        """
+
+        tree_conf = self._get_project_tree_conf()
+
+        if get_redis_connection() is not None:
+            ttl = tree_conf.get('ttl', 300)
+        else:
+            ttl = tree_conf.get('local_ttl', 30)
+
+        return get_project_tree(domain_id, lambda: self._load_project_tree(domain_id), ttl=ttl,
+                                version=self._get_project_tree_version(domain_id),
+                                max_depth=tree_conf.get('max_depth', 20))
+
+    def check_parent_project_group(self, project_group_id, parent_project_group_vo, domain_id):
+        """ Reject a parent which would create a cycle or a hierarchy deeper than max_depth
+
+        The ancestors of the new parent are walked upward on the project tree,
+        the project group must not be one of them.
+        """
+
+        if parent_project_group_vo is None:
+            return
+
+        max_depth = self._get_project_tree_conf().get('max_depth', 20)
+        parent_project_group_id = parent_project_group_vo.project_group_id
+        project_tree = self.get_project_tree(domain_id)
+
+        ancestors = project_tree.get_ancestors(parent_project_group_id, include_self=True)
+
+        if project_group_id in ancestors or project_group_id in (parent_project_group_vo.project_group_path or []):
+            raise ERROR_PROJECT_GROUP_CYCLE(project_group_id=project_group_id,
+                                            parent_project_group_id=parent_project_group_id)
+
+        height = max(project_tree.get_height(project_group_id), 1) if project_group_id else 1
+        if len(ancestors) + height > max_depth:
+            raise ERROR_PROJECT_GROUP_MAX_DEPTH(project_group_id=project_group_id or parent_project_group_id,
+                                                max_depth=max_depth)
+
+    def patch_project_tree(self, domain_id, func, *args):
+        def _rollback(rollback_domain_id):
+            _LOGGER.info(f'[patch_project_tree._rollback] Invalidate project tree : {rollback_domain_id}')
+            invalidate_project_tree(rollback_domain_id)
+            self._set_project_tree_version(rollback_domain_id)
+
+        old_version = self._get_project_tree_version(domain_id)
+        new_version = self._set_project_tree_version(domain_id)
+        patch_project_tree(domain_id, func, *args, expected_version=old_version, version=new_version)
+
+        self.transaction.add_rollback(_rollback, domain_id)
+
+    def init_project_group_paths(self, domain_id):
+        """ Fill project_group_path of project groups created before the path was maintained
+
+        A domain is migrated once: the path version stored in
+        ProjectGroupPathVersion marks it as done for every process, and this
+        process does not look it up again.
+        """
+
+        if domain_id in _INITIALIZED_PATH_DOMAINS:
+            return
+
+        path_version_vos = self.path_version_model.filter(domain_id=domain_id)
+        if path_version_vos.count() == 0 or path_version_vos[0].version < _PROJECT_GROUP_PATH_VERSION:
+            self._init_project_group_paths(domain_id)
+
+            # Upsert, since another process can migrate the same domain concurrently.
+            self.path_version_model._get_collection().update_one({'domain_id': domain_id}, {
+                '$set': {'version': _PROJECT_GROUP_PATH_VERSION, 'updated_at': datetime.utcnow()}
+            }, upsert=True)
+
+        _INITIALIZED_PATH_DOMAINS.add(domain_id)
+
+    def _init_project_group_paths(self, domain_id):
+        if self.project_group_model.filter(domain_id=domain_id, project_group_path__size=0).count() > 0:
+            _LOGGER.debug(f'[init_project_group_paths] Rebuild project group paths. (domain_id={domain_id})')
+
+            project_group_vos = list(self.project_group_model.filter(domain_id=domain_id).no_dereference())
+            parents = {vo.pk: getattr(vo.parent_project_group, 'id', vo.parent_project_group)
+                       for vo in project_group_vos}
+            project_group_ids = {vo.pk: vo.project_group_id for vo in project_group_vos}
+
+            updates = []
+            for vo in project_group_vos:
+                path = []
+                pk = vo.pk
+                while pk in project_group_ids and project_group_ids[pk] not in path:
+                    path.insert(0, project_group_ids[pk])
+                    pk = parents[pk]
+
+                if path != list(vo.project_group_path):
+                    updates.append(UpdateOne({'_id': vo.pk}, {'$set': {'project_group_path': path}}))
+
+            if updates:
+                self.project_group_model._get_collection().bulk_write(updates, ordered=False)
+
     def stat_project_groups(self, query):
         return self.project_group_model.stat(**query)
 
-    @staticmethod
-    def delete_project_group_by_vo(project_group_vo):
+    def delete_project_group_by_vo(self, project_group_vo):
+        self._get_authorization_manager().delete_project_group_member_cache(project_group_vo)
         project_group_vo.delete()
 
-    @staticmethod
-    def add_member(project_group_vo, user_vo, roles, labels):
-        return project_group_vo.append('members', {
+        self.patch_project_tree(project_group_vo.domain_id, 'remove_project_group', project_group_vo.project_group_id)
+
+    def add_member(self, project_group_vo, user_vo, roles, labels):
+        project_group_member_vo = project_group_vo.append('members', {
             'user': user_vo,
             'roles': roles,
             'labels': labels
         })
 
-    @staticmethod
-    def remove_member(project_group_vo, project_group_member_vo):
+        self._get_authorization_manager().add_user_project_cache(user_vo.user_id, project_group_vo.domain_id,
+                                                                 project_group_vo=project_group_vo)
+
+        return project_group_member_vo
+
+    def update_member(self, project_group_member_vo, roles, labels):
+        def _rollback(old_data):
+            _LOGGER.info(f'[update_member._rollback] Revert member : {project_group_member_vo.user.user_id}')
+            project_group_member_vo.update(old_data)
+
+        self.transaction.add_rollback(_rollback, {
+            'roles': list(project_group_member_vo.roles),
+            'labels': list(project_group_member_vo.labels)
+        })
+
+        return project_group_member_vo.update({
+            'roles': roles,
+            'labels': labels
+        })
+
+    def remove_member(self, project_group_vo, project_group_member_vo):
+        user_id = project_group_member_vo.user.user_id
         project_group_vo.remove('members', project_group_member_vo)
 
+        self._get_authorization_manager().delete_user_project_cache(user_id, project_group_vo.domain_id)
+
     def list_project_group_members(self, query):
         return self.project_group_map_model.query(**query)
+
+    def _move_child_project_group_paths(self, project_group_vo, old_path):
+        def _rollback():
+            _LOGGER.info(f'[_move_child_project_group_paths._rollback] Revert project group paths : '
+                         f'{project_group_vo.project_group_id}')
+            self._replace_child_project_group_paths(project_group_vo, new_path, old_path)
+
+        new_path = list(project_group_vo.project_group_path)
+        if new_path == old_path:
+            return
+
+        self._replace_child_project_group_paths(project_group_vo, old_path, new_path)
+        self.transaction.add_rollback(_rollback)
+
+    def _replace_child_project_group_paths(self, project_group_vo, old_path, new_path):
+        """ Replace the path prefix of all descendants with one update_many
+
+        Every descendant path starts with old_path, the path of the moved
+        project group, so the rest of the path is kept with $slice. An update
+        with an aggregation pipeline needs MongoDB 4.2 or later.
+        """
+
+        self.project_group_model._get_collection().update_many({
+            'domain_id': project_group_vo.domain_id,
+            'project_group_path': project_group_vo.project_group_id,
+            'project_group_id': {'$ne': project_group_vo.project_group_id}
+        }, [{
+            '$set': {
+                'project_group_path': {
+                    '$concatArrays': [new_path, {
+                        '$slice': ['$project_group_path', len(old_path), {'$size': '$project_group_path'}]
+                    }]
+                }
+            }
+        }])
+
+    def _load_project_tree(self, domain_id):
+        project_group_vos = list(self.project_group_model.filter(domain_id=domain_id).only(
+            'project_group_id', 'parent_project_group').no_dereference())
+        project_group_ids = {vo.pk: vo.project_group_id for vo in project_group_vos}
+
+        project_groups = []
+        for vo in project_group_vos:
+            parent_pk = getattr(vo.parent_project_group, 'id', vo.parent_project_group)
+            project_groups.append((vo.project_group_id, project_group_ids.get(parent_pk)))
+
+        project_model = self.locator.get_model('Project')
+        project_vos = project_model.filter(domain_id=domain_id).only('project_id', 'project_group').no_dereference()
+
+        projects = []
+        for vo in project_vos:
+            project_group_pk = getattr(vo.project_group, 'id', vo.project_group)
+            projects.append((vo.project_id, project_group_ids.get(project_group_pk)))
+
+        return project_groups, projects
+
+    @staticmethod
+    def _get_project_tree_conf():
+        identity_conf = config.get_global('IDENTITY') or {}
+        return identity_conf.get('project_tree', {})
+
+    @staticmethod
+    def _get_project_tree_version(domain_id):
+        if cache.is_set():
+            return cache.get(f'project-tree:version:{domain_id}')
+
+        return None
+
+    @staticmethod
+    def _set_project_tree_version(domain_id):
+        if cache.is_set():
+            version = utils.generate_id('version')
+            cache.set(f'project-tree:version:{domain_id}', version, expire=86400)
+            return version
+
+        return None
+
+    @staticmethod
+    def _make_project_group_path(project_group_id, parent_project_group_vo=None):
+        if parent_project_group_vo:
+            if not parent_project_group_vo.project_group_path:
+                parent_project_group_vo.reload()
+
+            return list(parent_project_group_vo.project_group_path) + [project_group_id]
+        else:
+            return [project_group_id]
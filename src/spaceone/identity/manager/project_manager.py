@@ -1,18 +1,21 @@
 import logging
-from spaceone.core.manager import BaseManager
+from spaceone.identity.manager.member_map_manager import MemberMapManager
 from spaceone.identity.model.project_model import Project, ProjectMemberMap
 from spaceone.identity.model.project_group_model import ProjectGroup
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class ProjectManager(BaseManager):
+class ProjectManager(MemberMapManager):
+
+    member_target = 'project'
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.project_model: Project = self.locator.get_model('Project')
         self.project_group_model: ProjectGroup = self.locator.get_model('ProjectGroup')
         self.project_map_model: ProjectMemberMap = self.locator.get_model('ProjectMemberMap')
+        self.member_map_model = self.project_map_model
 
     def create_project(self, params):
         def _rollback(project_vo):
@@ -22,6 +25,11 @@ class ProjectManager(BaseManager):
         project_vo: Project = self.project_model.create(params)
         self.transaction.add_rollback(_rollback, project_vo)
 
+        self._patch_project_tree(project_vo, 'add_project')
+
+        if project_vo.project_group:
+            self._get_authorization_manager().delete_project_group_member_cache(project_vo.project_group)
+
         return project_vo
 
     def update_project(self, params):
@@ -35,36 +43,82 @@ class ProjectManager(BaseManager):
 
         self.transaction.add_rollback(_rollback, project_vo.to_dict())
 
-        return project_vo.update(params)
+        if 'project_group' in params:
+            auth_mgr = self._get_authorization_manager()
+            auth_mgr.delete_project_member_cache(project_vo)
+
+            project_vo = project_vo.update(params)
+
+            if project_vo.project_group:
+                auth_mgr.delete_project_group_member_cache(project_vo.project_group)
+
+            self._patch_project_tree(project_vo, 'move_project')
+
+            return project_vo
+        else:
+            return project_vo.update(params)
 
     def delete_project(self, project_id, domain_id):
         project_vo = self.get_project(project_id, domain_id)
         self.delete_project_by_vo(project_vo)
 
-    @staticmethod
-    def delete_project_by_vo(project_vo):
+    def delete_project_by_vo(self, project_vo):
+        self._get_authorization_manager().delete_project_member_cache(project_vo)
         project_vo.delete()
 
+        project_group_mgr = self.locator.get_manager('ProjectGroupManager')
+        project_group_mgr.patch_project_tree(project_vo.domain_id, 'remove_project', project_vo.project_id)
+
     def get_project(self, project_id, domain_id, only=None):
         return self.project_model.get(project_id=project_id, domain_id=domain_id, only=only)
 
     def list_projects(self, query):
         return self.project_model.query(**query)
 
+    def list_projects_by_ids(self, project_ids, domain_id):
+        return self.project_model.filter(project_id=project_ids, domain_id=domain_id)
+
     def stat_projects(self, query):
         return self.project_model.stat(**query)
 
-    @staticmethod
-    def add_member(project_vo, user_vo, roles, labels):
-        return project_vo.append('members', {
+    def add_member(self, project_vo, user_vo, roles, labels):
+        project_member_vo = project_vo.append('members', {
             'user': user_vo,
             'roles': roles,
             'labels': labels
         })
 
-    @staticmethod
-    def remove_member(project_vo, project_member_vo):
+        self._get_authorization_manager().add_user_project_cache(user_vo.user_id, project_vo.domain_id,
+                                                                 project_vo=project_vo)
+
+        return project_member_vo
+
+    def update_member(self, project_member_vo, roles, labels):
+        def _rollback(old_data):
+            _LOGGER.info(f'[update_member._rollback] Revert member : {project_member_vo.user.user_id}')
+            project_member_vo.update(old_data)
+
+        self.transaction.add_rollback(_rollback, {
+            'roles': list(project_member_vo.roles),
+            'labels': list(project_member_vo.labels)
+        })
+
+        return project_member_vo.update({
+            'roles': roles,
+            'labels': labels
+        })
+
+    def remove_member(self, project_vo, project_member_vo):
+        user_id = project_member_vo.user.user_id
         project_vo.remove('members', project_member_vo)
 
+        self._get_authorization_manager().delete_user_project_cache(user_id, project_vo.domain_id)
+
     def list_project_members(self, query):
         return self.project_map_model.query(**query)
+
+    def _patch_project_tree(self, project_vo, func):
+        project_group_id = project_vo.project_group.project_group_id if project_vo.project_group else None
+
+        project_group_mgr = self.locator.get_manager('ProjectGroupManager')
+        project_group_mgr.patch_project_tree(project_vo.domain_id, func, project_vo.project_id, project_group_id)
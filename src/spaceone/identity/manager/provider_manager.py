@@ -1,7 +1,10 @@
 import logging
+from datetime import datetime
 
+from spaceone.core import cache
 from spaceone.core.manager import BaseManager
 from spaceone.identity.conf.provider_conf import DEFAULT_PROVIDERS
+from spaceone.identity.lib.schema_validator import invalidate_schema_validators
 from spaceone.identity.model.provider_model import Provider
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,19 +30,50 @@ class ProviderManager(BaseManager):
         def _rollback(old_data):
             _LOGGER.info(f'[update_provider._rollback] Revert Data : {old_data["provider"]}')
             provider_vo.update(old_data)
+            self.delete_provider_schema_cache(provider_vo.provider)
 
         provider_vo: Provider = self.get_provider(params['provider'])
         self.transaction.add_rollback(_rollback, provider_vo.to_dict())
 
-        return provider_vo.update(params)
+        params['updated_at'] = datetime.utcnow()
+        provider_vo = provider_vo.update(params)
+        self.delete_provider_schema_cache(provider_vo.provider)
+
+        return provider_vo
 
     def delete_provider(self, provider):
         provider_vo: Provider = self.get_provider(provider)
         provider_vo.delete()
+        self.delete_provider_schema_cache(provider)
 
     def get_provider(self, provider, only=None):
         return self.provider_model.get(provider=provider, only=only)
 
+    @cache.cacheable(key='provider-schema-info:{provider}', expire=300)
+    def get_service_account_schema(self, provider):
+        """ Return the service account schema of a provider with its version
+
+        The version changes whenever the provider is updated, so compiled
+        validators keyed by it are replaced in every worker once the cached
+        schema expires or is deleted.
+        """
+
+        provider_vo: Provider = self.get_provider(provider, only=['provider', 'template', 'created_at',
+                                                                  'updated_at'])
+        version = provider_vo.updated_at or provider_vo.created_at
+
+        return {
+            'schema': provider_vo.template.get('service_account', {}).get('schema', []),
+            'version': version.isoformat() if version else None
+        }
+
+    @staticmethod
+    def delete_provider_schema_cache(provider):
+        invalidate_schema_validators(provider)
+
+        if cache.is_set():
+            cache.delete(f'provider-schema-info:{provider}')
+
     def list_providers(self, query={}):
         return self.provider_model.query(**query)
 
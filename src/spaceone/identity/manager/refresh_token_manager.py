@@ -0,0 +1,199 @@
+import json
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+import redis
+
+from spaceone.core import config, utils
+from spaceone.core.manager import BaseManager
+from spaceone.identity.error.error_authentication import *
+from spaceone.identity.lib.cache_connection import get_redis_connection
+from spaceone.identity.model.refresh_token_model import RefreshTokenFamily
+
+_LOGGER = logging.getLogger(__name__)
+
+_CACHE_FAILOVER_LOGGED = False
+
+
+class RefreshTokenManager(BaseManager):
+    """ Refresh token rotation families
+
+    A login starts a family and every refresh rotates the single refresh key
+    stored for it, so the store holds one small record per session instead of
+    one per issued token. Presenting a refresh key which is not the current
+    key of its family means that a rotated token was reused: the whole family
+    is revoked. The key rotated out last is still accepted for
+    `refresh_reuse_grace` seconds, so concurrent refreshes of one client do
+    not revoke its session: the refresh which loses the race is handed the
+    key of the winner instead of rotating the family again.
+
+    Rotation is a compare-and-set on the current key of the family.
+
+    IDENTITY.token.refresh_store selects the backend:
+        - mongo : RefreshTokenFamily collection with a TTL index (default)
+        - cache : the redis cache backend with WATCH/MULTI, mongo is used when
+                  the cache is not configured or is not redis
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        identity_conf = config.get_global('IDENTITY') or {}
+        token_conf = identity_conf.get('token', {})
+        self.redis = None
+        self.backend = self._get_backend(token_conf.get('refresh_store', 'mongo'))
+        self.reuse_grace = token_conf.get('refresh_reuse_grace', 10)
+        self.family_model: RefreshTokenFamily = self.locator.get_model('RefreshTokenFamily')
+
+    def create_family(self, refresh_key, user_id, domain_id, expire):
+        def _rollback(rollback_family_id):
+            _LOGGER.info(f'[create_family._rollback] Delete refresh token family : {rollback_family_id}')
+            self._delete_family(rollback_family_id)
+
+        family_id = utils.generate_id('fam')
+
+        if self.backend == 'cache':
+            self._set_cache_family(family_id, {'refresh_key': refresh_key, 'revoked': False}, expire)
+        else:
+            self.family_model.create({
+                'family_id': family_id,
+                'refresh_key': refresh_key,
+                'user_id': user_id,
+                'domain_id': domain_id,
+                'expired_at': datetime.utcnow() + timedelta(seconds=expire)
+            })
+
+        self.transaction.add_rollback(_rollback, family_id)
+        return family_id
+
+    def check_family(self, family_id, refresh_key):
+        family = self._get_family(family_id)
+
+        if family is None or family['revoked']:
+            raise ERROR_INVALID_REFRESH_TOKEN()
+
+        if family['refresh_key'] != refresh_key and not self._is_in_reuse_grace(family, refresh_key):
+            _LOGGER.warning(f'[check_family] Reused refresh token. Revoke family. (family_id={family_id})')
+            self.revoke_family(family_id)
+            raise ERROR_INVALID_REFRESH_TOKEN()
+
+    def rotate_family(self, family_id, old_refresh_key, new_refresh_key, expire):
+        """ Rotate the family and return the refresh key to issue
+
+        If a concurrent refresh of the same token has rotated the family
+        first, the key issued by that refresh is returned, so both clients
+        continue with the current key of the family.
+        """
+
+        def _rollback(rollback_family_id):
+            _LOGGER.info(f'[rotate_family._rollback] Revert refresh token family : {rollback_family_id}')
+            self._compare_and_set(rollback_family_id, new_refresh_key, old_refresh_key, expire)
+
+        if self._compare_and_set(family_id, old_refresh_key, new_refresh_key, expire):
+            self.transaction.add_rollback(_rollback, family_id)
+            return new_refresh_key
+
+        family = self._get_family(family_id)
+        if not self._is_in_reuse_grace(family, old_refresh_key):
+            _LOGGER.warning(f'[rotate_family] Refresh token is already rotated. Revoke family. '
+                            f'(family_id={family_id})')
+            self.revoke_family(family_id)
+            raise ERROR_INVALID_REFRESH_TOKEN()
+
+        return family['refresh_key']
+
+    def revoke_family(self, family_id):
+        if self.backend == 'cache':
+            # A missing family is rejected as well, so revoking is just removing it.
+            self._delete_family(family_id)
+        else:
+            self.family_model.filter(family_id=family_id).update(set__revoked=True)
+
+    def _get_family(self, family_id):
+        if self.backend == 'cache':
+            return self._decode_cache_family(self.redis.get(self._get_cache_key(family_id)))
+        else:
+            family_vos = self.family_model.filter(family_id=family_id)
+            for family_vo in family_vos:
+                rotated_at = family_vo.rotated_at.replace(tzinfo=timezone.utc).timestamp() \
+                    if family_vo.rotated_at else None
+
+                return {
+                    'refresh_key': family_vo.refresh_key,
+                    'previous_refresh_key': family_vo.previous_refresh_key,
+                    'rotated_at': rotated_at,
+                    'revoked': family_vo.revoked
+                }
+
+            return None
+
+    def _compare_and_set(self, family_id, old_refresh_key, new_refresh_key, expire):
+        if self.backend == 'cache':
+            return self._compare_and_set_cache(family_id, old_refresh_key, new_refresh_key, expire)
+        else:
+            # MongoCustomQuerySet.update does not return the number of updated documents,
+            # modify returns the matched document or None.
+            now = datetime.utcnow()
+            family_vo = self.family_model.filter(family_id=family_id, refresh_key=old_refresh_key, revoked=False)\
+                .modify(set__refresh_key=new_refresh_key, set__previous_refresh_key=old_refresh_key,
+                        set__rotated_at=now, set__expired_at=now + timedelta(seconds=expire))
+            return family_vo is not None
+
+    def _compare_and_set_cache(self, family_id, old_refresh_key, new_refresh_key, expire):
+        cache_key = self._get_cache_key(family_id)
+
+        with self.redis.pipeline() as pipe:
+            try:
+                pipe.watch(cache_key)
+                family = self._decode_cache_family(pipe.get(cache_key))
+                if family is None or family['revoked'] or family['refresh_key'] != old_refresh_key:
+                    return False
+
+                pipe.multi()
+                pipe.set(cache_key, json.dumps(dict(family, refresh_key=new_refresh_key,
+                                                    previous_refresh_key=old_refresh_key,
+                                                    rotated_at=time.time())), ex=expire)
+                pipe.execute()
+                return True
+            except redis.WatchError:
+                # The family was changed between WATCH and EXEC.
+                return False
+
+    def _is_in_reuse_grace(self, family, refresh_key):
+        if family is None or family['revoked'] or not family.get('rotated_at'):
+            return False
+
+        return family.get('previous_refresh_key') == refresh_key and \
+            time.time() - family['rotated_at'] <= self.reuse_grace
+
+    def _delete_family(self, family_id):
+        if self.backend == 'cache':
+            self.redis.delete(self._get_cache_key(family_id))
+        else:
+            self.family_model.filter(family_id=family_id).delete()
+
+    def _set_cache_family(self, family_id, family, expire):
+        self.redis.set(self._get_cache_key(family_id), json.dumps(family), ex=expire)
+
+    def _get_backend(self, backend):
+        global _CACHE_FAILOVER_LOGGED
+
+        if backend == 'cache':
+            self.redis = get_redis_connection()
+
+            if self.redis is None:
+                if not _CACHE_FAILOVER_LOGGED:
+                    _LOGGER.warning('[_get_backend] refresh_store is cache, but the cache is not redis. Use mongo.')
+                    _CACHE_FAILOVER_LOGGED = True
+
+                return 'mongo'
+
+        return backend
+
+    @staticmethod
+    def _decode_cache_family(value):
+        return json.loads(value) if value else None
+
+    @staticmethod
+    def _get_cache_key(family_id):
+        return f'refresh-token-family:{family_id}'
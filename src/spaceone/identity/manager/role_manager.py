@@ -30,10 +30,14 @@ class RoleManager(BaseManager):
         role_vo: Role = self.get_role(params['role_id'], params['domain_id'])
         self.transaction.add_rollback(_rollback, role_vo.to_dict())
 
-        return role_vo.update(params)
+        role_vo = role_vo.update(params)
+        self._delete_authorization_cache(role_vo)
+
+        return role_vo
 
     def delete_role(self, role_id, domain_id):
         role_vo = self.get_role(role_id, domain_id)
+        self._delete_authorization_cache(role_vo)
         role_vo.delete()
 
     def get_role(self, role_id, domain_id, only=None):
@@ -44,3 +48,7 @@ class RoleManager(BaseManager):
 
     def stat_roles(self, query):
         return self.role_model.stat(**query)
+
+    def _delete_authorization_cache(self, role_vo):
+        auth_mgr = self.locator.get_manager('AuthorizationManager')
+        auth_mgr.delete_role_cache(role_vo)
@@ -1,7 +1,13 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
 
+from mongoengine import ValidationError
+from pymongo.errors import BulkWriteError
+from spaceone.core import config, utils
 from spaceone.core.error import *
 from spaceone.core.manager import BaseManager
+from spaceone.identity.error.custom import ERROR_SECRET_FAN_OUT_FAILURE
 from spaceone.identity.model.service_account_model import ServiceAccount
 from spaceone.identity.connector.secret_connector import SecretConnector
 
@@ -14,6 +20,11 @@ class ServiceAccountManager(BaseManager):
         super().__init__(*args, **kwargs)
         self.service_account_model: ServiceAccount = self.locator.get_model('ServiceAccount')
 
+        identity_conf = config.get_global('IDENTITY') or {}
+        fan_out_conf = identity_conf.get('secret_fan_out', {})
+        self.secret_workers = fan_out_conf.get('workers', 8)
+        self.secret_timeout = fan_out_conf.get('timeout', 10)
+
     def create_service_account(self, params):
         def _rollback(service_account_vo):
             _LOGGER.info(f'[create_service_account._rollback] '
@@ -26,6 +37,67 @@ class ServiceAccountManager(BaseManager):
 
         return service_account_vo
 
+    def create_service_accounts(self, service_accounts, domain_id):
+        """ Create one chunk of imported service accounts with one bulk insert
+
+        The insert is unordered, so a row which fails (e.g. its name was taken
+        after the check) doesn't stop the others and each row gets its own
+        result. Inserted rows are kept; an import is not rolled back as a whole.
+
+        Args:
+            service_accounts (list): [{'name', 'data', 'provider', 'project', 'tags'}, ...]
+
+        Returns:
+            service_account_id or error of each service account, in the given order
+        """
+
+        results = [None] * len(service_accounts)
+        new_service_accounts = []
+
+        names = [params['name'] for params in service_accounts]
+        exist_names = set(self.service_account_model.filter(name=names, domain_id=domain_id).scalar('name'))
+
+        for index, params in enumerate(service_accounts):
+            if params['name'] in exist_names:
+                results[index] = ERROR_NOT_UNIQUE(key='name', value=params['name'])
+                continue
+
+            create_params = self._make_service_account(params, domain_id)
+            service_account_vo = self.service_account_model(**create_params)
+
+            # insert_many skips the validation which MongoModel.create does on save.
+            try:
+                service_account_vo.validate()
+            except ValidationError as e:
+                results[index] = ERROR_INVALID_PARAMETER(key=', '.join(e.errors or {}) or 'service_account',
+                                                         reason=e.message)
+                continue
+
+            exist_names.add(params['name'])
+            new_service_accounts.append((index, create_params, service_account_vo))
+
+        if not new_service_accounts:
+            return results
+
+        write_errors = {}
+        try:
+            self.service_account_model._get_collection().insert_many(
+                [service_account_vo.to_mongo() for _, _, service_account_vo in new_service_accounts], ordered=False)
+        except BulkWriteError as e:
+            write_errors = {write_error['index']: write_error for write_error in e.details.get('writeErrors', [])}
+        except Exception as e:
+            self._delete_service_accounts([create_params['service_account_id']
+                                           for _, create_params, _ in new_service_accounts])
+            raise ERROR_DB_QUERY(reason=e)
+
+        for position, (index, create_params, _) in enumerate(new_service_accounts):
+            if position in write_errors:
+                results[index] = self._make_write_error(write_errors[position], create_params)
+            else:
+                results[index] = create_params['service_account_id']
+
+        return results
+
     def update_service_account(self, params):
         service_account_vo: ServiceAccount = self.get_service_account(params['service_account_id'],
                                                                       params['domain_id'])
@@ -56,26 +128,53 @@ class ServiceAccountManager(BaseManager):
         return self.service_account_model.stat(**query)
 
     def update_secret_project(self, service_account_id, project_id, domain_id):
+        def _rollback(old_secrets):
+            if old_secrets:
+                _LOGGER.info(f'[update_secret_project._rollback] Revert secret project : {service_account_id}')
+                self._restore_secret_projects(secret_connector, old_secrets, domain_id)
+
         secret_connector: SecretConnector = self.locator.get_connector('SecretConnector')
-        response = secret_connector.list_secrets(self._get_secret_query(service_account_id), domain_id)
-        secrets = response.get('results', [])
+        secrets = self._list_service_account_secrets(secret_connector, service_account_id, domain_id)
+
+        updated_secrets = []
+        self.transaction.add_rollback(_rollback, updated_secrets)
+
+        _, failures = self._fan_out_secrets(
+            lambda secret_info, metadata: secret_connector.update_secret_project(
+                secret_info['secret_id'], project_id, domain_id, timeout=self.secret_timeout, metadata=metadata),
+            secrets, updated_secrets)
 
-        for secret_info in secrets:
-            secret_connector.update_secret_project(secret_info['secret_id'], project_id, domain_id)
+        self._check_fan_out_failures('update', service_account_id, failures)
 
     def release_secret_project(self, service_account_id, domain_id):
+        def _rollback(old_secrets):
+            if old_secrets:
+                _LOGGER.info(f'[release_secret_project._rollback] Revert secret project : {service_account_id}')
+                self._restore_secret_projects(secret_connector, old_secrets, domain_id)
+
         secret_connector: SecretConnector = self.locator.get_connector('SecretConnector')
-        response = secret_connector.list_secrets(self._get_secret_query(service_account_id), domain_id)
-        secrets = response.get('results', [])
+        secrets = self._list_service_account_secrets(secret_connector, service_account_id, domain_id)
+
+        released_secrets = []
+        self.transaction.add_rollback(_rollback, released_secrets)
 
-        for secret_info in secrets:
-            secret_connector.release_secret_project(secret_info['secret_id'], domain_id)
+        _, failures = self._fan_out_secrets(
+            lambda secret_info, metadata: secret_connector.release_secret_project(
+                secret_info['secret_id'], domain_id, timeout=self.secret_timeout, metadata=metadata),
+            secrets, released_secrets)
+
+        self._check_fan_out_failures('release', service_account_id, failures)
 
     def delete_service_account_secrets(self, service_account_id, domain_id):
         secret_connector: SecretConnector = self.locator.get_connector('SecretConnector')
-        response = secret_connector.list_secrets(self._get_secret_query(service_account_id), domain_id)
-        for secret_info in response.get('results', []):
-            secret_connector.delete_secret(secret_info['secret_id'], domain_id)
+        secrets = self._list_service_account_secrets(secret_connector, service_account_id, domain_id)
+
+        _, failures = self._fan_out_secrets(
+            lambda secret_info, metadata: secret_connector.delete_secret(
+                secret_info['secret_id'], domain_id, timeout=self.secret_timeout, metadata=metadata),
+            secrets)
+
+        self._check_fan_out_failures('delete', service_account_id, failures)
 
     def check_service_account_secrets(self, service_account_id, domain_id):
         secret_connector: SecretConnector = self.locator.get_connector('SecretConnector')
@@ -85,6 +184,109 @@ class ServiceAccountManager(BaseManager):
         if total_count > 0:
             raise ERROR_EXIST_RESOURCE(parent='ServiceAccount', child='Secret')
 
+    def _delete_service_accounts(self, service_account_ids):
+        try:
+            self.service_account_model.filter(service_account_id=service_account_ids).delete()
+        except Exception as e:
+            _LOGGER.error(f'[_delete_service_accounts] Failed to delete imported service accounts. '
+                          f'(service_account_ids={service_account_ids}, reason={e})')
+
+    @staticmethod
+    def _make_write_error(write_error, create_params):
+        if write_error.get('code') == 11000:
+            return ERROR_NOT_UNIQUE(key='name', value=create_params['name'])
+
+        return ERROR_DB_QUERY(reason=write_error.get('errmsg'))
+
+    @staticmethod
+    def _make_service_account(params, domain_id):
+        return {
+            'service_account_id': utils.generate_id('sa'),
+            'name': params['name'],
+            'data': params['data'],
+            'provider': params['provider'],
+            'project': params.get('project'),
+            'tags': params.get('tags', {}),
+            'domain_id': domain_id,
+            'created_at': datetime.utcnow()
+        }
+
+    def _list_service_account_secrets(self, secret_connector, service_account_id, domain_id):
+        return secret_connector.list_secrets_by_page(self._get_secret_query(service_account_id), domain_id)
+
+    def _restore_secret_projects(self, secret_connector, secrets, domain_id):
+        def _restore(secret_info, metadata):
+            if secret_info.get('project_id'):
+                secret_connector.update_secret_project(secret_info['secret_id'], secret_info['project_id'],
+                                                       domain_id, timeout=self.secret_timeout, metadata=metadata)
+            else:
+                secret_connector.release_secret_project(secret_info['secret_id'], domain_id,
+                                                        timeout=self.secret_timeout, metadata=metadata)
+
+        _, failures = self._fan_out_secrets(_restore, secrets)
+
+        for failure in failures:
+            _LOGGER.error(f'[_restore_secret_projects] Failed to restore secret project. '
+                          f'(secret_id={failure["secret_id"]}, reason={failure["message"]})')
+
+    def _fan_out_secrets(self, func, secrets, succeeded_secrets=None):
+        """ Call func(secret_info, metadata) for every secret on a bounded thread pool
+
+        The connection meta (token, domain) of the request is read here, in
+        the thread of the request, and handed to every call. The workers must
+        not read it from the transaction themselves, since they do not run in
+        the context of the request.
+
+        secrets may be a generator; it is consumed while the calls run and at
+        most twice the number of workers are in flight. Returns the secrets
+        which succeeded and the failures.
+
+        Succeeded secrets are appended to succeeded_secrets as they finish,
+        also when reading secrets raises, so a rollback registered with that
+        list before the fan-out reverts every call which went through.
+        """
+
+        if succeeded_secrets is None:
+            succeeded_secrets = []
+
+        failures = []
+        max_pending = self.secret_workers * 2
+        metadata = self.transaction.get_connection_meta()
+
+        def _collect(done_futures):
+            for future in done_futures:
+                secret_info = pending.pop(future)
+                try:
+                    future.result()
+                    succeeded_secrets.append(secret_info)
+                except Exception as e:
+                    failures.append({
+                        'secret_id': secret_info['secret_id'],
+                        'message': e.message if isinstance(e, ERROR_BASE) else str(e)
+                    })
+
+        with ThreadPoolExecutor(max_workers=self.secret_workers) as executor:
+            pending = {}
+
+            try:
+                for secret_info in secrets:
+                    pending[executor.submit(func, secret_info, metadata)] = secret_info
+
+                    if len(pending) >= max_pending:
+                        done_futures, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        _collect(done_futures)
+            finally:
+                _collect(list(pending))
+
+        return succeeded_secrets, failures
+
+    @staticmethod
+    def _check_fan_out_failures(action, service_account_id, failures):
+        if failures:
+            raise ERROR_SECRET_FAN_OUT_FAILURE(action=action, service_account_id=service_account_id,
+                                               failed_secrets=[failure['secret_id'] for failure in failures],
+                                               reason=failures[0]['message'])
+
     @staticmethod
     def _get_secret_query(service_account_id):
         query = {
@@ -93,7 +295,7 @@ class ServiceAccountManager(BaseManager):
                 'v': service_account_id,
                 'o': 'eq'
             }],
-            'only': ['secret_id']
+            'only': ['secret_id', 'project_id']
         }
 
         return query
@@ -2,30 +2,46 @@
 import logging
 import time
 from abc import abstractmethod, ABC, ABCMeta
+from typing import NamedTuple, Optional
 
 from spaceone.core import config, utils, cache
 from spaceone.core.manager import BaseManager
 from spaceone.core.auth.jwt.jwt_util import JWTUtil
 
 from spaceone.identity.error.error_authentication import *
+from spaceone.identity.lib.cipher import PasswordCipher
+from spaceone.identity.lib.jwk_cache import get_signing_key
 
 
-__all__ = ['TokenManager', 'JWTManager']
+__all__ = ['AuthenticationResult', 'TokenManager', 'JWTManager']
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AuthenticationResult(NamedTuple):
+    """ Immutable outcome of an authentication or a refresh check
+
+    Token managers keep no per-request state, so the result is handed back to
+    issue_token explicitly instead of being remembered on the manager.
+    """
+
+    user_type: str
+    user_id: str
+    domain_id: str
+    refresh_key: Optional[str] = None
+    family_id: Optional[str] = None
+
 
 class TokenManager(BaseManager, ABC):
 
-    is_authenticated = False
+    user_type = 'USER'
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._load_conf()
 
     @abstractmethod
-    def issue_token(self, **kwargs):
-        pass
-
-    @abstractmethod
-    def refresh_token(self, user_id, domain_id, **kwargs):
+    def issue_token(self, auth_result, **kwargs):
         pass
 
     @abstractmethod
@@ -33,7 +49,7 @@ class TokenManager(BaseManager, ABC):
         pass
 
     @abstractmethod
-    def check_refreshable(self, key, ttl):
+    def check_refreshable(self, user_id, domain_id, refresh_key, ttl, family_id=None):
         pass
 
     def _load_conf(self):
@@ -47,32 +63,58 @@ class TokenManager(BaseManager, ABC):
 
 class JWTManager(TokenManager, metaclass=ABCMeta):
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.old_refresh_key = None
+    def authenticate(self, credentials, domain_id):
+        raise NotImplementedError('TokenManager.authenticate not implemented!')
 
-    def issue_token(self, **kwargs):
-        raise NotImplementedError('TokenManager.issue_token not implemented!')
+    def issue_token(self, auth_result, **kwargs):
+        if not isinstance(auth_result, AuthenticationResult):
+            raise ERROR_NOT_AUTHENTICATED()
 
-    def refresh_token(self, user_id, domain_id, **kwargs):
-        raise NotImplementedError('TokenManager.refresh_token not implemented!')
+        access_token = self.issue_access_token(auth_result.user_type, auth_result.user_id,
+                                               auth_result.domain_id, **kwargs)
+        refresh_token = self.issue_refresh_token(auth_result.user_type, auth_result.user_id,
+                                                 auth_result.domain_id, old_refresh_key=auth_result.refresh_key,
+                                                 family_id=auth_result.family_id, **kwargs)
 
-    def authenticate(self, credentials, domain_id):
-        raise NotImplementedError('TokenManager.authenticate not implemented!')
+        return {
+            'access_token': access_token,
+            'refresh_token': refresh_token
+        }
 
-    def check_refreshable(self, refresh_key, ttl):
+    def check_refreshable(self, user_id, domain_id, refresh_key, ttl, family_id=None):
         if self.CONST_REFRESH_ONCE:
-            if cache.is_set() and cache.get(f'refresh-token:{refresh_key}') is None:
+            if family_id:
+                self._get_refresh_token_manager().check_family(family_id, refresh_key)
+
+            # Refresh tokens issued before rotation families were introduced
+            elif cache.is_set() and cache.get(f'refresh-token:{refresh_key}') is None:
                 raise ERROR_INVALID_REFRESH_TOKEN()
 
         if ttl == 0:
             raise ERROR_REFRESH_COUNT()
 
-        self.is_authenticated = True
-        self.old_refresh_key = refresh_key
+        self._check_refreshable_user(user_id, domain_id)
+
+        return AuthenticationResult(self.user_type, user_id, domain_id,
+                                    refresh_key=refresh_key, family_id=family_id)
+
+    def _check_refreshable_user(self, user_id, domain_id):
+        raise NotImplementedError('JWTManager._check_refreshable_user not implemented!')
+
+    @staticmethod
+    def _rehash_password(vo, password, user_id):
+        """ Upgrade a password hash made with previous IDENTITY.password_hash settings """
+
+        cipher = PasswordCipher()
+
+        if cipher.needs_rehash(vo.password):
+            try:
+                vo.update({'password': cipher.hashpw(password)})
+            except Exception as e:
+                _LOGGER.error(f'[_rehash_password] Failed to rehash password. (user_id={user_id}, reason={e})')
 
     def issue_access_token(self, user_type, user_id, domain_id, **kwargs):
-        private_jwk = self._get_private_jwk(kwargs)
+        private_key = get_signing_key(domain_id, self._get_private_jwk(kwargs))
         timeout = kwargs.get('timeout', self.CONST_TOKEN_TIMEOUT)
 
         payload = {
@@ -84,15 +126,21 @@ class JWTManager(TokenManager, metaclass=ABCMeta):
             'exp': int(time.time() + timeout)
         }
 
-        encoded = JWTUtil.encode(payload, private_jwk)
+        encoded = JWTUtil.encode(payload, private_key)
         return encoded
 
-    def issue_refresh_token(self, user_type, user_id, domain_id, **kwargs):
-        private_jwk = self._get_private_jwk(kwargs)
+    def issue_refresh_token(self, user_type, user_id, domain_id, old_refresh_key=None, family_id=None, **kwargs):
+        private_key = get_signing_key(domain_id, self._get_private_jwk(kwargs))
         ttl = kwargs.get('ttl', self.CONST_REFRESH_TTL)
         timeout = kwargs.get('timeout', self.CONST_REFRESH_TIMEOUT)
         refresh_key = self._generate_refresh_key()
 
+        if self.CONST_REFRESH_ONCE:
+            family_id, refresh_key = self._rotate_refresh_family(refresh_key, old_refresh_key, family_id,
+                                                                 user_id, domain_id, timeout)
+        else:
+            family_id = None
+
         payload = {
             'cat': 'REFRESH_TOKEN',
             'user_type': user_type,
@@ -104,11 +152,10 @@ class JWTManager(TokenManager, metaclass=ABCMeta):
             'ttl': ttl
         }
 
-        encoded = JWTUtil.encode(payload, private_jwk)
-
-        if self.CONST_REFRESH_ONCE:
-            self._set_refresh_token_cache(refresh_key)
+        if family_id:
+            payload['fam'] = family_id
 
+        encoded = JWTUtil.encode(payload, private_key)
         return encoded
 
     @staticmethod
@@ -122,9 +169,16 @@ class JWTManager(TokenManager, metaclass=ABCMeta):
 
         return kwargs['private_jwk']
 
-    def _set_refresh_token_cache(self, new_refresh_key):
-        if cache.is_set():
-            if self.old_refresh_key:
-                cache.delete(f'refresh-token:{self.old_refresh_key}')
+    def _rotate_refresh_family(self, new_refresh_key, old_refresh_key, family_id, user_id, domain_id, timeout):
+        refresh_token_mgr = self._get_refresh_token_manager()
+
+        if family_id:
+            return family_id, refresh_token_mgr.rotate_family(family_id, old_refresh_key, new_refresh_key, timeout)
+
+        if old_refresh_key and cache.is_set():
+            cache.delete(f'refresh-token:{old_refresh_key}')
+
+        return refresh_token_mgr.create_family(new_refresh_key, user_id, domain_id, timeout), new_refresh_key
 
-            cache.set(f'refresh-token:{new_refresh_key}', '', expire=self.CONST_REFRESH_TIMEOUT)
+    def _get_refresh_token_manager(self):
+        return self.locator.get_manager('RefreshTokenManager')
@@ -4,7 +4,7 @@ from spaceone.identity.error.error_authentication import *
 from spaceone.identity.error.error_user import ERROR_USER_STATUS_CHECK_FAILURE
 from spaceone.identity.lib.cipher import PasswordCipher
 from spaceone.identity.manager.user_manager import UserManager
-from spaceone.identity.manager.token_manager import JWTManager
+from spaceone.identity.manager.token_manager import JWTManager, AuthenticationResult
 from spaceone.identity.model import User
 
 _LOGGER = logging.getLogger(__name__)
@@ -19,37 +19,23 @@ class DefaultTokenManager(JWTManager):
     def authenticate(self, credentials, domain_id):
         user_id, pw_to_check = self._parse_user_id_and_password(credentials)
 
-        self.user = self.user_mgr.get_user(user_id, domain_id)
+        user_vo: User = self.user_mgr.get_user(user_id, domain_id)
 
-        self._check_user_state()
+        self._check_user_state(user_vo)
 
         # TODO: decrypt pw
-        is_correct = PasswordCipher().checkpw(pw_to_check, self.user.password)
-        _LOGGER.debug(f'[authenticate] is_correct: {is_correct}, pw_to_check: {pw_to_check}, hashed_pw: {self.user.password}')
+        is_correct = PasswordCipher().checkpw(pw_to_check, user_vo.password)
+        _LOGGER.debug(f'[authenticate] is_correct: {is_correct}, pw_to_check: {pw_to_check}, hashed_pw: {user_vo.password}')
 
         if is_correct:
-            self.is_authenticated = True
+            self._rehash_password(user_vo, pw_to_check, user_vo.user_id)
+            return AuthenticationResult(self.user_type, user_vo.user_id, user_vo.domain_id)
         else:
-            raise ERROR_AUTHENTICATION_FAILURE(user_id=self.user.user_id)
+            raise ERROR_AUTHENTICATION_FAILURE(user_id=user_vo.user_id)
 
-    def issue_token(self, **kwargs):
-        if self.is_authenticated is False:
-            raise ERROR_NOT_AUTHENTICATED()
-
-        # Issue token
-        access_token = self.issue_access_token('USER', self.user.user_id, self.user.domain_id, **kwargs)
-        refresh_token = self.issue_refresh_token('USER', self.user.user_id, self.user.domain_id, **kwargs)
-
-        return {
-            'access_token': access_token,
-            'refresh_token': refresh_token
-        }
-
-    def refresh_token(self, user_id, domain_id, **kwargs):
-        self.user: User = self.user_mgr.get_user(user_id, domain_id)
-        self._check_user_state()
-
-        return self.issue_token(**kwargs)
+    def _check_refreshable_user(self, user_id, domain_id):
+        user_vo: User = self.user_mgr.get_user(user_id, domain_id)
+        self._check_user_state(user_vo)
 
     def _parse_user_id_and_password(self, credentials):
         # Get User
@@ -61,6 +47,7 @@ class DefaultTokenManager(JWTManager):
 
         return user_id, pw_to_check
 
-    def _check_user_state(self):
-        if self.user.state != 'ENABLED':
-            raise ERROR_USER_STATUS_CHECK_FAILURE(user_id=self.user.user_id)
+    @staticmethod
+    def _check_user_state(user_vo):
+        if user_vo.state != 'ENABLED':
+            raise ERROR_USER_STATUS_CHECK_FAILURE(user_id=user_vo.user_id)
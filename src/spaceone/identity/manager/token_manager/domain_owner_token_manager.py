@@ -2,7 +2,7 @@ import logging
 
 from spaceone.identity.error.error_authentication import *
 from spaceone.identity.lib.cipher import PasswordCipher
-from spaceone.identity.manager.token_manager import JWTManager
+from spaceone.identity.manager.token_manager import JWTManager, AuthenticationResult
 from spaceone.identity.manager import DomainOwnerManager
 from spaceone.identity.model import DomainOwner
 
@@ -10,7 +10,8 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class DomainOwnerTokenManager(JWTManager):
-    user: DomainOwner = None
+
+    user_type = 'DOMAIN_OWNER'
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -19,32 +20,19 @@ class DomainOwnerTokenManager(JWTManager):
     def authenticate(self, credentials, domain_id):
         user_id, pw_to_check = self._parse_user_id_and_password(credentials)
 
-        self.user = self.domain_owner_mgr.get_owner(owner_id=user_id, domain_id=domain_id)
+        owner_vo: DomainOwner = self.domain_owner_mgr.get_owner(owner_id=user_id, domain_id=domain_id)
 
-        is_correct = PasswordCipher().checkpw(pw_to_check, self.user.password)
-        _LOGGER.debug(f'[authenticate] is_correct: {is_correct}, pw_to_check: {pw_to_check}, hashed_pw: {self.user.password}')
+        is_correct = PasswordCipher().checkpw(pw_to_check, owner_vo.password)
+        _LOGGER.debug(f'[authenticate] is_correct: {is_correct}, pw_to_check: {pw_to_check}, hashed_pw: {owner_vo.password}')
 
         if is_correct:
-            self.is_authenticated = True
+            self._rehash_password(owner_vo, pw_to_check, owner_vo.owner_id)
+            return AuthenticationResult(self.user_type, owner_vo.owner_id, owner_vo.domain_id)
         else:
-            raise ERROR_AUTHENTICATION_FAILURE(user_id=self.user.owner_id)
-
-    def issue_token(self, **kwargs):
-        if self.is_authenticated is False:
-            raise ERROR_NOT_AUTHENTICATED()
-
-        # Issue token
-        access_token = self.issue_access_token('DOMAIN_OWNER', self.user.owner_id, self.user.domain_id, **kwargs)
-        refresh_token = self.issue_refresh_token('DOMAIN_OWNER', self.user.owner_id, self.user.domain_id, **kwargs)
-
-        return {
-            'access_token': access_token,
-            'refresh_token': refresh_token
-        }
+            raise ERROR_AUTHENTICATION_FAILURE(user_id=owner_vo.owner_id)
 
-    def refresh_token(self, user_id, domain_id, **kwargs):
-        self.user = self.domain_owner_mgr.get_owner(owner_id=user_id, domain_id=domain_id)
-        return self.issue_token(**kwargs)
+    def _check_refreshable_user(self, user_id, domain_id):
+        self.domain_owner_mgr.get_owner(owner_id=user_id, domain_id=domain_id)
 
     def _parse_user_id_and_password(self, credentials):
         # Get User
@@ -4,7 +4,6 @@ from spaceone.core.manager import BaseManager
 
 from spaceone.identity.connector import PluginServiceConnector, AuthPluginConnector
 from spaceone.identity.lib.cipher import PasswordCipher
-from spaceone.identity.model import Domain
 from spaceone.identity.model.user_model import User
 
 _LOGGER = logging.getLogger(__name__)
@@ -16,7 +15,7 @@ class UserManager(BaseManager):
         super().__init__(transaction)
         self.user_model: User = self.locator.get_model('User')
 
-    def create_user(self, params, domain_vo):
+    def create_user(self, params, domain_descriptor):
         def _rollback(user_vo):
             _LOGGER.info(f'[create_user._rollback] Delete user : {user_vo.name} ({user_vo.user_id})')
             user_vo.delete()
@@ -32,8 +31,8 @@ class UserManager(BaseManager):
             ...
 
         # If authentication plugin backed Domain, call find action.
-        if domain_vo.plugin_info:
-            found_users, count = self.find_user({'user_id': params['user_id']}, domain_vo)
+        if domain_descriptor['auth_type'] == 'EXTERNAL':
+            found_users, count = self.find_user({'user_id': params['user_id']}, domain_descriptor)
             if count == 1:
                 params['state'] = found_users[0]['state']
             elif count > 1:
@@ -60,11 +59,16 @@ class UserManager(BaseManager):
         self.transaction.add_rollback(_rollback, user_vo.to_dict())
 
         user_vo.update(params)
+
+        if 'state' in params or 'roles' in params:
+            self._delete_authorization_cache(user_vo.user_id, user_vo.domain_id)
+
         return user_vo
 
     def delete_user(self, user_id, domain_id):
         user_vo = self.get_user(user_id, domain_id)
         user_vo.delete()
+        self._delete_authorization_cache(user_id, domain_id)
 
     def enable_user(self, user_id, domain_id):
         def _rollback(old_data):
@@ -76,6 +80,7 @@ class UserManager(BaseManager):
         if user_vo.state != 'ENABLED':
             self.transaction.add_rollback(_rollback, user_vo.to_dict())
             user_vo.update({'state': 'ENABLED'})
+            self._delete_authorization_cache(user_id, domain_id)
 
         return user_vo
 
@@ -89,6 +94,7 @@ class UserManager(BaseManager):
         if user_vo.state != 'DISABLED':
             self.transaction.add_rollback(_rollback, user_vo.to_dict())
             user_vo.update({'state': 'DISABLED'})
+            self._delete_authorization_cache(user_id, domain_id)
 
         return user_vo
 
@@ -100,7 +106,10 @@ class UserManager(BaseManager):
         user_vo: User = self.get_user(params['user_id'], params['domain_id'])
         self.transaction.add_rollback(_rollback, user_vo.to_dict())
 
-        return user_vo.update({'roles': role_vos})
+        user_vo = user_vo.update({'roles': role_vos})
+        self._delete_authorization_cache(user_vo.user_id, user_vo.domain_id)
+
+        return user_vo
 
     def get_user(self, user_id, domain_id, only=None):
         return self.user_model.get(user_id=user_id, domain_id=domain_id, only=only)
@@ -108,29 +117,38 @@ class UserManager(BaseManager):
     def list_users(self, query):
         return self.user_model.query(**query)
 
+    def list_users_by_ids(self, user_ids, domain_id):
+        """ Return users with their roles dereferenced in bulk """
+
+        return self.user_model.filter(user_id=user_ids, domain_id=domain_id).select_related(max_depth=1)
+
     def stat_users(self, query):
         return self.user_model.stat(**query)
 
-    def find_user(self, search, domain_vo: Domain):
+    def find_user(self, search, domain_descriptor):
         keyword = search.get('keyword', None)
         user_id = search.get('user_id', None)
 
-        endpoint = self._get_plugin_endpoint(domain_vo)
+        endpoint = self._get_plugin_endpoint(domain_descriptor)
 
-        ret = self._call_find(keyword, user_id, domain_vo, endpoint)
+        ret = self._call_find(keyword, user_id, domain_descriptor, endpoint)
 
         return ret.get('results'), ret.get('total_count')
 
-    def _call_find(self, keyword, user_id, domain, endpoint):
+    def _call_find(self, keyword, user_id, domain_descriptor, endpoint):
         auth_plugin_conn: AuthPluginConnector = self.locator.get_connector('AuthPluginConnector')
         auth_plugin_conn.initialize(endpoint)
-        return auth_plugin_conn.call_find(keyword, user_id, domain)
+        return auth_plugin_conn.call_find(keyword, user_id, domain_descriptor['plugin_info']['options'])
+
+    def _delete_authorization_cache(self, user_id, domain_id):
+        auth_mgr = self.locator.get_manager('AuthorizationManager')
+        auth_mgr.delete_user_cache(user_id, domain_id)
 
-    def _get_plugin_endpoint(self, domain):
+    def _get_plugin_endpoint(self, domain_descriptor):
         """
         Return: endpoint
         """
-        plugin_id = domain.plugin_info.plugin_id
-        version = domain.plugin_info.version
+        plugin_id = domain_descriptor['plugin_info']['plugin_id']
+        version = domain_descriptor['plugin_info']['version']
         plugin_svc_conn: PluginServiceConnector = self.locator.get_connector('PluginServiceConnector')
-        return plugin_svc_conn.get_plugin_endpoint(plugin_id, version, domain.domain_id)
+        return plugin_svc_conn.get_plugin_endpoint(plugin_id, version, domain_descriptor['domain_id'])
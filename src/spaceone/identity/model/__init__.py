@@ -5,7 +5,8 @@ from spaceone.identity.model.provider_model import Provider
 from spaceone.identity.model.service_account_model import ServiceAccount
 from spaceone.identity.model.domain_secret_model import DomainSecret
 from spaceone.identity.model.policy_model import Policy
-from spaceone.identity.model.project_group_model import ProjectGroup, ProjectGroupMemberMap
+from spaceone.identity.model.project_group_model import ProjectGroup, ProjectGroupMemberMap, ProjectGroupPathVersion
 from spaceone.identity.model.project_model import Project, ProjectMemberMap
 from spaceone.identity.model.role_model import Role
 from spaceone.identity.model.user_model import User
+from spaceone.identity.model.refresh_token_model import RefreshTokenFamily
@@ -7,6 +7,7 @@ class ProjectGroup(MongoModel):
     project_group_id = StringField(max_length=40, generate_id='pg', unique=True)
     name = StringField(max_length=40)
     parent_project_group = ReferenceField('self', null=True, default=None, reverse_delete_rule=DENY)
+    project_group_path = ListField(StringField(max_length=40))
     tags = DictField()
     domain_id = StringField(max_length=255)
     created_by = StringField(max_length=255, null=True)
@@ -16,6 +17,7 @@ class ProjectGroup(MongoModel):
         'updatable_fields': [
             'name',
             'parent_project_group',
+            'project_group_path',
             'tags'
         ],
         'exact_fields': [
@@ -36,6 +38,7 @@ class ProjectGroup(MongoModel):
         'indexes': [
             'project_group_id',
             'parent_project_group',
+            'project_group_path',
             'domain_id'
         ]
     }
@@ -59,6 +62,25 @@ class ProjectGroup(MongoModel):
             super().remove(key, data)
 
 
+class ProjectGroupPathVersion(MongoModel):
+    domain_id = StringField(max_length=255, unique=True)
+    version = IntField(default=0)
+    updated_at = DateTimeField(auto_now=True)
+
+    meta = {
+        'updatable_fields': [
+            'version',
+            'updated_at'
+        ],
+        'exact_fields': [
+            'domain_id'
+        ],
+        'indexes': [
+            'domain_id'
+        ]
+    }
+
+
 class ProjectGroupMemberMap(MongoModel):
     project_group = ReferenceField('ProjectGroup', reverse_delete_rule=CASCADE)
     user = ReferenceField('User', reverse_delete_rule=CASCADE)
@@ -66,6 +88,10 @@ class ProjectGroupMemberMap(MongoModel):
     labels = ListField(StringField(max_length=255))
 
     meta = {
+        'updatable_fields': [
+            'roles',
+            'labels'
+        ],
         'reference_query_keys': {
             'project_group': ProjectGroup,
             'user': User
@@ -86,6 +86,10 @@ class ProjectMemberMap(MongoModel):
     labels = ListField(StringField(max_length=255))
 
     meta = {
+        'updatable_fields': [
+            'roles',
+            'labels'
+        ],
         'reference_query_keys': {
             'project': Project,
             'user': User
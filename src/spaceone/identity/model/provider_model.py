@@ -9,6 +9,7 @@ class Provider(MongoModel):
     capability = DictField()
     tags = DictField()
     created_at = DateTimeField(auto_now_add=True)
+    updated_at = DateTimeField(default=None, null=True)
 
     meta = {
         'updatable_fields': [
@@ -16,7 +17,8 @@ class Provider(MongoModel):
             'template',
             'metadata',
             'capability',
-            'tags'
+            'tags',
+            'updated_at'
         ],
         'exact_fields': [
             'provider'
@@ -0,0 +1,39 @@
+from mongoengine import *
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class RefreshTokenFamily(MongoModel):
+    family_id = StringField(max_length=40, unique=True)
+    refresh_key = StringField(max_length=255)
+    previous_refresh_key = StringField(max_length=255, default=None, null=True)
+    user_id = StringField(max_length=40)
+    domain_id = StringField(max_length=40)
+    revoked = BooleanField(default=False)
+    rotated_at = DateTimeField(default=None, null=True)
+    expired_at = DateTimeField()
+    created_at = DateTimeField(auto_now_add=True)
+
+    meta = {
+        'updatable_fields': [
+            'refresh_key',
+            'previous_refresh_key',
+            'revoked',
+            'rotated_at',
+            'expired_at'
+        ],
+        'exact_fields': [
+            'family_id',
+            'user_id',
+            'domain_id'
+        ],
+        'ordering': ['family_id'],
+        'indexes': [
+            'family_id',
+            'user_id',
+            'domain_id',
+            {
+                'fields': ['expired_at'],
+                'expireAfterSeconds': 0
+            }
+        ]
+    }
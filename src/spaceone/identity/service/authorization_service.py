@@ -6,9 +6,15 @@ from spaceone.core.error import *
 from spaceone.identity.manager.authorization_manager import AuthorizationManager
 from spaceone.identity.manager.user_manager import UserManager
 from spaceone.identity.manager.role_manager import RoleManager
+from spaceone.identity.lib.managed_policy import get_managed_policy_loader
+from spaceone.identity.lib.permission_matcher import get_permission_matcher, get_permissions_digest
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bump when the layout of the cached effective permission changes.
+_EFFECTIVE_PERMISSION_VERSION = 3
+
+
 @authentication_handler
 @event_handler
 class AuthorizationService(BaseService):
@@ -22,23 +28,65 @@ class AuthorizationService(BaseService):
     def verify(self, params):
         user_id = self.transaction.get_meta('user_id')
         domain_id = self.transaction.get_meta('domain_id')
-        service = params['service']
-        api_class = params['api_class']
-        method = params['method']
-        parameter = params['parameter']
 
-        role_type, user_roles = self._get_user_roles(user_id, domain_id)
+        effective_permission = self._get_effective_permission(user_id, domain_id)
+        projects = self._get_user_projects(effective_permission['role_type'], user_id, domain_id)
+
+        return self._verify_request(params, effective_permission, projects, user_id, domain_id)
+
+    @transaction
+    @check_required(['requests'])
+    def verify_batch(self, params):
+        """ Verify multiple api calls of a token at once
+
+        Args:
+            params (dict): {
+                'requests': 'list of dict (service, api_class, method, parameter)'
+            }
+
+        Returns:
+            results (list)
+        """
+
+        user_id = self.transaction.get_meta('user_id')
+        domain_id = self.transaction.get_meta('domain_id')
+
+        effective_permission = self._get_effective_permission(user_id, domain_id)
+        projects = self._get_user_projects(effective_permission['role_type'], user_id, domain_id)
+
+        results = []
+        for request in params['requests']:
+            try:
+                self._check_request(request)
+                auth_data = self._verify_request(request, effective_permission, projects, user_id, domain_id)
+                auth_data['is_allowed'] = True
+            except ERROR_BASE as e:
+                auth_data = {
+                    'is_allowed': False,
+                    'error_code': e.error_code,
+                    'message': e.message
+                }
+
+            results.append(auth_data)
+
+        return results
+
+    def _verify_request(self, request, effective_permission, projects, user_id, domain_id):
+        service = request['service']
+        api_class = request['api_class']
+        method = request['method']
+        parameter = request['parameter']
+        role_type = effective_permission['role_type']
 
         if 'project_id' in parameter:
             # TODO : Get User Project's Roles (Cache)
             pass
 
-        user_permissions = self._get_permissions(user_roles, domain_id)
+        permission_matchers = [get_permission_matcher(effective_permission['permissions'],
+                                                      effective_permission['permission_digest'])]
+        permission_matchers += self._get_managed_policy_matchers(effective_permission['managed_policies'])
 
-        self.auth_mgr.check_permissions(user_permissions, service, api_class, method, user_id)
-
-        # TODO : Get User All Projects (Cached)
-        projects = []
+        self.auth_mgr.check_permissions(permission_matchers, service, api_class, method, user_id)
 
         changed_parameter = self.auth_mgr.change_parameter(role_type, parameter, user_id, domain_id, projects)
 
@@ -47,7 +95,52 @@ class AuthorizationService(BaseService):
             'changed_parameter': changed_parameter
         }
 
-    @cache.cacheable(key='user-roles:{domain_id}:{user_id}', expire=86400)
+    @staticmethod
+    def _check_request(request):
+        for key in ['service', 'api_class', 'method', 'parameter']:
+            if key not in request:
+                raise ERROR_REQUIRED_PARAMETER(key=f'requests.{key}')
+
+    def _get_effective_permission(self, user_id, domain_id):
+        generation = self.auth_mgr.get_permission_generation(domain_id)
+        cache_key = f'effective-permission:{domain_id}:{generation}:{user_id}'
+
+        if cache.is_set():
+            effective_permission = cache.get(cache_key)
+            if effective_permission and effective_permission.get('version') == _EFFECTIVE_PERMISSION_VERSION:
+                return effective_permission
+
+        role_type, user_roles = self._get_user_roles(user_id, domain_id)
+        role_permissions = [self._get_role_permission(role_id, domain_id) for role_id in user_roles]
+
+        permissions = []
+        managed_policies = []
+        for role_permission in role_permissions:
+            permissions += role_permission['permissions']
+            managed_policies += role_permission['managed_policies']
+
+        permissions = list(dict.fromkeys(permissions))
+
+        effective_permission = {
+            'version': _EFFECTIVE_PERMISSION_VERSION,
+            'role_type': role_type,
+            'roles': user_roles,
+            'permissions': permissions,
+            'permission_digest': get_permissions_digest(permissions),
+            'managed_policies': list(dict.fromkeys(managed_policies))
+        }
+
+        if cache.is_set():
+            cache.set(cache_key, effective_permission, expire=86400)
+
+        return effective_permission
+
+    def _get_user_projects(self, role_type, user_id, domain_id):
+        if role_type == 'PROJECT':
+            return self.auth_mgr.get_user_projects(user_id, domain_id)
+        else:
+            return set()
+
     def _get_user_roles(self, user_id, domain_id):
         user_mgr: UserManager = self.locator.get_manager('UserManager')
         user_vo = user_mgr.get_user(user_id, domain_id)
@@ -65,29 +158,35 @@ class AuthorizationService(BaseService):
 
         return role_type, user_roles
 
-    def _get_permissions(self, roles, domain_id):
-        permissions = []
-
-        for role_id in roles:
-            permissions += self._get_role_permissions(role_id, domain_id)
-
-        return permissions
-
-    @cache.cacheable(key='role:{domain_id}:{role_id}', expire=86400)
-    def _get_role_permissions(self, role_id, domain_id):
+    @cache.cacheable(key='role-permission:{domain_id}:{role_id}', expire=86400)
+    def _get_role_permission(self, role_id, domain_id):
         role_mgr: RoleManager = self.locator.get_manager('RoleManager')
         role_vo = role_mgr.get_role(role_id, domain_id)
-        role_permissions = []
+        permissions = []
+        managed_policies = []
 
         for role_policy in role_vo.policies:
             if role_policy.policy_type == 'CUSTOM':
-                role_permissions += role_policy.policy.permissions
+                permissions += role_policy.policy.permissions
 
             elif role_policy.policy_type == 'MANAGED':
-                role_policy += self._get_managed_policy_permissions(role_policy.url)
+                managed_policies.append(role_policy.url)
+
+        return {
+            'permissions': permissions,
+            'managed_policies': managed_policies
+        }
+
+    @staticmethod
+    def _get_managed_policy_matchers(policy_urls):
+        loader = get_managed_policy_loader()
+        matchers = []
 
-        return role_permissions
+        for policy_url in policy_urls:
+            try:
+                matchers.append(loader.get_matcher(policy_url))
+            except Exception as e:
+                _LOGGER.error(f'[_get_managed_policy_matchers] Failed to load managed policy. '
+                              f'(url={policy_url}, reason={e})')
 
-    # TODO: Managed Policy Cache
-    def _get_managed_policy_permissions(self, policy_url):
-        return []
\ No newline at end of file
+        return matchers
\ No newline at end of file
@@ -0,0 +1,125 @@
+import logging
+from spaceone.core.service import *
+from spaceone.identity.error.error_project import *
+from spaceone.identity.manager.role_manager import RoleManager
+from spaceone.identity.manager.user_manager import UserManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MemberService(BaseService):
+    """ Batch member changes shared by ProjectService and ProjectGroupService
+
+    member_mgr is a MemberMapManager of the target (project or project group).
+    Errors are raised with error_args, the id of the target
+    (e.g. {'project_id': 'project-xxx'}).
+    """
+
+    def _add_members(self, member_mgr, target_vo, members, domain_id, exist_error, error_args):
+        user_vos = self._get_users_by_ids([member.get('user_id') for member in members], domain_id)
+        role_vos = self._get_roles_by_ids(list(set(role_id for member in members
+                                                   for role_id in member.get('roles', []))), domain_id)
+
+        results = []
+        new_members = []
+        added_user_ids = set()
+        for member in members:
+            user_id = member.get('user_id')
+            result = {'user_id': user_id, 'success': True}
+            try:
+                if user_id in added_user_ids:
+                    raise exist_error(user_id=user_id, **error_args)
+
+                new_members.append((result, self._make_member(member, user_vos, role_vos)))
+                added_user_ids.add(user_id)
+            except ERROR_BASE as e:
+                result.update({'success': False, 'error_code': e.error_code, 'message': e.message})
+
+            results.append(result)
+
+        exist_user_ids = member_mgr.add_members(target_vo, [new_member for _, new_member in new_members])
+
+        for result, _ in new_members:
+            user_id = result['user_id']
+            if user_id in exist_user_ids:
+                e = exist_error(user_id=user_id, **error_args)
+                result.update({'success': False, 'error_code': e.error_code, 'message': e.message})
+
+        return results
+
+    def _remove_members(self, member_mgr, target_vo, user_ids, domain_id, not_found_error, error_args):
+        user_ids = list(dict.fromkeys(user_ids))
+
+        user_vos = self._get_users_by_ids(user_ids, domain_id)
+        removed_user_ids = member_mgr.remove_members(target_vo, list(user_vos.values()))
+
+        results = []
+        for user_id in user_ids:
+            if user_id in removed_user_ids:
+                results.append({'user_id': user_id, 'success': True})
+            else:
+                if user_id in user_vos:
+                    e = not_found_error(user_id=user_id, **error_args)
+                else:
+                    e = ERROR_NOT_FOUND(key='user_id', value=user_id)
+
+                results.append({
+                    'user_id': user_id,
+                    'success': False,
+                    'error_code': e.error_code,
+                    'message': e.message
+                })
+
+        return results
+
+    def _get_roles_by_ids(self, role_ids, domain_id):
+        if not role_ids:
+            return {}
+
+        role_mgr: RoleManager = self.locator.get_manager('RoleManager')
+        role_vos, total_count = role_mgr.list_roles({
+            'filter': [{
+                'k': 'role_id',
+                'v': role_ids,
+                'o': 'in'
+            }, {
+                'k': 'domain_id',
+                'v': domain_id,
+                'o': 'eq'
+            }]
+        })
+
+        return {role_vo.role_id: role_vo for role_vo in role_vos}
+
+    def _get_users_by_ids(self, user_ids, domain_id):
+        user_mgr: UserManager = self.locator.get_manager('UserManager')
+        return {user_vo.user_id: user_vo for user_vo in user_mgr.list_users_by_ids(user_ids, domain_id)}
+
+    def _make_member(self, member, user_vos, role_vos):
+        user_id = member.get('user_id')
+        if user_id not in user_vos:
+            raise ERROR_NOT_FOUND(key='user_id', value=user_id)
+
+        role_ids = member.get('roles', [])
+        not_found_role_ids = [role_id for role_id in role_ids if role_id not in role_vos]
+        if not_found_role_ids:
+            raise ERROR_NOT_FOUND(key='roles', value=str(not_found_role_ids))
+
+        roles = [role_vos[role_id] for role_id in role_ids]
+        self._check_role_type(user_vos[user_id].roles, roles)
+
+        return {
+            'user': user_vos[user_id],
+            'roles': roles,
+            'labels': list(set(member.get('labels', [])))
+        }
+
+    @staticmethod
+    def _check_role_type(user_role_vos, target_role_vos):
+        for role_vo in user_role_vos:
+            if role_vo.role_type == 'SYSTEM':
+                raise ERROR_SYSTEM_ROLE_USER()
+
+        for role_vo in target_role_vos:
+            if role_vo.role_type != 'PROJECT':
+                raise ERROR_ONLY_PROJECT_ROLE_TYPE_ALLOWED()
@@ -6,6 +6,7 @@ from spaceone.identity.manager.project_group_manager import ProjectGroupManager
 from spaceone.identity.error.custom import *
 from spaceone.identity.manager.role_manager import RoleManager
 from spaceone.identity.manager.user_manager import UserManager
+from spaceone.identity.service.member_service import MemberService
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -13,7 +14,7 @@ _LOGGER = logging.getLogger(__name__)
 @authentication_handler
 @authorization_handler
 @event_handler
-class ProjectGroupService(BaseService):
+class ProjectGroupService(MemberService):
 
     def __init__(self, metadata):
         super().__init__(metadata)
@@ -42,6 +43,8 @@ class ProjectGroupService(BaseService):
         if 'parent_project_group_id' in params:
             params['parent_project_group'] = self._get_parent_project_group(params['parent_project_group_id'],
                                                                             params['domain_id'])
+            self.project_group_mgr.check_parent_project_group(None, params['parent_project_group'],
+                                                              params['domain_id'])
         else:
             params['parent_project_group'] = None
 
@@ -82,6 +85,8 @@ class ProjectGroupService(BaseService):
             if 'parent_project_group_id' in params:
                 params['parent_project_group'] = self._get_parent_project_group(
                     params['parent_project_group_id'], params['domain_id'], params['project_group_id'])
+                self.project_group_mgr.check_parent_project_group(params['project_group_id'],
+                                                                  params['parent_project_group'], domain_id)
 
         if 'template_id' in params:
             # TODO: Template service is NOT be implemented yet
@@ -144,6 +149,28 @@ class ProjectGroupService(BaseService):
 
         return self.project_group_mgr.add_member(project_group_vo, user_vo, roles, labels)
 
+    @transaction
+    @check_required(['project_group_id', 'members', 'domain_id'])
+    def add_members(self, params):
+        """ Add project group members at once
+
+        Args:
+            params (dict): {
+                'project_group_id': 'str',
+                'members': 'list of dict (user_id, roles, labels)',
+                'domain_id': 'str'
+            }
+
+        Returns:
+            results (list)
+        """
+
+        domain_id = params['domain_id']
+        project_group_vo = self.project_group_mgr.get_project_group(params['project_group_id'], domain_id)
+
+        return self._add_members(self.project_group_mgr, project_group_vo, params['members'], domain_id,
+                                 ERROR_ALREADY_EXIST_USER_IN_PROJECT_GROUP, {'project_group_id': project_group_vo.project_group_id})
+
     @transaction
     @check_required(['project_group_id', 'user_id', 'domain_id'])
     def modify_member(self, params):
@@ -175,8 +202,7 @@ class ProjectGroupService(BaseService):
 
         self._check_role_type(user_vo.roles, roles)
 
-        self.project_group_mgr.remove_member(project_group_vo, project_group_member_vo)
-        return self.project_group_mgr.add_member(project_group_vo, user_vo, roles, labels)
+        return self.project_group_mgr.update_member(project_group_member_vo, roles, labels)
 
     @transaction
     @check_required(['project_group_id', 'domain_id', 'user_id'])
@@ -203,6 +229,28 @@ class ProjectGroupService(BaseService):
         project_group_member_vo = self._get_project_group_member(project_group_vo, user_vo)
         self.project_group_mgr.remove_member(project_group_vo, project_group_member_vo)
 
+    @transaction
+    @check_required(['project_group_id', 'users', 'domain_id'])
+    def remove_members(self, params):
+        """ Remove project group members at once
+
+        Args:
+            params (dict): {
+                'project_group_id': 'str',
+                'users': 'list of user_id',
+                'domain_id': 'str'
+            }
+
+        Returns:
+            results (list)
+        """
+
+        domain_id = params['domain_id']
+        project_group_vo = self.project_group_mgr.get_project_group(params['project_group_id'], domain_id)
+
+        return self._remove_members(self.project_group_mgr, project_group_vo, params['users'], domain_id,
+                                    ERROR_NOT_FOUND_USER_IN_PROJECT_GROUP, {'project_group_id': project_group_vo.project_group_id})
+
     @transaction
     @check_required(['project_group_id', 'domain_id'])
     @change_only_key({'parent_project_group_info': 'parent_project_group'})
@@ -281,18 +329,22 @@ class ProjectGroupService(BaseService):
         if 'filter' not in query:
             query['filter'] = []
 
-        related_project_groups = []
         project_group_vo = self.project_group_mgr.get_project_group(project_group_id, domain_id)
-        related_project_groups.append(project_group_vo)
 
         if recursive:
-            related_project_groups = self._get_related_project_group(project_group_vo, related_project_groups)
-
-        query['filter'].append({
-            'k': 'project_group',
-            'v': related_project_groups,
-            'o': 'in'
-        })
+            # Descendants come from one indexed query on project_group_path.
+            project_group_vos = self.project_group_mgr.list_child_project_groups(project_group_vo, include_self=True)
+            query['filter'].append({
+                'k': 'project_group',
+                'v': list(project_group_vos.only('project_group_id')),
+                'o': 'in'
+            })
+        else:
+            query['filter'].append({
+                'k': 'project_group',
+                'v': [project_group_vo],
+                'o': 'in'
+            })
 
         return self.project_mgr.list_projects(query)
 
@@ -315,24 +367,6 @@ class ProjectGroupService(BaseService):
         query = params.get('query', {})
         return self.project_group_mgr.stat_project_groups(query)
 
-    def _get_related_project_group(self, project_group_vo, related_project_groups):
-        query = {
-            'filter': [{
-                'k': 'parent_project_group',
-                'v': project_group_vo,
-                'o': 'eq'
-            }]
-        }
-
-        project_group_vos, total_count = self.project_group_mgr.list_project_groups(query)
-
-        if total_count > 0:
-            related_project_groups += project_group_vos
-            for pg_vo in project_group_vos:
-                related_project_groups = self._get_related_project_group(pg_vo, related_project_groups)
-
-        return related_project_groups
-
     def _get_roles(self, role_ids, domain_id):
         role_mgr: RoleManager = self.locator.get_manager('RoleManager')
         role_vos, total_count = role_mgr.list_roles({
@@ -373,7 +407,7 @@ class ProjectGroupService(BaseService):
         parent_project_group_vos, total_count = self.project_group_mgr.list_project_groups({'filter': query_filter})
 
         if total_count == 0:
-            ERROR_NOT_FOUND(key='parent_project_group_id', value=parent_project_group_id)
+            raise ERROR_NOT_FOUND(key='parent_project_group_id', value=parent_project_group_id)
 
         return parent_project_group_vos[0]
 
@@ -406,13 +440,3 @@ class ProjectGroupService(BaseService):
         }
 
         return self.project_group_mgr.list_project_group_members(query)
-
-    @staticmethod
-    def _check_role_type(user_role_vos, project_group_role_vos):
-        for role_vo in user_role_vos:
-            if role_vo.role_type == 'SYSTEM':
-                raise ERROR_SYSTEM_ROLE_USER()
-
-        for role_vo in project_group_role_vos:
-            if role_vo.role_type != 'PROJECT':
-                raise ERROR_ONLY_PROJECT_ROLE_TYPE_ALLOWED()
@@ -5,6 +5,7 @@ from spaceone.identity.manager.project_manager import ProjectManager
 from spaceone.identity.manager.project_group_manager import ProjectGroupManager
 from spaceone.identity.manager.role_manager import RoleManager
 from spaceone.identity.manager.user_manager import UserManager
+from spaceone.identity.service.member_service import MemberService
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,7 +13,7 @@ _LOGGER = logging.getLogger(__name__)
 @authentication_handler
 @authorization_handler
 @event_handler
-class ProjectService(BaseService):
+class ProjectService(MemberService):
 
     def __init__(self, metadata):
         super().__init__(metadata)
@@ -137,6 +138,28 @@ class ProjectService(BaseService):
 
         return self.project_mgr.add_member(project_vo, user_vo, roles, labels)
 
+    @transaction
+    @check_required(['project_id', 'members', 'domain_id'])
+    def add_members(self, params):
+        """ Add project members at once
+
+        Args:
+            params (dict): {
+                'project_id': 'str',
+                'members': 'list of dict (user_id, roles, labels)',
+                'domain_id': 'str'
+            }
+
+        Returns:
+            results (list)
+        """
+
+        domain_id = params['domain_id']
+        project_vo = self.project_mgr.get_project(params['project_id'], domain_id)
+
+        return self._add_members(self.project_mgr, project_vo, params['members'], domain_id,
+                                 ERROR_ALREADY_EXIST_USER_IN_PROJECT, {'project_id': project_vo.project_id})
+
     @transaction
     @check_required(['project_id', 'user_id', 'domain_id'])
     def modify_member(self, params):
@@ -169,8 +192,7 @@ class ProjectService(BaseService):
 
         self._check_role_type(user_vo.roles, roles)
 
-        self.project_mgr.remove_member(project_vo, project_member_vo)
-        return self.project_mgr.add_member(project_vo, user_vo, roles, labels)
+        return self.project_mgr.update_member(project_member_vo, roles, labels)
 
     @transaction
     @check_required(['project_id', 'user_id', 'domain_id'])
@@ -198,6 +220,28 @@ class ProjectService(BaseService):
         project_member_vo = self._get_project_member(project_vo, user_vo)
         self.project_mgr.remove_member(project_vo, project_member_vo)
 
+    @transaction
+    @check_required(['project_id', 'users', 'domain_id'])
+    def remove_members(self, params):
+        """ Remove project members at once
+
+        Args:
+            params (dict): {
+                'project_id': 'str',
+                'users': 'list of user_id',
+                'domain_id': 'str'
+            }
+
+        Returns:
+            results (list)
+        """
+
+        domain_id = params['domain_id']
+        project_vo = self.project_mgr.get_project(params['project_id'], domain_id)
+
+        return self._remove_members(self.project_mgr, project_vo, params['users'], domain_id,
+                                    ERROR_NOT_FOUND_USER_IN_PROJECT, {'project_id': project_vo.project_id})
+
     @transaction
     @check_required(['project_id', 'domain_id'])
     @change_only_key({'project_group_info': 'project_group'})
@@ -345,13 +389,3 @@ class ProjectService(BaseService):
         }
 
         return self.project_mgr.list_project_members(query)
-
-    @staticmethod
-    def _check_role_type(user_role_vos, project_role_vos):
-        for role_vo in user_role_vos:
-            if role_vo.role_type == 'SYSTEM':
-                raise ERROR_SYSTEM_ROLE_USER()
-
-        for role_vo in project_role_vos:
-            if role_vo.role_type != 'PROJECT':
-                raise ERROR_ONLY_PROJECT_ROLE_TYPE_ALLOWED()
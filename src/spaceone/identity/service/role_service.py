@@ -1,7 +1,13 @@
+import logging
+
 from spaceone.core.error import *
 from spaceone.core.service import *
+from spaceone.identity.lib.managed_policy import get_managed_policy_loader
 from spaceone.identity.manager import RoleManager, PolicyManager
 
+_LOGGER = logging.getLogger(__name__)
+
+
 @authentication_handler
 @authorization_handler
 @event_handler
@@ -67,11 +73,21 @@ class RoleService(BaseService):
         change_policies = []
         for policy in policies:
             if policy['policy_type'] == 'MANAGED':
-                # TODO: Check External URL
-                pass
+                self._check_managed_policy(policy.get('url'))
             elif policy['policy_type'] == 'CUSTOM':
                 policy['policy'] = policy_mgr.get_policy(policy['policy_id'], domain_id)
                 del policy['policy_id']
             change_policies.append(policy)
 
         return change_policies
+
+    @staticmethod
+    def _check_managed_policy(policy_url):
+        if not policy_url:
+            raise ERROR_REQUIRED_PARAMETER(key='policies.url')
+
+        try:
+            get_managed_policy_loader().load(policy_url)
+        except Exception as e:
+            _LOGGER.error(f'[_check_managed_policy] Failed to load managed policy. (url={policy_url}, reason={e})')
+            raise ERROR_INVALID_PARAMETER(key='policies.url', reason='Managed policy is not allowed or not available.')
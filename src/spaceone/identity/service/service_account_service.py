@@ -1,7 +1,7 @@
-from jsonschema import validate
-
+from spaceone.core import config
 from spaceone.core.service import *
 from spaceone.core.error import *
+from spaceone.identity.lib.schema_validator import validate_data
 from spaceone.identity.manager.service_account_manager import ServiceAccountManager
 from spaceone.identity.manager.project_manager import ProjectManager
 from spaceone.identity.manager.provider_manager import ProviderManager
@@ -16,6 +16,9 @@ class ServiceAccountService(BaseService):
         super().__init__(*args, **kwargs)
         self.service_account_mgr: ServiceAccountManager = self.locator.get_manager('ServiceAccountManager')
 
+        identity_conf = config.get_global('IDENTITY') or {}
+        self.import_chunk_size = identity_conf.get('service_account_import', {}).get('chunk_size', 500)
+
     @transaction
     @check_required(['name', 'data', 'provider', 'domain_id'])
     def create_service_account(self, params):
@@ -41,6 +44,41 @@ class ServiceAccountService(BaseService):
 
         return self.service_account_mgr.create_service_account(params)
 
+    @transaction
+    @check_required(['service_accounts', 'domain_id'])
+    def create_service_accounts(self, params):
+        """ Import service accounts at once
+
+        Service accounts are created chunk by chunk and each one gets its own
+        result. Chunks don't share a transaction: a failed chunk doesn't undo
+        the service accounts already imported by earlier chunks.
+
+        Args:
+            params (dict): {
+                'service_accounts': 'list of dict (name, data, provider, project_id, tags)',
+                'domain_id': 'str'
+            }
+
+        Returns:
+            results (list)
+        """
+
+        domain_id = params['domain_id']
+        service_accounts = params['service_accounts']
+        schemas = {}
+
+        results = []
+        for start in range(0, len(service_accounts), self.import_chunk_size):
+            chunk = service_accounts[start:start + self.import_chunk_size]
+
+            try:
+                results += self._create_service_account_chunk(chunk, schemas, domain_id)
+            except ERROR_BASE as e:
+                results += [{'name': service_account.get('name'), 'success': False, 'error_code': e.error_code,
+                             'message': e.message} for service_account in chunk]
+
+        return results
+
     @transaction
     @check_required(['service_account_id', 'domain_id'])
     def update_service_account(self, params):
@@ -167,15 +205,93 @@ class ServiceAccountService(BaseService):
         query = params.get('query', {})
         return self.service_account_mgr.stat_service_accounts(query)
 
+    def _create_service_account_chunk(self, service_accounts, schemas, domain_id):
+        project_ids = list(set(params['project_id'] for params in service_accounts if params.get('project_id')))
+        project_vos = self._get_projects_by_ids(project_ids, domain_id)
+
+        results = []
+        new_service_accounts = []
+        for params in service_accounts:
+            result = {'name': params.get('name'), 'success': True}
+            try:
+                new_service_accounts.append((result, self._make_service_account(params, schemas, project_vos)))
+            except ERROR_BASE as e:
+                result.update({'success': False, 'error_code': e.error_code, 'message': e.message})
+
+            results.append(result)
+
+        try:
+            created_results = self.service_account_mgr.create_service_accounts(
+                [create_params for _, create_params in new_service_accounts], domain_id)
+        except ERROR_BASE as e:
+            created_results = [e] * len(new_service_accounts)
+
+        for (result, _), created_result in zip(new_service_accounts, created_results):
+            if isinstance(created_result, ERROR_BASE):
+                result.update({'success': False, 'error_code': created_result.error_code,
+                               'message': created_result.message})
+            else:
+                result['service_account_id'] = created_result
+
+        return results
+
+    def _make_service_account(self, params, schemas, project_vos):
+        for key in ['name', 'data', 'provider']:
+            if key not in params:
+                raise ERROR_REQUIRED_PARAMETER(key=f'service_accounts.{key}')
+
+        provider = params['provider']
+        if provider not in schemas:
+            try:
+                schemas[provider] = self._get_service_account_schema(provider)
+            except ERROR_BASE as e:
+                schemas[provider] = e
+
+        if isinstance(schemas[provider], ERROR_BASE):
+            raise schemas[provider]
+
+        self._validate_data(params['data'], provider, schemas[provider])
+
+        create_params = {
+            'name': params['name'],
+            'data': params['data'],
+            'provider': provider,
+            'tags': params.get('tags', {})
+        }
+
+        if params.get('project_id'):
+            if params['project_id'] not in project_vos:
+                raise ERROR_NOT_FOUND(key='project_id', value=params['project_id'])
+
+            create_params['project'] = project_vos[params['project_id']]
+
+        return create_params
+
     def _check_data(self, data, provider):
+        self._validate_data(data, provider, self._get_service_account_schema(provider))
+
+    def _get_service_account_schema(self, provider):
         provider_mgr: ProviderManager = self.locator.get_manager('ProviderManager')
-        provider_vo = provider_mgr.get_provider(provider)
-        schema = provider_vo.template.get('service_account', {}).get('schema', [])
+        return provider_mgr.get_service_account_schema(provider)
+
+    @staticmethod
+    def _validate_data(data, provider, schema_info):
         try:
-            validate(instance=data, schema=schema)
+            error_message = validate_data(provider, schema_info['version'], schema_info['schema'], data)
         except Exception as e:
-            raise ERROR_INVALID_PARAMETER(key='data', reason=e.message)
+            raise ERROR_INVALID_PARAMETER(key='data', reason=getattr(e, 'message', str(e)))
+
+        if error_message:
+            raise ERROR_INVALID_PARAMETER(key='data', reason=error_message)
 
     def _get_project(self, project_id, domain_id):
         project_mgr: ProjectManager = self.locator.get_manager('ProjectManager')
         return project_mgr.get_project(project_id, domain_id)
+
+    def _get_projects_by_ids(self, project_ids, domain_id):
+        if not project_ids:
+            return {}
+
+        project_mgr: ProjectManager = self.locator.get_manager('ProjectManager')
+        return {project_vo.project_id: project_vo
+                for project_vo in project_mgr.list_projects_by_ids(project_ids, domain_id)}
@@ -1,10 +1,11 @@
 import logging
 
-from spaceone.core.auth.jwt import JWTAuthenticator, JWTUtil
+from spaceone.core.auth.jwt import JWTUtil
 from spaceone.core.service import *
 from spaceone.identity.error.error_authentication import *
-from spaceone.identity.manager import DomainManager, DomainSecretManager
-from spaceone.identity.model import Domain
+from spaceone.identity.lib.jwk_cache import get_authenticator, get_key_version
+from spaceone.identity.lib.verified_token_cache import get_verified_token_cache
+from spaceone.identity.manager import DomainManager, DomainSecretManager, LoginThrottleManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -13,45 +14,77 @@ _LOGGER = logging.getLogger(__name__)
 @event_handler
 class TokenService(BaseService):
 
+    def __init__(self, metadata):
+        super().__init__(metadata)
+        # Token managers keep no per-user state, so they are created once per service.
+        self._managers = {}
+
     @transaction
     @check_required(['credentials', 'domain_id'])
     def issue_token(self, params):
+        domain_id = params['domain_id']
         user_type = params['credentials'].get('user_type', 'USER')
+        user_id = params['credentials'].get('user_id')
+
+        login_throttle_mgr: LoginThrottleManager = self.locator.get_manager('LoginThrottleManager')
+        source = login_throttle_mgr.get_login_source(self.transaction.get_meta('peer'),
+                                                     self.transaction.get_meta('x-forwarded-for'))
+
+        login_throttle_mgr.check_login(domain_id, user_id, source)
 
         domain_secret_mgr: DomainSecretManager = self.locator.get_manager('DomainSecretManager')
-        private_key = domain_secret_mgr.get_domain_private_key(domain_id=params['domain_id'])
+        private_key = domain_secret_mgr.get_domain_private_key(domain_id=domain_id)
 
-        token_manager = self._create_token_manager(params['domain_id'], user_type)
-        token_manager.authenticate(params['credentials'], params['domain_id'])
+        token_manager = self._create_token_manager(domain_id, user_type)
 
-        return token_manager.issue_token(private_jwk=private_key)
+        try:
+            auth_result = token_manager.authenticate(params['credentials'], domain_id)
+        except (ERROR_AUTHENTICATE_FAILURE, ERROR_NOT_FOUND):
+            login_throttle_mgr.add_failure(domain_id, user_id, source)
+            raise
+
+        login_throttle_mgr.reset_user_failures(domain_id, user_id, source)
+
+        return token_manager.issue_token(auth_result, private_jwk=private_key)
 
     @transaction
     def refresh_token(self, params):
         refresh_token = self.transaction.get_meta('token')
-        domain_id = _extract_domain_id(refresh_token)
-
         domain_secret_mgr: DomainSecretManager = self.locator.get_manager('DomainSecretManager')
+
+        domain_id = _extract_domain_id(refresh_token)
         public_jwk = domain_secret_mgr.get_domain_public_key(domain_id=domain_id)
+
+        token_info = _get_verified_refresh_token(refresh_token, public_jwk)
+
+        if token_info is None:
+            token_info = _verify_refresh_token(refresh_token, domain_id, public_jwk)
+
+        domain_id = token_info['domain_id']
         private_jwk = domain_secret_mgr.get_domain_private_key(domain_id=domain_id)
 
-        token_info = _verify_refresh_token(refresh_token, public_jwk)
         token_mgr = self._create_token_manager(domain_id, token_info['user_type'])
-        token_mgr.check_refreshable(token_info['key'], token_info['ttl'])
+        auth_result = token_mgr.check_refreshable(token_info['user_id'], domain_id, token_info['key'],
+                                                  token_info['ttl'], token_info['family_id'])
 
-        return token_mgr.refresh_token(token_info['user_id'], domain_id,
-                                       ttl=token_info['ttl']-1, private_jwk=private_jwk)
+        return token_mgr.issue_token(auth_result, ttl=token_info['ttl']-1, private_jwk=private_jwk)
 
     def _create_token_manager(self, domain_id, user_type):
         if user_type == 'DOMAIN_OWNER':
-            return self.locator.get_manager('DomainOwnerTokenManager')
+            return self._get_manager('DomainOwnerTokenManager')
 
-        domain_mgr: DomainManager = self.locator.get_manager('DomainManager')
-        domain: Domain = domain_mgr.get_domain(domain_id)
-        if domain.plugin_info is None:
-            return self.locator.get_manager('DefaultTokenManager')
+        domain_mgr: DomainManager = self._get_manager('DomainManager')
+        domain_descriptor = domain_mgr.get_domain_descriptor(domain_id)
+        if domain_descriptor['auth_type'] == 'LOCAL':
+            return self._get_manager('DefaultTokenManager')
         else:
-            return self.locator.get_manager('PluginTokenManager')
+            return self._get_manager('PluginTokenManager')
+
+    def _get_manager(self, name):
+        if name not in self._managers:
+            self._managers[name] = self.locator.get_manager(name)
+
+        return self._managers[name]
 
 
 def _extract_domain_id(token):
@@ -69,9 +102,18 @@ def _extract_domain_id(token):
     return domain_id
 
 
-def _verify_refresh_token(token, public_jwk):
+def _get_verified_refresh_token(token, public_jwk):
+    decoded = get_verified_token_cache().get(token, get_key_version(public_jwk))
+
+    if decoded is None:
+        return None
+
+    return _make_refresh_token_info(decoded)
+
+
+def _verify_refresh_token(token, domain_id, public_jwk):
     try:
-        decoded = JWTAuthenticator(public_jwk).validate(token)
+        decoded = get_authenticator(domain_id, public_jwk).validate(token)
     except Exception as e:
         _LOGGER.error(f'[_verify_refresh_token] {e}')
         raise ERROR_AUTHENTICATE_FAILURE(message='Token validation failed.')
@@ -79,9 +121,17 @@ def _verify_refresh_token(token, public_jwk):
     if decoded.get('cat') != 'REFRESH_TOKEN':
         raise ERROR_INVALID_REFRESH_TOKEN()
 
+    get_verified_token_cache().set(token, get_key_version(public_jwk), decoded)
+
+    return _make_refresh_token_info(decoded)
+
+
+def _make_refresh_token_info(decoded):
     return {
         'user_id': decoded['aud'],
         'user_type': decoded['user_type'],
+        'domain_id': decoded['did'],
         'key': decoded['key'],
-        'ttl': decoded['ttl']
+        'ttl': decoded['ttl'],
+        'family_id': decoded.get('fam')
     }
@@ -2,7 +2,6 @@ from spaceone.core.service import *
 from spaceone.identity.error.error_user import *
 from spaceone.identity.error import ERROR_UNSUPPORTED_API
 from spaceone.identity.error.error_user import ERROR_NOT_ALLOWED_ROLE_TYPE
-from spaceone.identity.model import Domain
 from spaceone.identity.manager import UserManager, RoleManager, DomainManager
 
 
@@ -19,9 +18,9 @@ class UserService(BaseService):
     @check_required(['user_id', 'domain_id'])
     def create_user(self, params):
         domain_mgr: DomainManager = self.locator.get_manager('DomainManager')
-        domain: Domain = domain_mgr.get_domain(params['domain_id'])
+        domain_descriptor = domain_mgr.get_domain_descriptor(params['domain_id'])
 
-        return self.user_mgr.create_user(params, domain)
+        return self.user_mgr.create_user(params, domain_descriptor)
 
     @transaction
     @check_required(['user_id', 'domain_id'])
@@ -50,12 +49,12 @@ class UserService(BaseService):
             raise ERROR_REQUIRED_PARAMETER(key='search.keyword | search.user_id')
 
         domain_mgr: DomainManager = self.locator.get_manager('DomainManager')
-        domain_vo: Domain = domain_mgr.get_domain(params['domain_id'])
+        domain_descriptor = domain_mgr.get_domain_descriptor(params['domain_id'])
 
-        if not domain_vo.plugin_info:
+        if domain_descriptor['auth_type'] != 'EXTERNAL':
             raise ERROR_UNSUPPORTED_API(reason='Your domain does not use external authentication plugin.')
 
-        return self.user_mgr.find_user(params['search'], domain_vo)
+        return self.user_mgr.find_user(params['search'], domain_descriptor)
 
     @transaction
     @check_required(['user_id', 'roles', 'domain_id'])
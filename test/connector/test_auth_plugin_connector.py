@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.connector.auth_plugin_connector import AuthPluginConnector
+
+
+@patch('spaceone.core.pygrpc.client')
+class TestAuthPluginConnector(unittest.TestCase):
+
+    endpoint = 'grpc://auth-plugin:50051'
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        super().setUpClass()
+
+    def setUp(self):
+        self.auth_plugin_conn = AuthPluginConnector(transaction=Mock(), config={})
+
+    def test_call_login_after_find(self, mock_client):
+        mock_client.return_value.Auth.find.return_value = Mock()
+
+        # UserManager._call_find initializes the connector before calling the plugin.
+        self.auth_plugin_conn.initialize(self.endpoint)
+        with patch('spaceone.identity.connector.auth_plugin_connector.MessageToDict', return_value={}):
+            self.auth_plugin_conn.call_find('user', None, {})
+
+        self.auth_plugin_conn.call_login(self.endpoint, {'access_token': 'token'})
+
+        mock_client.assert_called_once_with(endpoint='auth-plugin:50051', version='plugin')
+        mock_client.return_value.Auth.login.assert_called_once()
+
+    def test_call_login_with_other_endpoint(self, mock_client):
+        self.auth_plugin_conn.initialize(self.endpoint)
+        self.auth_plugin_conn.call_login('grpc://other-plugin:50051', {'access_token': 'token'})
+
+        self.assertEqual(mock_client.call_count, 2)
+        self.assertEqual(mock_client.call_args[1]['endpoint'], 'other-plugin:50051')
+        self.assertEqual(self.auth_plugin_conn.endpoint, 'grpc://other-plugin:50051')
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
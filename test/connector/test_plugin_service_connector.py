@@ -0,0 +1,139 @@
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_GRPC_CONNECTION, ERROR_INTERNAL_API
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.connector.plugin_service_connector import PluginServiceConnector
+from spaceone.identity.error.custom import ERROR_PLUGIN_ENDPOINT_NOT_FOUND
+
+
+class MemoryCache:
+
+    def __init__(self):
+        self.data = {}
+
+    def is_set(self):
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, expire=None):
+        self.data[key] = value
+
+
+_CACHE = MemoryCache()
+
+
+@patch('spaceone.identity.connector.plugin_service_connector.cache', _CACHE)
+class TestPluginServiceConnector(unittest.TestCase):
+
+    cache_key = 'plugin-endpoint:domain-1:plugin-1:1.0'
+
+    connector_conf = {
+        'endpoint': {
+            'v1': 'grpc://plugin:50051'
+        },
+        'endpoint_cache': {
+            'ttl': 300,
+            'stale_ttl': 3600,
+            'negative_ttl': 30
+        }
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        super().setUpClass()
+
+    @patch('spaceone.core.pygrpc.client')
+    def setUp(self, *args):
+        _CACHE.data.clear()
+
+        transaction = Mock()
+        transaction.get_connection_meta.return_value = [('token', 'user-token')]
+
+        self.plugin_connector = PluginServiceConnector(transaction=transaction, config=dict(self.connector_conf))
+        self.get_plugin_endpoint = self.plugin_connector.client.Plugin.get_plugin_endpoint
+
+    def _set_stale_endpoint(self, endpoint):
+        _CACHE.set(self.cache_key, {'endpoint': endpoint, 'updated_at': time.time() - 600})
+
+    def test_cache_endpoint(self):
+        self.get_plugin_endpoint.return_value = Mock(endpoint='grpc://auth-plugin:50051')
+
+        for _ in range(2):
+            endpoint = self.plugin_connector.get_plugin_endpoint('plugin-1', '1.0', 'domain-1')
+            self.assertEqual(endpoint, 'grpc://auth-plugin:50051')
+
+        self.assertEqual(self.get_plugin_endpoint.call_count, 1)
+
+    def test_negative_cache(self):
+        # pygrpc raises remote errors as ERROR_INTERNAL_API with the remote error code.
+        self.get_plugin_endpoint.side_effect = ERROR_INTERNAL_API(_error_code='ERROR_NOT_FOUND',
+                                                                  message=' Value not found.')
+
+        for _ in range(2):
+            with self.assertRaises(ERROR_PLUGIN_ENDPOINT_NOT_FOUND):
+                self.plugin_connector.get_plugin_endpoint('plugin-1', '1.0', 'domain-1')
+
+        self.assertEqual(self.get_plugin_endpoint.call_count, 1)
+
+    def test_other_remote_error_is_not_cached(self):
+        self.get_plugin_endpoint.side_effect = ERROR_INTERNAL_API(_error_code='ERROR_PERMISSION_DENIED',
+                                                                  message='Permission denied.')
+
+        for _ in range(2):
+            with self.assertRaises(ERROR_INTERNAL_API):
+                self.plugin_connector.get_plugin_endpoint('plugin-1', '1.0', 'domain-1')
+
+        self.assertEqual(self.get_plugin_endpoint.call_count, 2)
+        self.assertIsNone(_CACHE.get(self.cache_key))
+
+    def test_connection_error_is_not_cached(self):
+        self.get_plugin_endpoint.side_effect = ERROR_GRPC_CONNECTION(channel='plugin:50051/v1', message='down')
+
+        for _ in range(2):
+            with self.assertRaises(ERROR_GRPC_CONNECTION):
+                self.plugin_connector.get_plugin_endpoint('plugin-1', '1.0', 'domain-1')
+
+        self.assertEqual(self.get_plugin_endpoint.call_count, 2)
+        self.assertIsNone(_CACHE.get(self.cache_key))
+
+    @patch('spaceone.identity.connector.plugin_service_connector._REVALIDATE_EXECUTOR')
+    def test_refresh_stale_endpoint_without_system_token(self, mock_executor):
+        self._set_stale_endpoint('grpc://old-plugin:50051')
+        self.get_plugin_endpoint.return_value = Mock(endpoint='grpc://new-plugin:50051')
+
+        endpoint = self.plugin_connector.get_plugin_endpoint('plugin-1', '1.0', 'domain-1')
+
+        self.assertEqual(endpoint, 'grpc://new-plugin:50051')
+        self.assertEqual(self.get_plugin_endpoint.call_args[1]['metadata'], [('token', 'user-token')])
+        mock_executor.submit.assert_not_called()
+
+    def test_keep_stale_endpoint_on_outage(self):
+        self._set_stale_endpoint('grpc://old-plugin:50051')
+        self.get_plugin_endpoint.side_effect = ERROR_GRPC_CONNECTION(channel='plugin:50051/v1', message='down')
+
+        endpoint = self.plugin_connector.get_plugin_endpoint('plugin-1', '1.0', 'domain-1')
+
+        self.assertEqual(endpoint, 'grpc://old-plugin:50051')
+
+    @patch('spaceone.identity.connector.plugin_service_connector._REVALIDATING', set())
+    @patch('spaceone.identity.connector.plugin_service_connector._REVALIDATE_EXECUTOR')
+    def test_revalidate_stale_endpoint_with_system_token(self, mock_executor):
+        self.plugin_connector.config['system_token'] = 'system-token'
+        self._set_stale_endpoint('grpc://old-plugin:50051')
+
+        endpoint = self.plugin_connector.get_plugin_endpoint('plugin-1', '1.0', 'domain-1')
+
+        self.assertEqual(endpoint, 'grpc://old-plugin:50051')
+        self.get_plugin_endpoint.assert_not_called()
+        self.assertEqual(mock_executor.submit.call_count, 1)
+        self.assertIn(('token', 'system-token'), mock_executor.submit.call_args[0][5])
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from spaceone.api.secret.v1.secret_pb2 import SecretInfo
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.connector.secret_connector import SecretConnector
+
+
+class TestSecretConnector(unittest.TestCase):
+
+    connector_conf = {
+        'endpoint': {
+            'v1': 'grpc://secret:50051'
+        },
+        'page_size': 2
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        super().setUpClass()
+
+    @patch('spaceone.core.pygrpc.client')
+    def setUp(self, *args):
+        self.secret_connector = SecretConnector(transaction=Mock(), config=self.connector_conf)
+
+    def _set_pages(self, *pages):
+        self.secret_connector.client.Secret.list.side_effect = [
+            Mock(results=[SecretInfo(secret_id=secret_id) for secret_id in page]) for page in pages
+        ]
+
+    def _get_keyset_filters(self):
+        keyset_filters = []
+        for call in self.secret_connector.client.Secret.list.call_args_list:
+            page_filter = call[0][0]['query']['filter']
+            keyset_filters.append([condition['v'] for condition in page_filter if condition['k'] == 'secret_id'])
+
+        return keyset_filters
+
+    def test_stop_at_short_page(self):
+        self._set_pages(['secret-1', 'secret-2'], ['secret-3', 'secret-4'], ['secret-5'])
+
+        secrets = list(self.secret_connector.list_secrets_by_page({'only': ['project_id']}, 'domain-1'))
+
+        self.assertEqual([secret['secret_id'] for secret in secrets],
+                         ['secret-1', 'secret-2', 'secret-3', 'secret-4', 'secret-5'])
+        self.assertEqual(self._get_keyset_filters(), [[], ['secret-2'], ['secret-4']])
+
+        page_query = self.secret_connector.client.Secret.list.call_args[0][0]['query']
+        self.assertEqual(page_query['only'], ['project_id', 'secret_id'])
+        self.assertEqual(page_query['page'], {'limit': 2})
+
+    def test_stop_at_empty_page(self):
+        self._set_pages(['secret-1', 'secret-2'], [])
+
+        secrets = list(self.secret_connector.list_secrets_by_page({}, 'domain-1'))
+
+        self.assertEqual(len(secrets), 2)
+        self.assertEqual(self._get_keyset_filters(), [[], ['secret-2']])
+
+    def test_no_secrets(self):
+        self._set_pages([])
+
+        self.assertEqual(list(self.secret_connector.list_secrets_by_page({}, 'domain-1')), [])
+        self.assertEqual(self.secret_connector.client.Secret.list.call_count, 1)
+
+    def test_query_is_not_changed(self):
+        query = {'filter': [{'k': 'service_account_id', 'v': 'sa-1', 'o': 'eq'}]}
+        self._set_pages(['secret-1', 'secret-2'], ['secret-3'])
+
+        list(self.secret_connector.list_secrets_by_page(query, 'domain-1'))
+
+        self.assertEqual(query, {'filter': [{'k': 'service_account_id', 'v': 'sa-1', 'o': 'eq'}]})
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
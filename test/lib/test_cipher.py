@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.lib.cipher import PasswordCipher
+from spaceone.identity.manager.token_manager import JWTManager
+
+_BCRYPT_OPTIONS = {'algorithm': 'bcrypt', 'bcrypt_rounds': 4, 'scrypt_n': 1024, 'scrypt_r': 8, 'scrypt_p': 1}
+_SCRYPT_OPTIONS = dict(_BCRYPT_OPTIONS, algorithm='scrypt')
+
+
+@patch('spaceone.identity.lib.cipher.get_password_worker_pool', return_value=False)
+class TestPasswordCipher(unittest.TestCase):
+
+    def setUp(self):
+        self.cipher = PasswordCipher()
+
+    def _hashpw(self, password, options):
+        with patch('spaceone.identity.lib.cipher.get_password_hash_options', return_value=options):
+            return self.cipher.hashpw(password)
+
+    def _needs_rehash(self, hashed, options):
+        with patch('spaceone.identity.lib.cipher.get_password_hash_options', return_value=options):
+            return self.cipher.needs_rehash(hashed)
+
+    def test_bcrypt(self, *args):
+        hashed = self._hashpw('password', _BCRYPT_OPTIONS)
+
+        self.assertTrue(hashed.startswith(b'$2b$04$'))
+        self.assertTrue(self.cipher.checkpw('password', hashed))
+        self.assertFalse(self.cipher.checkpw('wrong-password', hashed))
+
+    def test_scrypt(self, *args):
+        hashed = self._hashpw('password', _SCRYPT_OPTIONS)
+
+        self.assertTrue(hashed.startswith(b'$scrypt$n=1024,r=8,p=1$'))
+        self.assertTrue(self.cipher.checkpw('password', hashed))
+        self.assertFalse(self.cipher.checkpw('wrong-password', hashed))
+
+    def test_needs_rehash(self, *args):
+        bcrypt_hashed = self._hashpw('password', _BCRYPT_OPTIONS)
+        scrypt_hashed = self._hashpw('password', _SCRYPT_OPTIONS)
+
+        self.assertFalse(self._needs_rehash(bcrypt_hashed, _BCRYPT_OPTIONS))
+        self.assertTrue(self._needs_rehash(bcrypt_hashed, dict(_BCRYPT_OPTIONS, bcrypt_rounds=5)))
+        self.assertTrue(self._needs_rehash(bcrypt_hashed, _SCRYPT_OPTIONS))
+
+        self.assertFalse(self._needs_rehash(scrypt_hashed, _SCRYPT_OPTIONS))
+        self.assertTrue(self._needs_rehash(scrypt_hashed, dict(_SCRYPT_OPTIONS, scrypt_n=2048)))
+        self.assertTrue(self._needs_rehash(scrypt_hashed, _BCRYPT_OPTIONS))
+
+        self.assertTrue(self._needs_rehash(b'invalid', _BCRYPT_OPTIONS))
+
+    def test_rehash_password(self, *args):
+        user_vo = Mock(password=self._hashpw('password', _BCRYPT_OPTIONS))
+
+        with patch('spaceone.identity.lib.cipher.get_password_hash_options', return_value=_SCRYPT_OPTIONS):
+            JWTManager._rehash_password(user_vo, 'password', 'user-1')
+
+        hashed = user_vo.update.call_args[0][0]['password']
+        self.assertTrue(hashed.startswith(b'$scrypt$'))
+        self.assertTrue(self.cipher.checkpw('password', hashed))
+
+        # A hash made with the current settings is kept.
+        user_vo = Mock(password=hashed)
+        with patch('spaceone.identity.lib.cipher.get_password_hash_options', return_value=_SCRYPT_OPTIONS):
+            JWTManager._rehash_password(user_vo, 'password', 'user-1')
+
+        user_vo.update.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
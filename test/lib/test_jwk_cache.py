@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import patch
+
+from spaceone.core.auth.jwt import JWTUtil
+from spaceone.core.error import ERROR_AUTHENTICATE_FAILURE
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.lib import jwk_cache
+from spaceone.identity.lib.jwk_cache import get_signing_key, get_authenticator, get_key_version
+
+
+class TestJWKCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.private_jwk, cls.public_jwk = JWTUtil.generate_jwk()
+        super().setUpClass()
+
+    def setUp(self):
+        jwk_cache._KEYS.clear()
+
+    def test_get_signing_key(self):
+        signing_key = get_signing_key('domain-1', self.private_jwk)
+
+        self.assertIs(get_signing_key('domain-1', dict(self.private_jwk)), signing_key)
+        self.assertIsNot(get_signing_key('domain-2', self.private_jwk), signing_key)
+
+        # A regenerated domain secret gets a new key.
+        private_jwk, _ = JWTUtil.generate_jwk()
+        self.assertIsNot(get_signing_key('domain-1', private_jwk), signing_key)
+
+    def test_sign(self):
+        token = JWTUtil.encode({'did': 'domain-1'}, get_signing_key('domain-1', self.private_jwk))
+
+        self.assertEqual(JWTUtil.decode(token, self.public_jwk)['did'], 'domain-1')
+
+    def test_get_authenticator(self):
+        authenticator = get_authenticator('domain-1', self.public_jwk)
+        token = JWTUtil.encode({'did': 'domain-1'}, self.private_jwk)
+
+        self.assertIs(get_authenticator('domain-1', dict(self.public_jwk)), authenticator)
+        self.assertEqual(authenticator.validate(token)['did'], 'domain-1')
+
+        private_jwk, _ = JWTUtil.generate_jwk()
+        with self.assertRaises(ERROR_AUTHENTICATE_FAILURE):
+            authenticator.validate(JWTUtil.encode({'did': 'domain-1'}, private_jwk))
+
+    def test_get_key_version(self):
+        self.assertEqual(get_key_version(dict(self.private_jwk, kid='key-1')), 'key-1')
+        self.assertEqual(get_key_version(self.private_jwk), get_key_version(dict(reversed(self.private_jwk.items()))))
+        self.assertNotEqual(get_key_version(self.private_jwk), get_key_version(self.public_jwk))
+
+    @patch.object(jwk_cache, '_MAX_KEYS', 2)
+    def test_evict_least_recently_used(self):
+        signing_key = get_signing_key('domain-1', self.private_jwk)
+        get_signing_key('domain-2', self.private_jwk)
+        get_signing_key('domain-1', self.private_jwk)
+        get_signing_key('domain-3', self.private_jwk)
+
+        self.assertEqual(len(jwk_cache._KEYS), 2)
+        self.assertIs(get_signing_key('domain-1', self.private_jwk), signing_key)
+        self.assertNotIn(('private', 'domain-2', get_key_version(self.private_jwk), 'RS256'), jwk_cache._KEYS)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,93 @@
+import concurrent.futures
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.lib.managed_policy import ManagedPolicyLoader
+
+
+class SlowFetcher:
+
+    def __init__(self):
+        self.event = threading.Event()
+
+    def fetch(self, url, etag=None, timeout=None):
+        self.event.wait(timeout)
+        return "permissions: ['identity.*']", 'etag-1'
+
+
+class TestManagedPolicyLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.root_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root_dir)
+
+        self.policy_dir = os.path.join(self.root_dir, 'policies')
+        os.mkdir(self.policy_dir)
+        self.policy_path = self._write_policy(self.policy_dir, 'admin.yaml', ['identity.*'])
+        self.outside_path = self._write_policy(self.root_dir, 'outside.yaml', ['*'])
+
+        self.loader = ManagedPolicyLoader(refresh_interval=0, policy_dirs=[self.policy_dir])
+
+    @staticmethod
+    def _write_policy(directory, name, permissions):
+        path = os.path.join(directory, name)
+        with open(path, 'w') as f:
+            f.write('permissions:\n' + ''.join(f"  - '{permission}'\n" for permission in permissions))
+
+        return path
+
+    def test_load_file(self):
+        for url in [f'file://{self.policy_path}', self.policy_path]:
+            policy = self.loader.load(url)
+            self.assertTrue(policy['matcher'].match('identity', 'User', 'get'))
+            self.assertFalse(policy['matcher'].match('inventory', 'Server', 'list'))
+
+    def test_reload_unchanged_file(self):
+        policy = self.loader.load(self.policy_path)
+        self.assertIs(self.loader.load(self.policy_path)['matcher'], policy['matcher'])
+
+    def test_reject_file_outside_policy_dirs(self):
+        with self.assertRaises(ValueError):
+            self.loader.load(f'file://{self.outside_path}')
+
+    def test_reject_parent_path(self):
+        with self.assertRaises(ValueError):
+            self.loader.load(f'file://{self.policy_dir}/../outside.yaml')
+
+    def test_reject_symlink_escape(self):
+        link_path = os.path.join(self.policy_dir, 'link.yaml')
+        os.symlink(self.outside_path, link_path)
+
+        with self.assertRaises(ValueError):
+            self.loader.load(f'file://{link_path}')
+
+    def test_reject_remote_file_url(self):
+        with self.assertRaises(ValueError):
+            self.loader.load(f'file://remote-host{self.policy_path}')
+
+    def test_reject_files_without_policy_dirs(self):
+        loader = ManagedPolicyLoader(refresh_interval=0)
+
+        with self.assertRaises(ValueError):
+            loader.load(self.policy_path)
+
+    def test_get_matcher_timeout(self):
+        fetcher = SlowFetcher()
+        loader = ManagedPolicyLoader(refresh_interval=0, allowed_hosts=['policy.example.com'], load_wait=0.1,
+                                     fetchers={'https': fetcher})
+        url = 'https://policy.example.com/admin.yaml'
+
+        with self.assertRaises(concurrent.futures.TimeoutError):
+            loader.get_matcher(url)
+
+        fetcher.event.set()
+        loader.load(url)
+        self.assertTrue(loader.get_matcher(url).match('identity', 'User', 'get'))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
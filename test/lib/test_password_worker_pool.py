@@ -0,0 +1,51 @@
+import os
+import threading
+import time
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.error.error_authentication import ERROR_PASSWORD_WORKER_BUSY
+from spaceone.identity.lib.cipher import PasswordWorkerPool
+
+
+class TestPasswordWorkerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = PasswordWorkerPool(workers=1, max_queue=0, queue_timeout=0.1, timeout=0.5)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def test_run(self):
+        self.assertEqual(self.pool.run(pow, 2, 3), 8)
+
+    def test_busy(self):
+        thread = threading.Thread(target=self.pool.run, args=(time.sleep, 0.3))
+        thread.start()
+        time.sleep(0.1)
+
+        with self.assertRaises(ERROR_PASSWORD_WORKER_BUSY):
+            self.pool.run(pow, 2, 3)
+
+        thread.join()
+        self.assertEqual(self.pool.run(pow, 2, 3), 8)
+
+    def test_timeout_keeps_slot_until_done(self):
+        with self.assertRaises(ERROR_PASSWORD_WORKER_BUSY):
+            self.pool.run(time.sleep, 1)
+
+        with self.assertRaises(ERROR_PASSWORD_WORKER_BUSY):
+            self.pool.run(pow, 2, 3)
+
+        time.sleep(1.5)
+        self.assertEqual(self.pool.run(pow, 2, 3), 8)
+
+    def test_recreate_broken_pool(self):
+        with self.assertRaises(ERROR_PASSWORD_WORKER_BUSY):
+            self.pool.run(os._exit, 1)
+
+        self.assertEqual(self.pool.run(pow, 2, 3), 8)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
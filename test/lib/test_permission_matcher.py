@@ -0,0 +1,61 @@
+import fnmatch
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.lib.permission_matcher import PermissionMatcher, get_permission_matcher, \
+    get_permissions_digest
+
+
+class TestPermissionMatcher(unittest.TestCase):
+
+    permissions = [
+        'identity.User.get',
+        'identity.Project.*',
+        'inventory.*',
+        'repository.*.list',
+        'secret.Secret.get_?ata',
+        'statistics.[RS]*.stat'
+    ]
+
+    apis = [
+        'identity.User.get',
+        'identity.User.list',
+        'identity.Project.create',
+        'identity.ProjectGroup.create',
+        'inventory.Server.list',
+        'repository.Plugin.list',
+        'repository.Plugin.get',
+        'secret.Secret.get_data',
+        'statistics.Resource.stat',
+        'statistics.Schedule.stat',
+        'statistics.History.stat',
+        'monitoring.Log.list'
+    ]
+
+    def test_match_same_as_fnmatch(self):
+        matcher = PermissionMatcher(self.permissions)
+
+        for api in self.apis:
+            expected = any(fnmatch.fnmatchcase(api, p) for p in self.permissions)
+            self.assertEqual(expected, matcher.match_api(api), api)
+
+    def test_match_all(self):
+        matcher = PermissionMatcher(['*'])
+        self.assertTrue(matcher.match('identity', 'User', 'get'))
+
+    def test_empty_permissions(self):
+        matcher = PermissionMatcher([])
+        self.assertFalse(matcher)
+        self.assertFalse(matcher.match('identity', 'User', 'get'))
+
+    def test_get_permission_matcher_by_digest(self):
+        digest = get_permissions_digest(self.permissions)
+        matcher = get_permission_matcher(self.permissions, digest)
+
+        self.assertIs(matcher, get_permission_matcher(self.permissions))
+        self.assertIs(matcher, get_permission_matcher(list(self.permissions), digest))
+        self.assertIsNot(matcher, get_permission_matcher(['identity.User.get']))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,133 @@
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.lib.project_tree import ProjectTree, get_project_tree, patch_project_tree, \
+    invalidate_project_tree
+
+
+class TestProjectTree(unittest.TestCase):
+
+    project_groups = [
+        ('pg-root', None),
+        ('pg-a', 'pg-root'),
+        ('pg-b', 'pg-root'),
+        ('pg-a-1', 'pg-a')
+    ]
+
+    projects = [
+        ('project-root', 'pg-root'),
+        ('project-a', 'pg-a'),
+        ('project-a-1', 'pg-a-1'),
+        ('project-b', 'pg-b')
+    ]
+
+    def setUp(self):
+        self.tree = ProjectTree('domain-1', self.project_groups, self.projects)
+
+    def test_get_projects(self):
+        self.assertEqual(self.tree.get_projects(['pg-a']), {'project-a', 'project-a-1'})
+        self.assertEqual(self.tree.get_projects(['pg-a'], recursive=False), {'project-a'})
+        self.assertEqual(len(self.tree.get_projects(['pg-root'])), 4)
+        self.assertEqual(self.tree.get_projects(['pg-unknown']), set())
+
+    def test_get_ancestors(self):
+        self.assertEqual(self.tree.get_ancestors('pg-a-1'), ['pg-a', 'pg-root'])
+        self.assertEqual(self.tree.get_ancestors('pg-a-1', include_self=True), ['pg-a-1', 'pg-a', 'pg-root'])
+        self.assertEqual(self.tree.get_ancestors('pg-root'), [])
+        self.assertEqual(self.tree.get_ancestors('pg-unknown', include_self=True), ['pg-unknown'])
+
+    def test_move_project_group(self):
+        self.tree.move_project_group('pg-a', 'pg-b')
+
+        self.assertEqual(self.tree.get_ancestors('pg-a-1'), ['pg-a', 'pg-b', 'pg-root'])
+        self.assertEqual(self.tree.get_projects(['pg-b']), {'project-a', 'project-a-1', 'project-b'})
+
+    def test_add_and_remove(self):
+        self.tree.add_project_group('pg-c', 'pg-a')
+        self.tree.add_project('project-c', 'pg-c')
+        self.assertIn('project-c', self.tree.get_projects(['pg-root']))
+
+        self.tree.move_project('project-c', 'pg-b')
+        self.assertEqual(self.tree.get_project_group('project-c'), 'pg-b')
+        self.assertNotIn('project-c', self.tree.get_projects(['pg-a']))
+
+        self.tree.remove_project('project-c')
+        self.tree.remove_project_group('pg-a-1')
+        self.assertNotIn('pg-a-1', self.tree)
+        self.assertEqual(self.tree.get_projects(['pg-root']), {'project-root', 'project-a', 'project-b'})
+
+    def test_cycle_and_depth(self):
+        self.assertEqual(self.tree.get_depth('pg-a-1'), 3)
+        self.assertEqual(self.tree.get_height('pg-root'), 3)
+
+        self.tree.move_project_group('pg-root', 'pg-a-1')
+        self.assertEqual(set(self.tree.get_ancestors('pg-a')), {'pg-root', 'pg-a-1'})
+        self.assertEqual(len(self.tree.get_projects(['pg-a'])), 4)
+        self.assertEqual(self.tree.get_projects(['pg-root'], max_depth=1), {'project-root'})
+
+    def test_patch_cached_tree_by_copy(self):
+        tree = get_project_tree('domain-patch', lambda: (self.project_groups, self.projects), version='1')
+        patch_project_tree('domain-patch', 'add_project', 'project-c', 'pg-b', expected_version='1', version='2')
+
+        patched_tree = get_project_tree('domain-patch', lambda: ([], []), version='2')
+        self.assertIsNot(tree, patched_tree)
+        self.assertEqual(tree.get_projects(['pg-b']), {'project-b'})
+        self.assertEqual(patched_tree.get_projects(['pg-b']), {'project-b', 'project-c'})
+
+        invalidate_project_tree('domain-patch')
+
+    def test_copy_on_write(self):
+        project_groups = [('pg-0', None)] + [(f'pg-{index}', f'pg-{index // 2}') for index in range(1, 2000)]
+        projects = [(f'project-{index}', f'pg-{index}') for index in range(2000)]
+        tree = ProjectTree('domain-1', project_groups, projects)
+
+        patched_tree = tree.copy()
+        patched_tree.move_project_group('pg-1500', 'pg-3')
+        patched_tree.add_project_group('pg-new', 'pg-1500')
+        patched_tree.add_project('project-new', 'pg-new')
+        patched_tree.remove_project('project-1')
+
+        self.assertEqual(tree.get_parent('pg-1500'), 'pg-750')
+        self.assertNotIn('pg-new', tree)
+        self.assertIsNone(tree.get_project_group('project-new'))
+        self.assertEqual(tree.get_project_group('project-1'), 'pg-1')
+        self.assertNotIn('project-new', tree.get_projects(['pg-0']))
+
+        self.assertEqual(patched_tree.get_ancestors('pg-new'), ['pg-1500', 'pg-3', 'pg-1', 'pg-0'])
+        self.assertEqual(patched_tree.get_projects(['pg-1500']), {'project-1500', 'project-new'})
+        self.assertIsNone(patched_tree.get_project_group('project-1'))
+
+        # Pages which the patch did not write are shared with the original tree.
+        self.assertIs(patched_tree._group_ids._pages[0], tree._group_ids._pages[0])
+        self.assertIsNot(patched_tree._parents._pages[2], tree._parents._pages[2])
+
+    def test_copies_of_same_tree(self):
+        first_tree = self.tree.copy()
+        second_tree = self.tree.copy()
+
+        first_tree.add_project_group('pg-first', 'pg-a')
+        first_tree.add_project('project-first', 'pg-first')
+        first_tree.move_project('project-b', 'pg-a')
+        second_tree.add_project_group('pg-second', 'pg-b')
+        second_tree.add_project('project-second', 'pg-second')
+        second_tree.remove_project('project-a')
+
+        self.assertEqual(first_tree.get_projects(['pg-a']),
+                         {'project-a', 'project-a-1', 'project-b', 'project-first'})
+        self.assertNotIn('pg-second', first_tree)
+        self.assertIsNone(first_tree.get_project_group('project-second'))
+
+        self.assertEqual(second_tree.get_projects(['pg-b']), {'project-b', 'project-second'})
+        self.assertEqual(second_tree.get_ancestors('pg-second'), ['pg-b', 'pg-root'])
+        self.assertNotIn('pg-first', second_tree)
+        self.assertIsNone(second_tree.get_project_group('project-a'))
+
+        self.assertEqual(self.tree.get_projects(['pg-root']),
+                         {'project-root', 'project-a', 'project-a-1', 'project-b'})
+        self.assertNotIn('pg-first', self.tree)
+        self.assertNotIn('pg-second', self.tree)
+        self.assertEqual(self.tree._parents._owned_pages, {0})
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
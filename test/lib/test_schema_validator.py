@@ -0,0 +1,41 @@
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.lib.schema_validator import get_schema_validator, validate_data, invalidate_schema_validators
+
+
+class TestSchemaValidator(unittest.TestCase):
+
+    schema = {
+        'type': 'object',
+        'properties': {
+            'account_id': {'type': 'string'}
+        },
+        'required': ['account_id']
+    }
+
+    def tearDown(self):
+        invalidate_schema_validators('aws')
+
+    def test_validate_data(self):
+        self.assertIsNone(validate_data('aws', 'v1', self.schema, {'account_id': '1234'}))
+        self.assertIn('account_id', validate_data('aws', 'v1', self.schema, {}))
+
+    def test_reuse_validator_of_same_version(self):
+        validator = get_schema_validator('aws', 'v1', self.schema)
+        self.assertIs(get_schema_validator('aws', 'v1', self.schema), validator)
+
+    def test_replace_validator_of_new_version(self):
+        validate_data('aws', 'v1', self.schema, {})
+
+        schema = dict(self.schema, required=[])
+        self.assertIsNone(validate_data('aws', 'v2', schema, {}))
+
+    def test_invalidate(self):
+        validator = get_schema_validator('aws', 'v1', self.schema)
+        invalidate_schema_validators('aws')
+        self.assertIsNot(get_schema_validator('aws', 'v1', self.schema), validator)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,41 @@
+import time
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.lib.jwk_cache import get_key_version
+from spaceone.identity.lib.verified_token_cache import VerifiedTokenCache
+
+
+class TestVerifiedTokenCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = VerifiedTokenCache(max_size=2)
+        self.claims = {'did': 'domain-1', 'exp': time.time() + 60}
+
+    def test_get(self):
+        self.cache.set('token-1', 'key-1', self.claims)
+
+        self.assertEqual(self.cache.get('token-1', 'key-1'), self.claims)
+        self.assertIsNone(self.cache.get('token-2', 'key-1'))
+
+    def test_rotated_domain_key(self):
+        old_key_version = get_key_version({'kty': 'RSA', 'n': 'old', 'e': 'AQAB'})
+        new_key_version = get_key_version({'kty': 'RSA', 'n': 'new', 'e': 'AQAB'})
+        self.cache.set('token-1', old_key_version, self.claims)
+
+        self.assertIsNone(self.cache.get('token-1', new_key_version))
+        self.assertEqual(get_key_version({'kid': 'key-1', 'n': 'old'}), 'key-1')
+
+    def test_expired_and_evicted(self):
+        self.cache.set('token-expired', 'key-1', {'exp': time.time() - 1})
+        self.assertIsNone(self.cache.get('token-expired', 'key-1'))
+
+        for index in range(3):
+            self.cache.set(f'token-{index}', 'key-1', self.claims)
+
+        self.assertIsNone(self.cache.get('token-0', 'key-1'))
+        self.assertEqual(self.cache.get('token-2', 'key-1'), self.claims)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
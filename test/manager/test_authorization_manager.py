@@ -0,0 +1,121 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from mongoengine import connect, disconnect
+
+from spaceone.core import config, utils
+from spaceone.core.error import ERROR_PERMISSION_DENIED
+from spaceone.core.model.mongo_model import MongoModel
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.manager.authorization_manager import AuthorizationManager
+from spaceone.identity.model.project_group_model import ProjectGroup, ProjectGroupMemberMap
+from spaceone.identity.model.project_model import Project, ProjectMemberMap
+from spaceone.identity.model.user_model import User
+from test.factory.project_factory import ProjectFactory
+from test.factory.project_group_factory import ProjectGroupFactory
+
+
+class MemoryCache:
+
+    def __init__(self):
+        self.data = {}
+
+    def is_set(self):
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, expire=None):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+_CACHE = MemoryCache()
+
+
+@patch('spaceone.identity.manager.authorization_manager.cache', _CACHE)
+@patch.object(MongoModel, 'connect', return_value=None)
+class TestAuthorizationManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        connect('test', host='mongomock://localhost')
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def setUp(self, *args):
+        _CACHE.data.clear()
+        self.domain_id = utils.generate_id('domain')
+
+        self.root_vo = ProjectGroupFactory(domain_id=self.domain_id)
+        self.child_vo = ProjectGroupFactory(parent_project_group=self.root_vo, domain_id=self.domain_id)
+        self.other_vo = ProjectGroupFactory(domain_id=self.domain_id)
+
+        self.root_project_vo = ProjectFactory(project_group=self.root_vo, domain_id=self.domain_id)
+        self.child_project_vo = ProjectFactory(project_group=self.child_vo, domain_id=self.domain_id)
+        self.other_project_vo = ProjectFactory(project_group=self.other_vo, domain_id=self.domain_id)
+
+        self.user_vo = User.create({'user_id': 'user-1', 'name': 'user-1', 'state': 'ENABLED',
+                                    'domain_id': self.domain_id})
+        ProjectGroupMemberMap.create({'project_group': self.root_vo, 'user': self.user_vo, 'roles': [],
+                                      'labels': []})
+
+        self.auth_mgr = AuthorizationManager(Mock())
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def tearDown(self, *args):
+        ProjectMemberMap.objects.filter().delete()
+        ProjectGroupMemberMap.objects.filter().delete()
+        User.objects.filter().delete()
+        Project.objects.filter().delete()
+        # Parent references deny the deletion of a parent through the model.
+        ProjectGroup._get_collection().delete_many({})
+
+    def test_get_user_projects(self, *args):
+        ProjectMemberMap.create({'project': self.other_project_vo, 'user': self.user_vo, 'roles': [], 'labels': []})
+
+        projects = self.auth_mgr.get_user_projects('user-1', self.domain_id)
+
+        # Members of a project group see the projects of its child project groups too.
+        self.assertEqual(projects, {self.root_project_vo.project_id, self.child_project_vo.project_id,
+                                    self.other_project_vo.project_id})
+        self.assertEqual(_CACHE.get(f'user-projects:{self.domain_id}:user-1'), sorted(projects))
+
+    def test_change_parameter(self, *args):
+        projects = self.auth_mgr.get_user_projects('user-1', self.domain_id)
+
+        parameter = self.auth_mgr.change_parameter('PROJECT', {}, 'user-1', self.domain_id, projects)
+        self.assertEqual(parameter['domain_id'], self.domain_id)
+        self.assertEqual(parameter['project_id'], sorted(projects))
+
+        self.auth_mgr.change_parameter('PROJECT', {'project_id': self.child_project_vo.project_id}, 'user-1',
+                                       self.domain_id, projects)
+
+        with self.assertRaises(ERROR_PERMISSION_DENIED):
+            self.auth_mgr.change_parameter('PROJECT', {'project_id': [self.child_project_vo.project_id,
+                                                                      self.other_project_vo.project_id]},
+                                           'user-1', self.domain_id, projects)
+
+    def test_update_user_project_cache(self, *args):
+        self.auth_mgr.get_user_projects('user-1', self.domain_id)
+
+        self.auth_mgr.add_user_project_cache('user-1', self.domain_id, project_vo=self.other_project_vo)
+        self.assertIn(self.other_project_vo.project_id, _CACHE.get(f'user-projects:{self.domain_id}:user-1'))
+
+        # A change of the child project group drops the cache of the members of its ancestors too.
+        self.auth_mgr.delete_project_group_member_cache(self.child_vo)
+        self.assertIsNone(_CACHE.get(f'user-projects:{self.domain_id}:user-1'))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from mongoengine import connect, disconnect
+
+from spaceone.core import config
+from spaceone.core.model.mongo_model import MongoModel
+from spaceone.core.transaction import Transaction
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.manager.domain_manager import DomainManager
+from spaceone.identity.model.domain_model import Domain
+
+
+class MemoryCache:
+
+    def __init__(self):
+        self.data = {}
+
+    def is_set(self, backend='default'):
+        return True
+
+    def get(self, key, backend='default'):
+        return self.data.get(key)
+
+    def set(self, key, value, expire=None, backend='default'):
+        self.data[key] = value
+
+    def delete(self, *keys, backend='default'):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+_CACHE = MemoryCache()
+
+
+# get_domain_descriptor is cached by the cacheable decorator of the cache module.
+@patch.multiple('spaceone.core.cache', is_set=_CACHE.is_set, get=_CACHE.get, set=_CACHE.set, delete=_CACHE.delete)
+@patch.object(MongoModel, 'connect', return_value=None)
+class TestDomainManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        connect('test', host='mongomock://localhost')
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def setUp(self, *args):
+        _CACHE.data.clear()
+        self.domain_vo = Domain.create({'name': 'domain-1'})
+        self.domain_id = self.domain_vo.domain_id
+        self.domain_mgr = DomainManager(Transaction())
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def tearDown(self, *args):
+        Domain.objects.filter().delete()
+
+    def test_get_domain_descriptor(self, *args):
+        with patch.object(self.domain_mgr, 'get_domain', wraps=self.domain_mgr.get_domain) as get_domain:
+            for _ in range(2):
+                descriptor = self.domain_mgr.get_domain_descriptor(self.domain_id)
+
+        get_domain.assert_called_once()
+        self.assertEqual(descriptor, {'domain_id': self.domain_id, 'state': 'ENABLED', 'auth_type': 'LOCAL',
+                                      'plugin_info': None})
+        self.assertEqual(_CACHE.get(f'domain-descriptor:{self.domain_id}'), descriptor)
+
+    def test_external_domain_descriptor(self, *args):
+        self.domain_vo.update({'plugin_info': {'plugin_id': 'plugin-1', 'version': '1.0',
+                                               'options': {'auth_type': 'keycloak'}}})
+
+        descriptor = self.domain_mgr.get_domain_descriptor(self.domain_id)
+
+        self.assertEqual(descriptor['auth_type'], 'EXTERNAL')
+        self.assertEqual(descriptor['plugin_info'], {'plugin_id': 'plugin-1', 'version': '1.0',
+                                                     'options': {'auth_type': 'keycloak'}, 'secret_id': None})
+
+    def test_state_change_invalidates_cache(self, *args):
+        self.domain_mgr.get_domain_descriptor(self.domain_id)
+
+        self.domain_mgr.disable_domain(self.domain_id)
+        self.assertEqual(self.domain_mgr.get_domain_descriptor(self.domain_id)['state'], 'DISABLED')
+
+        # The rollback drops the descriptor of the disabled domain as well.
+        self.domain_mgr.transaction.execute_rollback()
+        self.assertEqual(self.domain_mgr.get_domain_descriptor(self.domain_id)['state'], 'ENABLED')
+
+        domain_mgr = DomainManager(Transaction())
+        domain_mgr.disable_domain(self.domain_id)
+        domain_mgr.enable_domain(self.domain_id)
+        self.assertEqual(domain_mgr.get_domain_descriptor(self.domain_id)['state'], 'ENABLED')
+
+    def test_update_invalidates_cache(self, *args):
+        self.domain_mgr.get_domain_descriptor(self.domain_id)
+
+        with patch.object(self.domain_mgr, '_get_plugin_endpoint', return_value='grpc://auth-plugin:50051'), \
+                patch.object(self.domain_mgr, '_auth_init_and_verify', return_value={'metadata': {}}):
+            self.domain_mgr.update_domain({'domain_id': self.domain_id,
+                                           'plugin_info': {'plugin_id': 'plugin-1', 'version': '1.0',
+                                                           'options': {}}})
+
+        self.assertEqual(self.domain_mgr.get_domain_descriptor(self.domain_id)['auth_type'], 'EXTERNAL')
+
+        self.domain_mgr.delete_domain(self.domain_id)
+        self.assertNotIn(f'domain-descriptor:{self.domain_id}', _CACHE.data)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,136 @@
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import fakeredis
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.error.error_authentication import ERROR_TOO_MANY_LOGIN_FAILURES
+from spaceone.identity.manager.login_throttle_manager import LoginThrottleManager, _LocalCounters
+
+
+class TestLoginThrottleManager(unittest.TestCase):
+
+    throttle_conf = {
+        'window': 300,
+        'bucket': 60,
+        'max_user_failures': 3,
+        'max_global_user_failures': 6,
+        'max_source_failures': 5,
+        'trusted_proxies': ['10.0.0.0/8']
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        super().setUpClass()
+
+    def _create_redis_connection(self):
+        return None
+
+    def setUp(self):
+        with patch('spaceone.identity.manager.login_throttle_manager.get_redis_connection',
+                   return_value=self._create_redis_connection()), \
+                patch('spaceone.identity.manager.login_throttle_manager.config.get_global',
+                      return_value={'login_throttle': self.throttle_conf}):
+            self.throttle_mgr = LoginThrottleManager(transaction=Mock())
+
+        self.throttle_mgr.local_counters.clear()
+
+    def _add_failures(self, count, user_id, source):
+        for _ in range(count):
+            self.throttle_mgr.check_login('domain-1', user_id, source)
+            self.throttle_mgr.add_failure('domain-1', user_id, source)
+
+    def test_user_lockout_and_reset(self):
+        self._add_failures(3, 'user-1', '1.1.1.1')
+
+        with self.assertRaises(ERROR_TOO_MANY_LOGIN_FAILURES):
+            self.throttle_mgr.check_login('domain-1', 'user-1', '1.1.1.1')
+
+        # Failures of one source do not lock the user out of other sources.
+        self.throttle_mgr.check_login('domain-1', 'user-1', '2.2.2.2')
+        self.throttle_mgr.check_login('domain-1', 'user-2', '1.1.1.1')
+
+        self.throttle_mgr.reset_user_failures('domain-1', 'user-1', '1.1.1.1')
+        self.throttle_mgr.check_login('domain-1', 'user-1', '1.1.1.1')
+
+    def test_global_user_lockout(self):
+        self._add_failures(3, 'user-1', '1.1.1.1')
+        self._add_failures(3, 'user-1', '2.2.2.2')
+
+        with self.assertRaises(ERROR_TOO_MANY_LOGIN_FAILURES):
+            self.throttle_mgr.check_login('domain-1', 'user-1', '3.3.3.3')
+
+        self.throttle_mgr.limits['global_user'] = 0
+        self.throttle_mgr.check_login('domain-1', 'user-1', '3.3.3.3')
+
+    def test_source_lockout(self):
+        for index in range(5):
+            self.throttle_mgr.add_failure('domain-1', f'user-{index}', '1.1.1.1')
+
+        with self.assertRaises(ERROR_TOO_MANY_LOGIN_FAILURES):
+            self.throttle_mgr.check_login('domain-1', 'user-new', '1.1.1.1')
+
+        self.throttle_mgr.check_login('domain-1', 'user-new', '2.2.2.2')
+
+    def test_concurrent_failures(self):
+        threads = [threading.Thread(target=self.throttle_mgr.add_failure, args=('domain-1', 'user-1', None))
+                   for _ in range(20)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.throttle_mgr._get_failure_count('user', 'domain-1:user-1:'), 20)
+
+    def test_get_login_source(self):
+        self.assertEqual(self.throttle_mgr.get_login_source('ipv4:1.1.1.1:50051', '9.9.9.9'), '1.1.1.1')
+        self.assertEqual(self.throttle_mgr.get_login_source('ipv6:[::1]:50051'), '::1')
+        self.assertEqual(self.throttle_mgr.get_login_source('ipv4:10.0.0.1:50051', '9.9.9.9, 2.2.2.2, 10.0.0.2'),
+                         '2.2.2.2')
+
+
+class TestRedisLoginThrottleManager(TestLoginThrottleManager):
+
+    def _create_redis_connection(self):
+        return fakeredis.FakeStrictRedis()
+
+    def test_counter_expire(self):
+        self.throttle_mgr.add_failure('domain-1', 'user-1')
+
+        cache_key, = self.throttle_mgr.redis.keys('login-failure:user:domain-1:user-1:*')
+        self.assertEqual(self.throttle_mgr.redis.ttl(cache_key), 360)
+
+
+class TestLocalCounters(unittest.TestCase):
+    """ The local throttle is best-effort: counters expire and the least recently increased are dropped """
+
+    def setUp(self):
+        self.local_counters = _LocalCounters(max_size=2)
+
+    def test_expire(self):
+        self.local_counters.incr('counter-1', 360)
+        self.assertEqual(self.local_counters.get('counter-1'), 1)
+
+        with patch('spaceone.identity.manager.login_throttle_manager.time.time', return_value=time.time() + 361):
+            self.assertEqual(self.local_counters.get('counter-1'), 0)
+
+            self.local_counters.incr('counter-1', 360)
+            self.assertEqual(self.local_counters.get('counter-1'), 1)
+
+    def test_eviction(self):
+        for counter_id in ['counter-1', 'counter-2', 'counter-1', 'counter-3']:
+            self.local_counters.incr(counter_id, 360)
+
+        self.assertEqual(self.local_counters.get('counter-1'), 2)
+        self.assertEqual(self.local_counters.get('counter-2'), 0)
+        self.assertEqual(self.local_counters.get('counter-3'), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
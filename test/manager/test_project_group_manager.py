@@ -0,0 +1,144 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from mongoengine import connect, disconnect
+
+from spaceone.core import config, utils
+from spaceone.core.model.mongo_model import MongoModel
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.error.error_project import ERROR_PROJECT_GROUP_CYCLE, ERROR_PROJECT_GROUP_MAX_DEPTH
+from spaceone.identity.manager.project_group_manager import ProjectGroupManager
+from spaceone.identity.model.project_group_model import ProjectGroup, ProjectGroupPathVersion
+
+
+@patch('spaceone.identity.manager.project_group_manager._INITIALIZED_PATH_DOMAINS', set())
+@patch.object(MongoModel, 'connect', return_value=None)
+class TestProjectGroupManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        connect('test', host='mongomock://localhost')
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def setUp(self, *args):
+        self.domain_id = utils.generate_id('domain')
+        self.project_group_mgr = ProjectGroupManager(transaction=Mock())
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def tearDown(self, *args):
+        # Parent references deny the deletion of a parent through the model.
+        ProjectGroup._get_collection().delete_many({})
+        ProjectGroupPathVersion.objects.filter().delete()
+
+    def _create_legacy_project_group(self, name, parent_project_group_vo=None):
+        # Project groups created before project_group_path was maintained
+        return ProjectGroup.create({'name': name, 'parent_project_group': parent_project_group_vo,
+                                    'domain_id': self.domain_id})
+
+    def _get_path(self, project_group_vo):
+        project_group_vo.reload()
+        return list(project_group_vo.project_group_path)
+
+    def test_init_project_group_paths(self, *args):
+        root_vo = self._create_legacy_project_group('root')
+        child_vo = self._create_legacy_project_group('child', root_vo)
+
+        self.project_group_mgr.init_project_group_paths(self.domain_id)
+
+        self.assertEqual(self._get_path(child_vo), [root_vo.project_group_id, child_vo.project_group_id])
+        self.assertEqual(ProjectGroupPathVersion.objects.get(domain_id=self.domain_id).version, 1)
+
+    def test_migrate_domain_once(self, *args):
+        self.project_group_mgr.init_project_group_paths(self.domain_id)
+
+        # Another process which has not seen the domain yet reads the stored version.
+        with patch('spaceone.identity.manager.project_group_manager._INITIALIZED_PATH_DOMAINS', set()), \
+                patch.object(self.project_group_mgr, '_init_project_group_paths') as init_project_group_paths:
+            self.project_group_mgr.init_project_group_paths(self.domain_id)
+
+        init_project_group_paths.assert_not_called()
+        self.assertEqual(ProjectGroupPathVersion.objects.filter(domain_id=self.domain_id).count(), 1)
+
+    def test_list_child_project_groups(self, *args):
+        root_vo = self.project_group_mgr.create_project_group({'name': 'root', 'domain_id': self.domain_id})
+        child_vo = self.project_group_mgr.create_project_group({'name': 'child', 'parent_project_group': root_vo,
+                                                                'domain_id': self.domain_id})
+        grandchild_vo = self.project_group_mgr.create_project_group({'name': 'grandchild',
+                                                                     'parent_project_group': child_vo,
+                                                                     'domain_id': self.domain_id})
+        self.project_group_mgr.create_project_group({'name': 'other', 'domain_id': self.domain_id})
+
+        self.assertEqual(self._get_path(grandchild_vo), [root_vo.project_group_id, child_vo.project_group_id,
+                                                         grandchild_vo.project_group_id])
+
+        project_group_vos = self.project_group_mgr.list_child_project_groups(root_vo)
+        self.assertEqual(sorted(vo.project_group_id for vo in project_group_vos),
+                         sorted([child_vo.project_group_id, grandchild_vo.project_group_id]))
+
+        project_group_vos = self.project_group_mgr.list_child_project_groups(child_vo, include_self=True)
+        self.assertEqual(sorted(vo.project_group_id for vo in project_group_vos),
+                         sorted([child_vo.project_group_id, grandchild_vo.project_group_id]))
+
+    def test_move_child_project_group_paths(self, *args):
+        root_vo = self.project_group_mgr.create_project_group({'name': 'root', 'domain_id': self.domain_id})
+        child_vo = self.project_group_mgr.create_project_group({'name': 'child', 'parent_project_group': root_vo,
+                                                                'domain_id': self.domain_id})
+        other_vo = self.project_group_mgr.create_project_group({'name': 'other', 'domain_id': self.domain_id})
+
+        collection_class = type(ProjectGroup._get_collection())
+        with patch.object(collection_class, 'update_many') as update_many, \
+                patch.object(self.project_group_mgr, '_get_authorization_manager'):
+            self.project_group_mgr.update_project_group_by_vo({'parent_project_group': other_vo}, child_vo)
+
+        self.assertEqual(self._get_path(child_vo), [other_vo.project_group_id, child_vo.project_group_id])
+
+        # Descendants replace the old path prefix with the new one in a single update.
+        update_filter, pipeline = update_many.call_args[0]
+        self.assertEqual(update_filter['project_group_path'], child_vo.project_group_id)
+        path_update = pipeline[0]['$set']['project_group_path']['$concatArrays']
+        self.assertEqual(path_update[0], [other_vo.project_group_id, child_vo.project_group_id])
+        self.assertEqual(path_update[1]['$slice'][1], 2)
+
+    def test_check_parent_project_group(self, *args):
+        project_group_vos = [self.project_group_mgr.create_project_group({'name': 'pg-0',
+                                                                          'domain_id': self.domain_id})]
+        for index in range(1, 4):
+            project_group_vos.append(self.project_group_mgr.create_project_group({
+                'name': f'pg-{index}',
+                'parent_project_group': project_group_vos[-1],
+                'domain_id': self.domain_id
+            }))
+
+        root_id = project_group_vos[0].project_group_id
+        self.project_group_mgr.check_parent_project_group(root_id, None, self.domain_id)
+
+        # pg-0 -> pg-1 -> pg-2 -> pg-3 -> pg-0
+        with self.assertRaises(ERROR_PROJECT_GROUP_CYCLE):
+            self.project_group_mgr.check_parent_project_group(root_id, project_group_vos[3], self.domain_id)
+
+        with self.assertRaises(ERROR_PROJECT_GROUP_CYCLE):
+            self.project_group_mgr.check_parent_project_group(root_id, project_group_vos[0], self.domain_id)
+
+        other_vo = self.project_group_mgr.create_project_group({'name': 'other', 'domain_id': self.domain_id})
+        other_child_vo = self.project_group_mgr.create_project_group({'name': 'other-child',
+                                                                      'parent_project_group': other_vo,
+                                                                      'domain_id': self.domain_id})
+
+        with patch.object(self.project_group_mgr, '_get_project_tree_conf', return_value={'max_depth': 5}):
+            self.project_group_mgr.check_parent_project_group(None, project_group_vos[3], self.domain_id)
+
+            # The subtree of pg-0 has 4 levels, so it fits below a root project group but not one level deeper.
+            self.project_group_mgr.check_parent_project_group(root_id, other_vo, self.domain_id)
+            with self.assertRaises(ERROR_PROJECT_GROUP_MAX_DEPTH):
+                self.project_group_mgr.check_parent_project_group(root_id, other_child_vo, self.domain_id)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import patch
+
+from mongoengine import connect, disconnect
+
+from spaceone.core import config
+from spaceone.core.model.mongo_model import MongoModel
+from spaceone.core.transaction import Transaction
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.manager.provider_manager import ProviderManager
+from spaceone.identity.model.provider_model import Provider
+from test.factory.provider_factory import ProviderFactory
+
+
+class MemoryCache:
+
+    def __init__(self):
+        self.data = {}
+
+    def is_set(self, backend='default'):
+        return True
+
+    def get(self, key, backend='default'):
+        return self.data.get(key)
+
+    def set(self, key, value, expire=None, backend='default'):
+        self.data[key] = value
+
+    def delete(self, *keys, backend='default'):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+_CACHE = MemoryCache()
+
+
+# get_service_account_schema is cached by the cacheable decorator of the cache module.
+@patch.multiple('spaceone.core.cache', is_set=_CACHE.is_set, get=_CACHE.get, set=_CACHE.set, delete=_CACHE.delete)
+@patch.object(MongoModel, 'connect', return_value=None)
+class TestProviderManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        connect('test', host='mongomock://localhost')
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def setUp(self, *args):
+        _CACHE.data.clear()
+        self.provider_vo = ProviderFactory(provider='aws')
+        self.provider_mgr = ProviderManager(Transaction())
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def tearDown(self, *args):
+        Provider.objects.filter().delete()
+
+    def test_update_invalidates_schema_cache(self, *args):
+        schema_info = self.provider_mgr.get_service_account_schema('aws')
+        self.assertEqual(schema_info['schema']['required'], ['account_id'])
+
+        template = {'service_account': {'schema': {'type': 'object', 'required': []}}}
+        self.provider_mgr.update_provider({'provider': 'aws', 'template': template})
+
+        new_schema_info = self.provider_mgr.get_service_account_schema('aws')
+        self.assertEqual(new_schema_info['schema']['required'], [])
+        self.assertNotEqual(new_schema_info['version'], schema_info['version'])
+
+        # The rollback drops the schema of the reverted change as well.
+        self.provider_mgr.transaction.execute_rollback()
+        self.assertEqual(self.provider_mgr.get_service_account_schema('aws')['schema']['required'], ['account_id'])
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,136 @@
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import fakeredis
+from mongoengine import connect, disconnect
+
+from spaceone.core import config
+from spaceone.core.model.mongo_model import MongoModel
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.error.error_authentication import ERROR_INVALID_REFRESH_TOKEN
+from spaceone.identity.manager.refresh_token_manager import RefreshTokenManager
+from spaceone.identity.model.refresh_token_model import RefreshTokenFamily
+
+
+class TestRefreshTokenManager(unittest.TestCase):
+
+    token_conf = {
+        'refresh_store': 'mongo',
+        'refresh_reuse_grace': 1
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        connect('test', host='mongomock://localhost')
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def setUp(self, *args):
+        with patch('spaceone.identity.manager.refresh_token_manager.get_redis_connection',
+                   return_value=fakeredis.FakeStrictRedis()), \
+                patch('spaceone.identity.manager.refresh_token_manager.config.get_global',
+                      return_value={'token': self.token_conf}):
+            self.refresh_token_mgr = RefreshTokenManager(transaction=Mock())
+
+        self.family_id = self.refresh_token_mgr.create_family('key-0', 'user-1', 'domain-1', 3600)
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def tearDown(self, *args):
+        RefreshTokenFamily.objects.filter().delete()
+
+    def test_rotate_family(self):
+        self.refresh_token_mgr.check_family(self.family_id, 'key-0')
+        self.refresh_token_mgr.rotate_family(self.family_id, 'key-0', 'key-1', 3600)
+
+        self.refresh_token_mgr.check_family(self.family_id, 'key-1')
+        self.refresh_token_mgr.rotate_family(self.family_id, 'key-1', 'key-2', 3600)
+
+        self.refresh_token_mgr.check_family(self.family_id, 'key-2')
+
+    def test_concurrent_refresh_in_grace(self):
+        self.refresh_token_mgr.check_family(self.family_id, 'key-0')
+        self.refresh_token_mgr.check_family(self.family_id, 'key-0')
+
+        winner_key = self.refresh_token_mgr.rotate_family(self.family_id, 'key-0', 'key-1', 3600)
+        loser_key = self.refresh_token_mgr.rotate_family(self.family_id, 'key-0', 'key-2', 3600)
+
+        self.assertEqual(winner_key, 'key-1')
+        self.assertEqual(loser_key, 'key-1')
+
+        # The key of the winner stays current after the grace window.
+        time.sleep(1.1)
+        self.refresh_token_mgr.check_family(self.family_id, 'key-1')
+        self.refresh_token_mgr.rotate_family(self.family_id, 'key-1', 'key-3', 3600)
+        self.refresh_token_mgr.check_family(self.family_id, 'key-3')
+
+    def test_rotate_rollback(self):
+        self.refresh_token_mgr.rotate_family(self.family_id, 'key-0', 'key-1', 3600)
+
+        rollback, family_id = self.refresh_token_mgr.transaction.add_rollback.call_args[0]
+        rollback(family_id)
+
+        self.refresh_token_mgr.check_family(self.family_id, 'key-0')
+
+    def test_reuse_revokes_family(self):
+        self.refresh_token_mgr.rotate_family(self.family_id, 'key-0', 'key-1', 3600)
+        self.refresh_token_mgr.rotate_family(self.family_id, 'key-1', 'key-2', 3600)
+
+        with self.assertRaises(ERROR_INVALID_REFRESH_TOKEN):
+            self.refresh_token_mgr.check_family(self.family_id, 'key-0')
+
+        with self.assertRaises(ERROR_INVALID_REFRESH_TOKEN):
+            self.refresh_token_mgr.check_family(self.family_id, 'key-2')
+
+    def test_reuse_after_grace_revokes_family(self):
+        self.refresh_token_mgr.rotate_family(self.family_id, 'key-0', 'key-1', 3600)
+        time.sleep(1.1)
+
+        with self.assertRaises(ERROR_INVALID_REFRESH_TOKEN):
+            self.refresh_token_mgr.check_family(self.family_id, 'key-0')
+
+        with self.assertRaises(ERROR_INVALID_REFRESH_TOKEN):
+            self.refresh_token_mgr.check_family(self.family_id, 'key-1')
+
+
+class TestCacheRefreshTokenManager(TestRefreshTokenManager):
+
+    token_conf = {
+        'refresh_store': 'cache',
+        'refresh_reuse_grace': 1
+    }
+
+    def test_cache_backend(self):
+        self.assertEqual(self.refresh_token_mgr.backend, 'cache')
+        self.assertEqual(RefreshTokenFamily.objects.filter().count(), 0)
+
+    def test_rotate_conflict(self):
+        cache_key = self.refresh_token_mgr._get_cache_key(self.family_id)
+        redis_conn = self.refresh_token_mgr.redis
+        pipeline = redis_conn.pipeline
+
+        def _rotate_during_watch(*args, **kwargs):
+            pipe = pipeline(*args, **kwargs)
+            watch = pipe.watch
+
+            def _watch(*keys):
+                watch(*keys)
+                redis_conn.set(cache_key, redis_conn.get(cache_key))
+
+            pipe.watch = _watch
+            return pipe
+
+        with patch.object(redis_conn, 'pipeline', side_effect=_rotate_during_watch):
+            self.assertFalse(self.refresh_token_mgr._compare_and_set(self.family_id, 'key-0', 'key-1', 3600))
+
+        self.refresh_token_mgr.check_family(self.family_id, 'key-0')
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
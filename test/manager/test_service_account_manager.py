@@ -0,0 +1,158 @@
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from mongoengine import connect, disconnect
+from pymongo.errors import BulkWriteError
+from spaceone.core import config, utils
+from spaceone.core.error import ERROR_DB_QUERY, ERROR_INVALID_PARAMETER, ERROR_NOT_UNIQUE
+from spaceone.core.locator import Locator
+from spaceone.core.model.mongo_model import MongoModel
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.error.custom import ERROR_SECRET_FAN_OUT_FAILURE
+from spaceone.identity.manager.service_account_manager import ServiceAccountManager
+from spaceone.identity.model.service_account_model import ServiceAccount
+
+_SECRET_CONNECTOR = Mock()
+
+
+@patch.object(Locator, 'get_connector', return_value=_SECRET_CONNECTOR)
+@patch.object(MongoModel, 'connect', return_value=None)
+class TestServiceAccountManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        connect('test', host='mongomock://localhost')
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def setUp(self, *args):
+        _SECRET_CONNECTOR.reset_mock(return_value=True, side_effect=True)
+        self.domain_id = utils.generate_id('domain')
+
+        # The connection meta is only visible in the thread of the request, like a thread-local transaction.
+        request_thread = threading.current_thread()
+        transaction = Mock()
+        transaction.get_connection_meta.side_effect = \
+            lambda: [('token', 'user-token')] if threading.current_thread() is request_thread else []
+
+        self.service_account_mgr = ServiceAccountManager(transaction=transaction)
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def tearDown(self, *args):
+        ServiceAccount.objects.filter().delete()
+
+    def _get_rollback(self):
+        self.service_account_mgr.transaction.add_rollback.assert_called_once()
+        return self.service_account_mgr.transaction.add_rollback.call_args[0]
+
+    def _import(self, service_accounts):
+        return self.service_account_mgr.create_service_accounts(service_accounts, self.domain_id)
+
+    def test_fan_out_with_request_meta(self, *args):
+        _SECRET_CONNECTOR.list_secrets_by_page.return_value = iter([{'secret_id': f'secret-{index}'}
+                                                                    for index in range(20)])
+
+        self.service_account_mgr.delete_service_account_secrets('sa-1', 'domain-1')
+
+        self.assertEqual(_SECRET_CONNECTOR.delete_secret.call_count, 20)
+        for call in _SECRET_CONNECTOR.delete_secret.call_args_list:
+            self.assertEqual(call[1]['metadata'], [('token', 'user-token')])
+
+    def test_rollback_when_page_fetch_fails(self, *args):
+        def _list_secrets_by_page(query, domain_id):
+            yield {'secret_id': 'secret-1', 'project_id': 'project-1'}
+            yield {'secret_id': 'secret-2'}
+            raise ConnectionError('failed to read page')
+
+        _SECRET_CONNECTOR.list_secrets_by_page.side_effect = _list_secrets_by_page
+
+        with self.assertRaises(ConnectionError):
+            self.service_account_mgr.update_secret_project('sa-1', 'project-2', 'domain-1')
+
+        self.assertEqual(_SECRET_CONNECTOR.update_secret_project.call_count, 2)
+
+        rollback, old_secrets = self._get_rollback()
+        self.assertEqual(sorted(secret_info['secret_id'] for secret_info in old_secrets), ['secret-1', 'secret-2'])
+
+        _SECRET_CONNECTOR.reset_mock()
+        rollback(old_secrets)
+
+        _SECRET_CONNECTOR.update_secret_project.assert_called_once_with(
+            'secret-1', 'project-1', 'domain-1', timeout=10, metadata=[('token', 'user-token')])
+        _SECRET_CONNECTOR.release_secret_project.assert_called_once_with(
+            'secret-2', 'domain-1', timeout=10, metadata=[('token', 'user-token')])
+
+    def test_rollback_only_succeeded_secrets(self, *args):
+        def _release_secret_project(secret_id, domain_id, timeout=None, metadata=None):
+            if secret_id == 'secret-2':
+                raise ValueError('failed to release')
+
+        _SECRET_CONNECTOR.list_secrets_by_page.return_value = iter([
+            {'secret_id': 'secret-1', 'project_id': 'project-1'},
+            {'secret_id': 'secret-2', 'project_id': 'project-1'}
+        ])
+        _SECRET_CONNECTOR.release_secret_project.side_effect = _release_secret_project
+
+        with self.assertRaises(ERROR_SECRET_FAN_OUT_FAILURE):
+            self.service_account_mgr.release_secret_project('sa-1', 'domain-1')
+
+        _, old_secrets = self._get_rollback()
+        self.assertEqual([secret_info['secret_id'] for secret_info in old_secrets], ['secret-1'])
+
+    def test_import(self, *args):
+        results = self._import([{'name': f'account-{index}', 'data': {}, 'provider': 'aws'} for index in range(3)])
+
+        service_account_vos = ServiceAccount.objects.filter(domain_id=self.domain_id)
+        self.assertEqual(sorted(service_account_vo.service_account_id for service_account_vo in service_account_vos),
+                         sorted(results))
+
+    def test_import_partial_failure(self, *args):
+        ServiceAccount.create({'name': 'account-0', 'data': {}, 'provider': 'aws', 'domain_id': self.domain_id})
+        service_accounts = [{'name': f'account-{index}', 'data': {}, 'provider': 'aws'} for index in range(4)]
+
+        write_error = BulkWriteError({
+            'writeErrors': [
+                {'index': 1, 'code': 11000, 'errmsg': 'E11000 duplicate key error'},
+                {'index': 2, 'code': 121, 'errmsg': 'Document failed validation'}
+            ]
+        })
+        collection_class = type(ServiceAccount._get_collection())
+        with patch.object(collection_class, 'insert_many', side_effect=write_error) as insert_many:
+            results = self._import(service_accounts)
+
+        insert_many.assert_called_once()
+        self.assertEqual(len(insert_many.call_args[0][0]), 3)
+        self.assertIsInstance(results[0], ERROR_NOT_UNIQUE)
+        self.assertIsInstance(results[1], str)
+        self.assertIsInstance(results[2], ERROR_NOT_UNIQUE)
+        self.assertIsInstance(results[3], ERROR_DB_QUERY)
+        self.service_account_mgr.transaction.add_rollback.assert_not_called()
+
+    def test_import_validation_failure(self, *args):
+        results = self._import([{'name': 'a' * 256, 'data': {}, 'provider': 'aws'},
+                                {'name': 'account-1', 'data': {}, 'provider': 'aws'}])
+
+        self.assertIsInstance(results[0], ERROR_INVALID_PARAMETER)
+        self.assertIn('name', results[0].message)
+        self.assertIsInstance(results[1], str)
+        self.assertEqual([service_account_vo.name for service_account_vo
+                          in ServiceAccount.objects.filter(domain_id=self.domain_id)], ['account-1'])
+
+    def test_import_chunk_failure(self, *args):
+        collection_class = type(ServiceAccount._get_collection())
+        with patch.object(collection_class, 'insert_many', side_effect=ConnectionError('timed out')):
+            with self.assertRaises(ERROR_DB_QUERY):
+                self._import([{'name': 'account-0', 'data': {}, 'provider': 'aws'}])
+
+        self.assertEqual(ServiceAccount.objects.filter(domain_id=self.domain_id).count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
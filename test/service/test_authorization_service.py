@@ -0,0 +1,167 @@
+import unittest
+from unittest.mock import patch
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.error import ERROR_PERMISSION_DENIED
+from spaceone.core.model.mongo_model import MongoModel
+from spaceone.core.transaction import Transaction
+from spaceone.identity.service.authorization_service import AuthorizationService
+from spaceone.identity.manager.policy_manager import PolicyManager
+from spaceone.identity.manager.role_manager import RoleManager
+from spaceone.identity.manager.user_manager import UserManager
+from spaceone.identity.model.policy_model import Policy
+from spaceone.identity.model.role_model import Role
+from spaceone.identity.model.user_model import User
+
+
+class MemoryCache:
+
+    def __init__(self):
+        self.data = {}
+
+    def is_set(self):
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, expire=None):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+_CACHE = MemoryCache()
+
+
+@patch('spaceone.identity.manager.authorization_manager.cache', _CACHE)
+@patch('spaceone.identity.service.authorization_service.cache', _CACHE)
+@patch.object(MongoModel, 'connect', return_value=None)
+class TestAuthorizationService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        connect('test', host='mongomock://localhost')
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def setUp(self, *args) -> None:
+        _CACHE.data.clear()
+        self.domain_id = utils.generate_id('domain')
+        self.policy_vo = Policy.create({'name': utils.random_string(), 'permissions': ['identity.User.*'],
+                                        'domain_id': self.domain_id})
+        self.role_vo = Role.create({'name': utils.random_string(), 'role_type': 'DOMAIN', 'domain_id': self.domain_id,
+                                    'policies': [{'policy_type': 'CUSTOM', 'policy': self.policy_vo}]})
+        self.user_vo = User.create({'user_id': 'user-1', 'name': 'user-1', 'state': 'ENABLED',
+                                    'roles': [self.role_vo], 'domain_id': self.domain_id})
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def tearDown(self, *args) -> None:
+        User.objects.filter().delete()
+        Role.objects.filter().delete()
+        Policy.objects.filter().delete()
+
+    def _create_service(self):
+        auth_svc = AuthorizationService({})
+        auth_svc.transaction.set_meta('user_id', self.user_vo.user_id)
+        auth_svc.transaction.set_meta('domain_id', self.domain_id)
+        return auth_svc
+
+    def _verify(self, method):
+        return self._create_service().verify({
+            'service': 'identity',
+            'api_class': method.split('.')[0],
+            'method': method.split('.')[1],
+            'parameter': {}
+        })
+
+    def test_cache_effective_permission(self, *args):
+        with patch.object(UserManager, 'get_user', autospec=True, side_effect=UserManager.get_user) as get_user:
+            for _ in range(2):
+                auth_data = self._verify('User.get')
+                self.assertEqual(auth_data['role_type'], 'DOMAIN')
+                self.assertEqual(auth_data['changed_parameter'], {'domain_id': self.domain_id})
+
+        get_user.assert_called_once()
+
+    def test_policy_change_starts_generation(self, *args):
+        self._verify('User.get')
+        generation = _CACHE.get(f'permission-generation:{self.domain_id}')
+        self.assertIn(f'effective-permission:{self.domain_id}:{generation}:user-1', _CACHE.data)
+
+        policy_mgr = PolicyManager()
+        policy_mgr.update_policy({'policy_id': self.policy_vo.policy_id, 'permissions': ['identity.Project.*'],
+                                  'domain_id': self.domain_id})
+
+        self.assertNotEqual(_CACHE.get(f'permission-generation:{self.domain_id}'), generation)
+        self._verify('Project.list')
+        with self.assertRaises(ERROR_PERMISSION_DENIED):
+            self._verify('User.get')
+
+        # The rollback of the change starts another generation.
+        new_generation = _CACHE.get(f'permission-generation:{self.domain_id}')
+        policy_mgr.transaction.execute_rollback()
+        self.assertNotIn(_CACHE.get(f'permission-generation:{self.domain_id}'), [generation, new_generation])
+
+    def test_user_change_invalidates_cache(self, *args):
+        self._verify('User.get')
+
+        user_mgr = UserManager(Transaction())
+        user_mgr.disable_user(self.user_vo.user_id, self.domain_id)
+
+        with self.assertRaises(ERROR_PERMISSION_DENIED):
+            self._verify('User.get')
+
+        user_mgr.transaction.execute_rollback()
+        self._verify('User.get')
+
+        project_role_vo = Role.create({'name': utils.random_string(), 'role_type': 'PROJECT',
+                                       'domain_id': self.domain_id, 'policies': []})
+        user_mgr.update_role({'user_id': self.user_vo.user_id, 'domain_id': self.domain_id}, [project_role_vo])
+
+        with self.assertRaises(ERROR_PERMISSION_DENIED):
+            self._verify('User.get')
+
+    def test_role_change_invalidates_cache(self, *args):
+        self._verify('User.get')
+
+        role_mgr = RoleManager()
+        role_mgr.update_role({'role_id': self.role_vo.role_id, 'policies': [], 'domain_id': self.domain_id})
+
+        self.assertNotIn(f'role-permission:{self.domain_id}:{self.role_vo.role_id}', _CACHE.data)
+        with self.assertRaises(ERROR_PERMISSION_DENIED):
+            self._verify('User.get')
+
+    def test_verify_batch(self, *args):
+        with patch.object(UserManager, 'get_user', autospec=True, side_effect=UserManager.get_user) as get_user:
+            results = self._create_service().verify_batch({
+                'requests': [
+                    {'service': 'identity', 'api_class': 'User', 'method': 'get', 'parameter': {}},
+                    {'service': 'identity', 'api_class': 'Project', 'method': 'list', 'parameter': {}},
+                    {'service': 'identity', 'api_class': 'User', 'method': 'list',
+                     'parameter': {'domain_id': 'domain-other'}},
+                    {'service': 'identity', 'api_class': 'User', 'method': 'list'}
+                ]
+            })
+
+        get_user.assert_called_once()
+        self.assertEqual([result['is_allowed'] for result in results], [True, False, False, False])
+        self.assertEqual(results[0]['changed_parameter'], {'domain_id': self.domain_id})
+        self.assertEqual(results[1]['error_code'], 'ERROR_PERMISSION_DENIED')
+        self.assertEqual(results[2]['error_code'], 'ERROR_PERMISSION_DENIED')
+        self.assertEqual(results[3]['error_code'], 'ERROR_REQUIRED_PARAMETER')
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
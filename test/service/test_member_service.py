@@ -0,0 +1,219 @@
+import unittest
+from unittest.mock import patch
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.model.mongo_model import MongoModel
+from spaceone.identity.service.project_service import ProjectService
+from spaceone.identity.service.project_group_service import ProjectGroupService
+from spaceone.identity.manager.authorization_manager import AuthorizationManager
+from spaceone.identity.manager.role_manager import RoleManager
+from spaceone.identity.manager.user_manager import UserManager
+from spaceone.identity.model.user_model import User
+from spaceone.identity.model.role_model import Role
+from spaceone.identity.model.project_model import ProjectMemberMap
+from spaceone.identity.model.project_group_model import ProjectGroupMemberMap
+from test.factory.project_factory import ProjectFactory
+from test.factory.project_group_factory import ProjectGroupFactory
+
+
+@patch.object(AuthorizationManager, 'add_user_project_cache', return_value=None)
+@patch.object(AuthorizationManager, 'delete_user_project_cache', return_value=None)
+@patch.object(MongoModel, 'connect', return_value=None)
+class TestMemberService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        connect('test', host='mongomock://localhost')
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def setUp(self, *args) -> None:
+        self.domain_id = utils.generate_id('domain')
+        self.project_group_vo = ProjectGroupFactory(domain_id=self.domain_id)
+        self.project_vo = ProjectFactory(project_group=self.project_group_vo, domain_id=self.domain_id)
+
+        self.role_vo = Role.create({'name': utils.random_string(), 'role_type': 'PROJECT',
+                                    'domain_id': self.domain_id})
+        self.domain_role_vo = Role.create({'name': utils.random_string(), 'role_type': 'DOMAIN',
+                                           'domain_id': self.domain_id})
+        self.user_vos = [User.create({'user_id': f'user-{index}', 'name': f'user-{index}', 'state': 'ENABLED',
+                                      'domain_id': self.domain_id}) for index in range(3)]
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def tearDown(self, *args) -> None:
+        ProjectMemberMap.objects.filter().delete()
+        ProjectGroupMemberMap.objects.filter().delete()
+        User.objects.filter().delete()
+        Role.objects.filter().delete()
+        self.project_vo.delete()
+        self.project_group_vo.delete()
+
+    def _list_member_user_ids(self, member_map_model, **target):
+        return sorted(member_vo.user.user_id for member_vo in member_map_model.objects.filter(**target))
+
+    def test_add_members(self, *args):
+        params = {
+            'project_id': self.project_vo.project_id,
+            'members': [
+                {'user_id': 'user-0', 'roles': [self.role_vo.role_id], 'labels': ['a', 'a']},
+                {'user_id': 'user-1'},
+                {'user_id': 'user-0'},
+                {'user_id': 'user-unknown'},
+                {'user_id': 'user-2', 'roles': ['role-unknown']},
+                {'user_id': 'user-2', 'roles': [self.domain_role_vo.role_id]}
+            ],
+            'domain_id': self.domain_id
+        }
+
+        project_svc = ProjectService({})
+        with patch.object(UserManager, 'list_users_by_ids', wraps=project_svc.locator.get_manager('UserManager')
+                          .list_users_by_ids) as list_users_by_ids, \
+                patch.object(RoleManager, 'list_roles', wraps=project_svc.locator.get_manager('RoleManager')
+                             .list_roles) as list_roles:
+            results = project_svc.add_members(params)
+
+        list_users_by_ids.assert_called_once_with(
+            ['user-0', 'user-1', 'user-0', 'user-unknown', 'user-2', 'user-2'], self.domain_id)
+        list_roles.assert_called_once()
+        role_filter = list_roles.call_args[0][0]['filter'][0]
+        self.assertEqual(role_filter['o'], 'in')
+        self.assertEqual(set(role_filter['v']), {self.role_vo.role_id, 'role-unknown', self.domain_role_vo.role_id})
+
+        self.assertEqual([result['success'] for result in results], [True, True, False, False, False, False])
+        self.assertEqual(results[2]['error_code'], 'ERROR_ALREADY_EXIST_USER_IN_PROJECT')
+        self.assertEqual(results[3]['error_code'], 'ERROR_NOT_FOUND')
+        self.assertEqual(results[4]['error_code'], 'ERROR_NOT_FOUND')
+        self.assertEqual(results[5]['error_code'], 'ERROR_ONLY_PROJECT_ROLE_TYPE_ALLOWED')
+
+        self.assertEqual(self._list_member_user_ids(ProjectMemberMap, project=self.project_vo), ['user-0', 'user-1'])
+        member_vo = ProjectMemberMap.objects.get(project=self.project_vo, user=self.user_vos[0])
+        self.assertEqual([role_vo.role_id for role_vo in member_vo.roles], [self.role_vo.role_id])
+        self.assertEqual(member_vo.labels, ['a'])
+
+    def test_add_existing_members(self, *args):
+        ProjectGroupMemberMap.create({'project_group': self.project_group_vo, 'user': self.user_vos[0],
+                                      'roles': [], 'labels': []})
+
+        project_group_svc = ProjectGroupService({})
+        results = project_group_svc.add_members({
+            'project_group_id': self.project_group_vo.project_group_id,
+            'members': [{'user_id': 'user-0'}, {'user_id': 'user-1'}],
+            'domain_id': self.domain_id
+        })
+
+        self.assertFalse(results[0]['success'])
+        self.assertEqual(results[0]['error_code'], 'ERROR_ALREADY_EXIST_USER_IN_PROJECT_GROUP')
+        self.assertTrue(results[1]['success'])
+        self.assertEqual(self._list_member_user_ids(ProjectGroupMemberMap, project_group=self.project_group_vo),
+                         ['user-0', 'user-1'])
+
+        project_group_svc.transaction.execute_rollback()
+
+        self.assertEqual(self._list_member_user_ids(ProjectGroupMemberMap, project_group=self.project_group_vo),
+                         ['user-0'])
+
+    def test_remove_members(self, *args):
+        for user_vo in self.user_vos[:2]:
+            ProjectMemberMap.create({'project': self.project_vo, 'user': user_vo, 'roles': [self.role_vo],
+                                     'labels': ['a']})
+
+        project_svc = ProjectService({})
+        results = project_svc.remove_members({
+            'project_id': self.project_vo.project_id,
+            'users': ['user-0', 'user-0', 'user-1', 'user-2', 'user-unknown'],
+            'domain_id': self.domain_id
+        })
+
+        self.assertEqual([result['user_id'] for result in results], ['user-0', 'user-1', 'user-2', 'user-unknown'])
+        self.assertEqual([result['success'] for result in results], [True, True, False, False])
+        self.assertEqual(results[2]['error_code'], 'ERROR_NOT_FOUND_USER_IN_PROJECT')
+        self.assertEqual(results[3]['error_code'], 'ERROR_NOT_FOUND')
+        self.assertEqual(self._list_member_user_ids(ProjectMemberMap, project=self.project_vo), [])
+
+        # Removed members are inserted again with their roles and labels.
+        project_svc.transaction.execute_rollback()
+
+        self.assertEqual(self._list_member_user_ids(ProjectMemberMap, project=self.project_vo), ['user-0', 'user-1'])
+        member_vo = ProjectMemberMap.objects.get(project=self.project_vo, user=self.user_vos[1])
+        self.assertEqual([role_vo.role_id for role_vo in member_vo.roles], [self.role_vo.role_id])
+        self.assertEqual(member_vo.labels, ['a'])
+
+    def test_remove_project_group_members(self, *args):
+        ProjectGroupMemberMap.create({'project_group': self.project_group_vo, 'user': self.user_vos[0],
+                                      'roles': [], 'labels': []})
+
+        project_group_svc = ProjectGroupService({})
+        results = project_group_svc.remove_members({
+            'project_group_id': self.project_group_vo.project_group_id,
+            'users': ['user-0', 'user-1'],
+            'domain_id': self.domain_id
+        })
+
+        self.assertTrue(results[0]['success'])
+        self.assertFalse(results[1]['success'])
+        self.assertEqual(results[1]['error_code'], 'ERROR_NOT_FOUND_USER_IN_PROJECT_GROUP')
+
+        project_group_svc.transaction.execute_rollback()
+
+        self.assertEqual(self._list_member_user_ids(ProjectGroupMemberMap, project_group=self.project_group_vo),
+                         ['user-0'])
+
+    def test_modify_member(self, *args):
+        ProjectMemberMap.create({'project': self.project_vo, 'user': self.user_vos[0], 'roles': [],
+                                 'labels': ['a']})
+
+        project_svc = ProjectService({})
+        member_vo = project_svc.modify_member({
+            'project_id': self.project_vo.project_id,
+            'user_id': 'user-0',
+            'roles': [self.role_vo.role_id],
+            'labels': ['b', 'b'],
+            'domain_id': self.domain_id
+        })
+
+        member_vo = ProjectMemberMap.objects.get(pk=member_vo.pk)
+        self.assertEqual([role_vo.role_id for role_vo in member_vo.roles], [self.role_vo.role_id])
+        self.assertEqual(member_vo.labels, ['b'])
+        self.assertEqual(ProjectMemberMap.objects.filter(project=self.project_vo).count(), 1)
+
+        project_svc.transaction.execute_rollback()
+
+        member_vo = ProjectMemberMap.objects.get(pk=member_vo.pk)
+        self.assertEqual(member_vo.roles, [])
+        self.assertEqual(member_vo.labels, ['a'])
+
+    def test_modify_project_group_member(self, *args):
+        ProjectGroupMemberMap.create({'project_group': self.project_group_vo, 'user': self.user_vos[0],
+                                      'roles': [self.role_vo], 'labels': ['a']})
+
+        project_group_svc = ProjectGroupService({})
+        member_vo = project_group_svc.modify_member({
+            'project_group_id': self.project_group_vo.project_group_id,
+            'user_id': 'user-0',
+            'roles': [],
+            'labels': [],
+            'domain_id': self.domain_id
+        })
+
+        member_vo = ProjectGroupMemberMap.objects.get(pk=member_vo.pk)
+        self.assertEqual(member_vo.roles, [])
+        self.assertEqual(member_vo.labels, [])
+
+        project_group_svc.transaction.execute_rollback()
+
+        member_vo = ProjectGroupMemberMap.objects.get(pk=member_vo.pk)
+        self.assertEqual([role_vo.role_id for role_vo in member_vo.roles], [self.role_vo.role_id])
+        self.assertEqual(member_vo.labels, ['a'])
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import patch
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.model.mongo_model import MongoModel
+from spaceone.identity.service.project_group_service import ProjectGroupService
+from spaceone.identity.model.project_group_model import ProjectGroup, ProjectGroupPathVersion
+from spaceone.identity.model.project_model import Project
+from test.factory.project_factory import ProjectFactory
+from test.factory.project_group_factory import ProjectGroupFactory
+
+
+@patch.object(MongoModel, 'connect', return_value=None)
+class TestProjectGroupService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        connect('test', host='mongomock://localhost')
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def setUp(self, *args) -> None:
+        self.domain_id = utils.generate_id('domain')
+        self.root_vo = self._create_project_group('root')
+        self.child_vo = self._create_project_group('child', self.root_vo)
+        self.grandchild_vo = self._create_project_group('grandchild', self.child_vo)
+        self.other_vo = self._create_project_group('other')
+
+        self.project_vos = [ProjectFactory(project_group=project_group_vo, domain_id=self.domain_id)
+                            for project_group_vo in [self.root_vo, self.child_vo, self.grandchild_vo, self.other_vo]]
+
+    @patch.object(MongoModel, 'connect', return_value=None)
+    def tearDown(self, *args) -> None:
+        Project.objects.filter().delete()
+        # Parent references deny the deletion of a parent through the model.
+        ProjectGroup._get_collection().delete_many({})
+        ProjectGroupPathVersion.objects.filter().delete()
+
+    def _create_project_group(self, name, parent_project_group_vo=None):
+        project_group_id = utils.generate_id('pg')
+        parent_path = list(parent_project_group_vo.project_group_path) if parent_project_group_vo else []
+        return ProjectGroupFactory(project_group_id=project_group_id, name=name,
+                                   parent_project_group=parent_project_group_vo,
+                                   project_group_path=parent_path + [project_group_id], domain_id=self.domain_id)
+
+    def _list_project_ids(self, project_group_vo, recursive):
+        project_vos, total_count = ProjectGroupService({}).list_projects({
+            'project_group_id': project_group_vo.project_group_id,
+            'recursive': recursive,
+            'domain_id': self.domain_id
+        })
+
+        return sorted(project_vo.project_id for project_vo in project_vos)
+
+    def test_list_projects_recursive(self, *args):
+        self.assertEqual(self._list_project_ids(self.child_vo, True),
+                         sorted(project_vo.project_id for project_vo in self.project_vos[1:3]))
+        self.assertEqual(self._list_project_ids(self.root_vo, True),
+                         sorted(project_vo.project_id for project_vo in self.project_vos[:3]))
+        self.assertEqual(self._list_project_ids(self.child_vo, False), [self.project_vos[1].project_id])
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from spaceone.core import config
+from spaceone.core.locator import Locator
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.identity.service.token_service import TokenService
+
+
+class TestTokenService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.identity')
+        super().setUpClass()
+
+    @patch.object(Locator, 'get_manager')
+    def test_create_token_manager_once(self, mock_get_manager):
+        managers = {}
+
+        def _get_manager(name):
+            return managers.setdefault(name, Mock(name=name))
+
+        mock_get_manager.side_effect = _get_manager
+        _get_manager('DomainManager').get_domain_descriptor.side_effect = \
+            [{'auth_type': 'EXTERNAL'}, {'auth_type': 'EXTERNAL'}, {'auth_type': 'LOCAL'}]
+        token_svc = TokenService({})
+
+        for user_type in ['USER', 'USER', 'DOMAIN_OWNER', 'DOMAIN_OWNER']:
+            token_svc._create_token_manager('domain-1', user_type)
+
+        token_mgr = token_svc._create_token_manager('domain-1', 'USER')
+
+        self.assertIs(token_mgr, managers['DefaultTokenManager'])
+        self.assertEqual(sorted(call[0][0] for call in mock_get_manager.call_args_list),
+                         ['DefaultTokenManager', 'DomainManager', 'DomainOwnerTokenManager', 'PluginTokenManager'])
+        self.assertEqual(managers['DomainManager'].get_domain_descriptor.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)